@@ -0,0 +1,143 @@
+from __future__ import annotations
+from enum import Enum
+from typing import Any, Tuple
+import numbers
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class Backends(Enum):
+    LIST = "list"
+    NUMPY = "numpy"
+
+
+_default_backend = Backends.LIST
+
+
+def is_available(backend: Backends) -> bool:
+    if backend == Backends.NUMPY:
+        return numpy is not None
+    return True
+
+
+def get_default() -> Backends:
+    return _default_backend
+
+
+def set_default(backend: Backends) -> None:
+    """
+    will set the storage backend used by every Matrix and Vector that is created without an explicit one
+    """
+    global _default_backend
+    if not isinstance(backend, Backends):
+        raise TypeError("'backend' must be from enum 'Backends'")
+    _default_backend = backend
+
+
+def resolve(backend: Backends = None) -> Backends:
+    """
+    will return the backend to actually use, falling back to Backends.LIST when NumPy is not installed
+    """
+    if backend is None:
+        backend = _default_backend
+    if not isinstance(backend, Backends):
+        raise TypeError("'backend' must be from enum 'Backends'")
+    if not is_available(backend):
+        return Backends.LIST
+    return backend
+
+
+# memoryview formats of untyped bytes, read as float64 by from_buffer
+_raw_formats = ["B", "b", "c"]
+# integers above this are not all representable as floats
+_max_exact_float_int = 2**53
+
+
+def to_storage(values: Any, backend: Backends = None, exact: bool = False) -> Tuple[Any, Backends]:
+    """
+    will convert 'values' (a list, a list of lists or an ndarray) to the storage of 'backend'
+    entries which can't be held as floats (e.g. 'Complex') keep the list backend,
+    and so do exact values ('exact' is set, or an entry is a 'Fraction' or an 'int' larger than 2**53)
+    returns the storage and the backend that was actually used
+    """
+    backend = resolve(backend)
+    if backend == Backends.NUMPY and isinstance(values, list) and (exact or _has_exact_entries(values)):
+        backend = Backends.LIST
+    if backend == Backends.NUMPY:
+        try:
+            return numpy.asarray(values, dtype=float), Backends.NUMPY
+        except (TypeError, ValueError):
+            backend = Backends.LIST
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return values.tolist(), Backends.LIST
+    if not isinstance(values, list):
+        # e.g. a row view of a matrix, the values are copied
+        values = list(values)
+    return values, Backends.LIST
+
+
+def _has_exact_entries(values: list) -> bool:
+    """
+    whether converting 'values' (a list or a list of rows) to float64 would lose precision
+    """
+    for v in values:
+        if isinstance(v, (list, tuple)):
+            if _has_exact_entries(v):
+                return True
+        elif isinstance(v, numbers.Integral):
+            if abs(v) > _max_exact_float_int:
+                return True
+        elif isinstance(v, numbers.Rational):
+            return True
+    return False
+
+
+def to_list(values: Any) -> list:
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return values.tolist()
+    return list(values)
+
+
+def from_buffer(buffer: Any, shape: Tuple[int, ...] = None) -> Tuple[Any, Backends]:
+    """
+    will read the entries of any buffer (bytes, bytearray, array, mmap, memoryview) or array like object
+    (__array_interface__ / __array__) as floats. Raw bytes are read as float64 and typed buffers (e.g. array('q'))
+    are converted by their format. With NumPy the result is an ndarray sharing the memory of 'buffer' when its format
+    and layout allow it (read only if the buffer is), without NumPy the entries are copied into lists
+    returns the storage and its backend
+    """
+    if numpy is not None:
+        if hasattr(buffer, "__array_interface__") or hasattr(buffer, "__array__"):
+            values = numpy.asarray(buffer, dtype=float)
+        else:
+            view = memoryview(buffer)
+            if view.format in _raw_formats:
+                values = numpy.frombuffer(buffer, dtype=float)
+            else:
+                values = numpy.asarray(view, dtype=float)
+        if shape is not None:
+            values = values.reshape(shape)
+        return values, Backends.NUMPY
+    view = memoryview(buffer)
+    if view.format in _raw_formats:
+        values = view.cast("B").cast("d").tolist()
+    else:
+        values = [float(v) for v in view.cast("B").cast(view.format).tolist()]
+    if shape is not None and len(shape) == 2:
+        rows, cols = shape
+        if rows*cols != len(values):
+            raise ValueError(f"cannot reshape {len(values)} entries into {shape}")
+        values = [values[i*cols:(i+1)*cols] for i in range(rows)]
+    return values, Backends.LIST
+
+
+def shares_memory(values: Any, buffer: Any) -> bool:
+    """
+    whether storage returned by from_buffer may still change through 'buffer' (or whatever owns its memory),
+    immutable bytes and converted copies can't
+    """
+    if numpy is None or not isinstance(values, numpy.ndarray) or isinstance(buffer, bytes):
+        return False
+    return values is buffer or not values.flags.owndata
@@ -0,0 +1,155 @@
+from __future__ import annotations
+from fractions import Fraction
+from typing import Tuple, Union
+from utils import isoneof
+import math
+import numbers
+import Matrix
+import Span
+import Vector
+
+
+class Bareiss:
+    """
+    Exact fraction-free (Bareiss) elimination of a matrix over Z or Q.
+    Every row is scaled to integers once, after which each elimination step
+        a[i][j] = (pivot*a[i][j] - a[i][c]*a[r][j]) / previous_pivot
+    divides exactly, so the intermediate integers stay as small as the minors of the matrix
+    """
+
+    def __init__(self, mat: Matrix.Matrix) -> None:
+        if not isinstance(mat, Matrix.Matrix):
+            raise TypeError("can only eliminate a 'Matrix'")
+        rows, scales = [], []
+        for i in range(len(mat)):
+            row, row_scale = Bareiss._integer_row(mat[i])
+            rows.append(row)
+            scales.append(row_scale)
+        self.__cols = len(mat[0])
+        self.__scales = scales
+        self.__scale = math.prod(scales)
+        # the row swaps and multipliers of every step, replayed on right hand sides by solve
+        self.__steps = []
+        self.__echelon, self.__pivots, self.__sign = Bareiss._eliminate(
+            rows, self.__cols, self.__steps)
+
+    @property
+    def rank(self) -> int:
+        return len(self.__pivots)
+
+    @property
+    def pivots(self) -> list[int]:
+        """
+        the columns in which the echelon form has its pivots
+        """
+        return list(self.__pivots)
+
+    @property
+    def determinant(self) -> Union[int, Fraction]:
+        n = len(self.__echelon)
+        if n != self.__cols:
+            raise ValueError("Matrix must be square")
+        if self.rank < n:
+            return 0
+        return Bareiss._simplify(Fraction(self.__sign*self.__echelon[n-1][n-1], self.__scale))
+
+    def solve(self, vec: Union[Vector.Vector, list]) -> Union[Vector.Vector, Tuple[Vector.Vector, Span.Span], None]:
+        """
+        exact solution of the system, the entries are 'int' or 'Fraction':
+            None if there is no solution
+            a Vector if the solution is unique
+            otherwise the affine solution set as RowEchelon.solve returns it: (particular, kernel),
+            every solution is particular plus a vector of the kernel Span
+        the elimination of the matrix is reused, only its steps are replayed on 'vec'
+        """
+        if not isoneof(vec, [Vector.Vector, list]):
+            raise TypeError("Matrix must be solved for a vector")
+        n, m = len(self.__echelon), self.__cols
+        if len(vec) != n:
+            raise ValueError(
+                "Vector must have the same length as the number of rows of the Matrix")
+        # the rows of the matrix were scaled to integers, so is the right hand side
+        rhs = [Fraction(v)*scale for v, scale in zip(vec, self.__scales)]
+        prev = 1
+        for r, (p, multipliers) in enumerate(self.__steps):
+            rhs[r], rhs[p] = rhs[p], rhs[r]
+            pivot = self.__echelon[r][self.__pivots[r]]
+            for i, a in enumerate(multipliers, r+1):
+                rhs[i] = (pivot*rhs[i] - a*rhs[r]) / prev
+            prev = pivot
+        if any(v != 0 for v in rhs[len(self.__pivots):]):
+            return None
+        particular = Bareiss.__back_substitute(self.__echelon, self.__pivots, m, {}, rhs)
+        free = [c for c in range(m) if c not in self.__pivots]
+        if len(free) == 0:
+            return particular
+        kernel = [Bareiss.__back_substitute(self.__echelon, self.__pivots, m, {f: 1}, [0 for _ in rhs]) for f in free]
+        return particular, Span.Span(kernel)
+
+    @staticmethod
+    def __back_substitute(echelon: list[list[int]], pivots: list[int], cols: int, free: dict, rhs: list[int]) -> Vector.Vector:
+        """
+        will solve the echelon rows for the pivot variables, the free variables are given by 'free' (zero if missing)
+        """
+        x = [Fraction(free.get(c, 0)) for c in range(cols)]
+        for i in range(len(pivots)-1, -1, -1):
+            row, p = echelon[i], pivots[i]
+            acc = Fraction(rhs[i])
+            for j in range(p+1, cols):
+                acc -= row[j]*x[j]
+            x[p] = acc / row[p]
+        return Vector.Vector([Bareiss._simplify(v) for v in x])
+
+    @staticmethod
+    def _integer_row(values) -> Tuple[list[int], int]:
+        """
+        will scale a row of int/float/Fraction values to integers, returns the integers and the scale used
+        """
+        fractions = []
+        for v in values:
+            if not isinstance(v, numbers.Real):
+                raise TypeError(
+                    "exact arithmetic is only possible for int, float and Fraction entries")
+            fractions.append(Fraction(v))
+        scale = math.lcm(*[f.denominator for f in fractions]) if fractions else 1
+        return [int(f*scale) for f in fractions], scale
+
+    @staticmethod
+    def _eliminate(rows: list[list[int]], pivot_cols: int, steps: list = None) -> Tuple[list[list[int]], list[int], int]:
+        """
+        fraction-free elimination to row echelon form, pivoting only on the first 'pivot_cols' columns
+        returns the echelon rows, the pivot columns and the sign of the row permutation.
+        the (swapped row, multipliers of the rows below) of every step are appended to 'steps' when it is given
+        """
+        n = len(rows)
+        prev = 1
+        sign = 1
+        pivots = []
+        r = 0
+        for c in range(pivot_cols):
+            if r == n:
+                break
+            p = next((i for i in range(r, n) if rows[i][c] != 0), None)
+            if p is None:
+                continue
+            if p != r:
+                rows[r], rows[p] = rows[p], rows[r]
+                sign = -sign
+            pivot_row = rows[r]
+            pivot = pivot_row[c]
+            multipliers = []
+            for i in range(r+1, n):
+                row = rows[i]
+                a = row[c]
+                multipliers.append(a)
+                rows[i] = [(pivot*x - a*y)//prev for x, y in zip(row, pivot_row)]
+            if steps is not None:
+                steps.append((p, multipliers))
+            prev = pivot
+            pivots.append(c)
+            r += 1
+        return rows, pivots, sign
+
+    @staticmethod
+    def _simplify(value: Fraction) -> Union[int, Fraction]:
+        return value.numerator if value.denominator == 1 else value
@@ -0,0 +1,66 @@
+from __future__ import annotations
+from fractions import Fraction
+from typing import Union
+from Complex import Complex
+import numbers
+import Matrix
+import SimplePolynomial
+
+
+class Berkowitz:
+    """
+    Division free characteristic polynomial det(x*I - A) of a square matrix with the Berkowitz algorithm.
+    The leading principal submatrices are added one row and column at a time, the coefficients of
+    the next one are a Toeplitz matrix of the products R*A^k*C times the current coefficients,
+    so only additions and multiplications are used: integer and rational matrices stay exact
+    """
+
+    def __init__(self, mat: Matrix.Matrix, exact: bool = False) -> None:
+        """
+        exact: floats are converted to 'Fraction' first, so the coefficients are exact as well
+        """
+        if not isinstance(mat, Matrix.Matrix):
+            raise TypeError("can only compute the characteristic polynomial of a 'Matrix'")
+        if not mat.is_square:
+            raise ValueError("Matrix must be square")
+        rows = [list(mat[i]) for i in range(len(mat))]
+        if exact:
+            for row in rows:
+                for j, v in enumerate(row):
+                    if not isinstance(v, numbers.Real):
+                        raise TypeError(
+                            "exact arithmetic is only possible for int, float and Fraction entries")
+                    row[j] = Fraction(v)
+        self.__coefficients = Berkowitz._coefficients(rows)
+        if exact:
+            self.__coefficients = [c.numerator if c.denominator == 1 else c
+                                   for c in self.__coefficients]
+
+    @property
+    def coefficients(self) -> list[Union[int, Fraction, float, Complex]]:
+        """
+        the coefficients from x^n down to the constant term, the first one is always 1
+        """
+        return list(self.__coefficients)
+
+    @property
+    def polynomial(self) -> SimplePolynomial.SimplePolynomial:
+        n = len(self.__coefficients)-1
+        return SimplePolynomial.SimplePolynomial(self.__coefficients, list(range(n, -1, -1)))
+
+    @staticmethod
+    def _coefficients(a: list[list]) -> list:
+        n = len(a)
+        p = [1]
+        for r in range(n):
+            # the new row R = a[r][:r] and column C = a[:r][r] of the r+1 leading submatrix
+            row = a[r][:r]
+            v = [a[i][r] for i in range(r)]
+            column = [1, -a[r][r]]
+            for _ in range(r):
+                column.append(-sum(x*y for x, y in zip(row, v)))
+                v = [sum(a[i][j]*v[j] for j in range(r)) for i in range(r)]
+            # multiply the lower triangular Toeplitz matrix of 'column' with p
+            p = [sum(column[i-j]*p[j] for j in range(max(0, i-r-1), min(i, r)+1))
+                 for i in range(r+2)]
+        return p
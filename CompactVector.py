@@ -0,0 +1,198 @@
+from __future__ import annotations
+from array import array
+from operator import add, mul, sub
+from typing import Iterator, Union
+import sys
+from Complex import Complex
+from utils import isoneof
+import Field
+import Vector
+
+
+class CompactVector:
+    """
+    A memory compact Vector: real entries are stored unboxed in an array('d') and complex entries in two of them
+    (real and imaginary parts). With __slots__ an instance has no __dict__, and the field is the shared
+    canonical instance from Field.create.
+    Memory footprint (CPython, 64 bit):
+        BYTES_PER_REAL (8) bytes per real entry and BYTES_PER_COMPLEX (16) per complex entry,
+        plus the fixed size of the instance and of every array object (which depends on the interpreter version,
+        CompactVector.footprint measures it on the running one). The arrays are always built from sized sequences,
+        so they are allocated exactly and nbytes equals footprint. A list backed Vector needs about 32 bytes per real entry
+        (an 8 byte pointer and a 24 byte float object) and 56 + 8 per complex one
+    """
+    __slots__ = ("__real", "__imag", "field")
+    BYTES_PER_REAL = 8
+    BYTES_PER_COMPLEX = 16
+
+    @staticmethod
+    def fromVector(vec: Vector.Vector) -> CompactVector:
+        if not isinstance(vec, Vector.Vector):
+            raise TypeError("vec must be of type 'Vector'")
+        return CompactVector(list(vec), vec.field)
+
+    @staticmethod
+    def footprint(length: int, is_complex: bool = False) -> int:
+        """
+        the number of bytes a CompactVector of 'length' entries takes (instance and arrays)
+        """
+        arrays = [array("d")] * (2 if is_complex else 1)
+        overhead = sys.getsizeof(CompactVector([0.0])) + sum(sys.getsizeof(a) for a in arrays)
+        return overhead + length*(CompactVector.BYTES_PER_COMPLEX if is_complex else CompactVector.BYTES_PER_REAL)
+
+    def __init__(self, values: Union[list, array, Iterator], field: Field.Field = None) -> None:
+        values = values if isinstance(values, array) else list(values)
+        if isinstance(values, list) and any(isoneof(v, [Complex, complex]) for v in values):
+            self.__real = array("d", [v.real for v in values])
+            self.__imag = array("d", [v.imag for v in values])
+        else:
+            self.__real = array("d", values)
+            self.__imag = None
+        self.field = field if field else Field.Field.create(
+            Field.Fields.C if self.is_complex else Field.Fields.R, len(self.__real))
+
+    @property
+    def length(self) -> int:
+        return len(self.__real)
+
+    @property
+    def is_complex(self) -> bool:
+        return self.__imag is not None
+
+    @property
+    def nbytes(self) -> int:
+        """
+        the number of bytes this vector takes, the instance and its arrays
+        """
+        res = sys.getsizeof(self) + sys.getsizeof(self.__real)
+        if self.is_complex:
+            res += sys.getsizeof(self.__imag)
+        return res
+
+    def __len__(self) -> int:
+        return len(self.__real)
+
+    def __getitem__(self, index: int) -> Union[float, Complex]:
+        if self.is_complex:
+            return Complex(self.__real[index], self.__imag[index])
+        return self.__real[index]
+
+    def __setitem__(self, index: int, value: Union[float, Complex]) -> None:
+        self.set(index, value)
+
+    def set(self, index: int, value: Union[float, Complex]) -> None:
+        """
+        a complex value turns a real vector into a complex one
+        """
+        if isoneof(value, [Complex, complex]):
+            if self.__imag is None:
+                self.__imag = array("d", [0.0])*len(self.__real)
+                self.field = Field.Field.create(Field.Fields.C, len(self.__real))
+            self.__real[index] = value.real
+            self.__imag[index] = value.imag
+            return
+        self.__real[index] = value
+        if self.__imag is not None:
+            self.__imag[index] = 0.0
+
+    def __iter__(self) -> Iterator[Union[float, Complex]]:
+        if self.is_complex:
+            return (Complex(r, i) for r, i in zip(self.__real, self.__imag))
+        return iter(self.__real)
+
+    def __str__(self) -> str:
+        return str([str(v) for v in self] if self.is_complex else self.__real.tolist())
+
+    def __eq__(self, other: Union[CompactVector, Vector.Vector, list]) -> bool:
+        if isinstance(other, CompactVector):
+            if self.is_complex or other.is_complex:
+                return self.__real == other.__real and self.__parts() == other.__parts()
+            return self.__real == other.__real
+        if not isoneof(other, [Vector.Vector, list]):
+            return False
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __ne__(self, other) -> bool:
+        return not self.__eq__(other)
+
+    def almost_equal(self, other: CompactVector) -> bool:
+        self.__check_same_length(other)
+        return all(abs(a - b) < 1e-9 for a, b in zip(self, other))
+
+    def __add__(self, other: CompactVector) -> CompactVector:
+        return self.__elementwise(other, add)
+
+    def __sub__(self, other: CompactVector) -> CompactVector:
+        return self.__elementwise(other, sub)
+
+    def __neg__(self) -> CompactVector:
+        return self.__scaled(-1.0)
+
+    def __mul__(self, num: Union[float, Complex]) -> CompactVector:
+        if not isoneof(num, [int, float, Complex]):
+            raise TypeError("CompactVector can only be multiplied by a number")
+        return self.__scaled(num)
+
+    def __rmul__(self, num: Union[float, Complex]) -> CompactVector:
+        return self.__mul__(num)
+
+    def __truediv__(self, num: Union[float, Complex]) -> CompactVector:
+        if not isoneof(num, [int, float, Complex]):
+            raise TypeError("CompactVector can only be divided by a number")
+        return self.__mul__(1/num)
+
+    def dot(self, other: CompactVector) -> CompactVector:
+        """
+        the entrywise product, as Vector.dot
+        """
+        if not isinstance(other, CompactVector):
+            raise TypeError("CompactVector can only be multiplied by another CompactVector")
+        self.__check_same_length(other)
+        if not (self.is_complex or other.is_complex):
+            return CompactVector(array("d", list(map(mul, self.__real, other.__real))))
+        return CompactVector([a*b for a, b in zip(self.__complex(), other.__complex())])
+
+    def norm(self) -> float:
+        res = sum(map(mul, self.__real, self.__real))
+        if self.is_complex:
+            res += sum(map(mul, self.__imag, self.__imag))
+        return res ** 0.5
+
+    def copy(self) -> CompactVector:
+        res = CompactVector(array("d", self.__real), self.field)
+        if self.is_complex:
+            res.__imag = array("d", self.__imag)
+        return res
+
+    def toVector(self) -> Vector.Vector:
+        return Vector.Vector(list(self), self.field)
+
+    def __scaled(self, num: Union[float, Complex]) -> CompactVector:
+        if isinstance(num, Complex) or self.is_complex:
+            num = complex(num.real, num.imag) if isinstance(num, Complex) else num
+            return CompactVector([num*v for v in self.__complex()])
+        return CompactVector(array("d", [num*v for v in self.__real]), self.field)
+
+    def __elementwise(self, other: CompactVector, op) -> CompactVector:
+        if not isinstance(other, CompactVector):
+            raise TypeError("CompactVector can only be combined with another CompactVector")
+        self.__check_same_length(other)
+        if self.field != other.field:
+            raise ValueError("Vectors must have the same field")
+        res = CompactVector(array("d", list(map(op, self.__real, other.__real))), self.field)
+        if self.is_complex or other.is_complex:
+            res.__imag = array("d", list(map(op, self.__parts(), other.__parts())))
+        return res
+
+    def __parts(self) -> array:
+        """
+        the imaginary parts, zeros for a real vector
+        """
+        return self.__imag if self.__imag is not None else array("d", [0.0])*len(self.__real)
+
+    def __complex(self) -> Iterator[complex]:
+        return map(complex, self.__real, self.__parts())
+
+    def __check_same_length(self, other) -> None:
+        if len(self) != len(other):
+            raise ValueError("Vectors must have the same length")
@@ -0,0 +1,354 @@
+from __future__ import annotations
+from typing import Union
+from Complex import Complex
+import math
+import numbers
+import time
+import Factorization
+import Matrix
+import RowEchelon
+
+_stats = {"decompositions": 0, "iterations": 0,
+          "exceptional_shifts": 0, "failures": 0, "seconds": 0.0}
+
+
+class Eigen:
+    """
+    Eigen decomposition of a real square matrix with the QR algorithm:
+    the matrix is reduced to upper Hessenberg form with Householder reflections and then
+    implicit double shift (Francis) QR steps deflate it one eigenvalue, or one complex pair, at a time
+    internally complex eigenvalues and eigenvectors use python's builtin 'complex', they are
+    returned as 'Complex'
+    """
+    # relative size under which a subdiagonal entry is considered zero
+    EPSILON = 2.220446049250313e-16
+    # QR iterations allowed for a single eigenvalue before giving up
+    MAX_ITERATIONS = 100
+    # relative tolerance used to group equal eigenvalues and to find eigenvectors
+    TOLERANCE = 1e-8
+
+    @staticmethod
+    def engine_stats() -> dict:
+        """
+        will return the counters of all the decompositions so far: how many ran, how many failed to converge,
+        the total QR iterations and exceptional shifts and the total time spent in seconds
+        """
+        return dict(_stats)
+
+    @staticmethod
+    def reset_engine_stats() -> None:
+        for key in _stats:
+            _stats[key] = 0.0 if key == "seconds" else 0
+
+    def __init__(self, mat: Matrix.Matrix) -> None:
+        if not isinstance(mat, Matrix.Matrix):
+            raise TypeError("can only decompose a 'Matrix'")
+        if not mat.is_square:
+            raise ValueError("Matrix must be square")
+        n = len(mat)
+        rows = []
+        for i in range(n):
+            if not all(isinstance(v, numbers.Real) for v in mat[i]):
+                raise TypeError(
+                    "eigen decomposition is only implemented for real matrices")
+            rows.append([float(v) for v in mat[i]])
+        self.__matrix = mat
+        self.__size = n
+        self.__scale = max([abs(v) for row in rows for v in row] + [1.0])
+        self.iterations = 0
+        self.max_iterations = 0
+        self.exceptional_shifts = 0
+        start = time.perf_counter()
+        try:
+            self.__values = self._qr_algorithm(Eigen._hessenberg(rows))
+        except ArithmeticError:
+            _stats["failures"] += 1
+            raise
+        finally:
+            self.seconds = time.perf_counter() - start
+            _stats["decompositions"] += 1
+            _stats["iterations"] += self.iterations
+            _stats["exceptional_shifts"] += self.exceptional_shifts
+            _stats["seconds"] += self.seconds
+        self.__vectors = None
+        self.__inverse_vectors = None
+        self.__vector_values = None
+
+    @property
+    def values(self) -> list[Union[float, Complex]]:
+        """
+        the eigenvalues, with algebraic multiplicity, in the order they were deflated
+        """
+        return [Complex(v.real, v.imag) if isinstance(v, complex) else v for v in self.__values]
+
+    @property
+    def stats(self) -> dict:
+        """
+        the cost of this decomposition: total QR iterations, the most iterations a single eigenvalue (or pair)
+        needed to converge, how many exceptional shifts were applied and the time it took in seconds
+        """
+        return {"iterations": self.iterations, "max_iterations": self.max_iterations,
+                "exceptional_shifts": self.exceptional_shifts, "seconds": self.seconds}
+
+    @property
+    def is_real(self) -> bool:
+        return all(not isinstance(v, complex) for v in self.__values)
+
+    @property
+    def is_invertible(self) -> bool:
+        return all(abs(v) > Eigen.TOLERANCE*self.__scale for v in self.__values)
+
+    @property
+    def is_diagonalizable(self) -> bool:
+        """
+        True if the eigenvectors of the matrix span C^n (over R the eigenvalues must also be real)
+        """
+        return self.__diagonalize() is not None
+
+    @property
+    def condition(self) -> float:
+        """
+        the condition number of the eigenvector matrix V in the infinity norm, the error of V * D^k * V^-1
+        grows with it. infinity if the matrix is not diagonalizable
+        """
+        if self.__diagonalize() is None:
+            return math.inf
+        vectors, inverse = self.__vectors, self.__inverse_vectors
+        n = self.__size
+
+        def norm(mat: Matrix.Matrix) -> float:
+            return max(sum(abs(v) for v in mat[i]) for i in range(n))
+        return norm(vectors)*norm(inverse)
+
+    def power(self, k: int) -> Matrix.Matrix:
+        """
+        will return the matrix to the power of k as V * D^k * V^-1
+        """
+        if self.__diagonalize() is None:
+            raise ValueError("Matrix is not diagonalizable")
+        vectors, inverse = self.__vectors, self.__inverse_vectors
+        n = self.__size
+        powers = [v**k for v in self.__vector_values]
+        scaled = [[vectors[i][j] * powers[j] for j in range(n)]
+                  for i in range(n)]
+        res = Matrix.Matrix(scaled) * inverse
+        if self.is_real:
+            return res
+        # the matrix is real so its power is real as well
+        return Matrix.Matrix([[res[i][j].real for j in range(n)] for i in range(n)])
+
+    def __diagonalize(self) -> Union[Matrix.Matrix, None]:
+        """
+        computes (once) the eigenvector matrix V and its inverse, returns None if there is no such basis
+        """
+        if self.__vectors is None:
+            self.__vectors = False
+            columns, values = [], []
+            for value in self.__distinct_values():
+                space = self.null_space(value)
+                columns.extend(space)
+                values.extend([value for _ in space])
+            if len(columns) == self.__size:
+                vectors = Matrix.Matrix([[columns[j][i] for j in range(self.__size)]
+                                         for i in range(self.__size)])
+                factorization = Factorization.Factorization(vectors)
+                if not factorization.is_singular:
+                    self.__vectors = vectors
+                    self.__inverse_vectors = factorization.inverse()
+                    self.__vector_values = values
+        return self.__vectors if self.__vectors is not False else None
+
+    def algebraic_multiplicity(self, value: Union[float, Complex]) -> int:
+        value = Eigen._to_number(value)
+        return len([v for v in self.__values if abs(v-value) <= Eigen.TOLERANCE*self.__scale])
+
+    def geometric_multiplicity(self, value: Union[float, Complex]) -> int:
+        return len(self.null_space(value))
+
+    def __distinct_values(self) -> list[Union[float, complex]]:
+        res = []
+        for v in self.__values:
+            if not any(abs(v-u) <= Eigen.TOLERANCE*self.__scale for u in res):
+                res.append(v)
+        return res
+
+    def null_space(self, value: Union[float, complex]) -> list[list[Union[float, complex]]]:
+        """
+        will return a basis of the kernel of (A - value*I) found by row reduction with a tolerance
+        """
+        value = Eigen._to_number(value)
+        n = self.__size
+        tol = Eigen.TOLERANCE*self.__scale
+        rows = [[float(self.__matrix[i][j]) - (value if i == j else 0) for j in range(n)]
+                for i in range(n)]
+        rows, pivots = RowEchelon.RowEchelon._reduce(rows, tol)
+        basis = []
+        for v in RowEchelon.RowEchelon._kernel_basis(rows, pivots, n):
+            norm = math.sqrt(sum(abs(x)**2 for x in v))
+            basis.append([x/norm for x in v])
+        return basis
+
+    @staticmethod
+    def characteristic_coefficients(mat: Matrix.Matrix) -> list[float]:
+        """
+        will return the coefficients of det(x*I - mat), from x^n down to the constant term, in O(n^3):
+        mat is reduced to an (orthogonally similar) upper Hessenberg matrix H whose leading principal
+        submatrices satisfy
+            p_k+1(x) = (x - H[k][k])*p_k(x) - sum_i H[i][k] * H[i+1][i]*...*H[k][k-1] * p_i(x)
+        """
+        if not mat.is_square:
+            raise ValueError("Matrix must be square")
+        h = Eigen._hessenberg([[float(v) for v in mat[i]] for i in range(len(mat))])
+        n = len(h)
+        # polys[k] holds p_k with the coefficients from the constant term up
+        polys = [[1.0]]
+        for k in range(n):
+            nxt = [0.0] + polys[k]
+            for i in range(k+1):
+                nxt[i] -= h[k][k]*polys[k][i]
+            product = 1.0
+            for i in range(k-1, -1, -1):
+                product *= h[i+1][i]
+                factor = h[i][k]*product
+                if factor != 0:
+                    for j, c in enumerate(polys[i]):
+                        nxt[j] -= factor*c
+            polys.append(nxt)
+        return polys[n][::-1]
+
+    @staticmethod
+    def _hessenberg(a: list[list[float]]) -> list[list[float]]:
+        """
+        reduces 'a' in place to upper Hessenberg form with a similarity of Householder reflections
+        """
+        n = len(a)
+        for k in range(n-2):
+            x = [a[i][k] for i in range(k+1, n)]
+            alpha = math.sqrt(sum(v*v for v in x))
+            if alpha == 0:
+                continue
+            if x[0] > 0:
+                alpha = -alpha
+            v = list(x)
+            v[0] -= alpha
+            norm2 = sum(t*t for t in v)
+            if norm2 == 0:
+                continue
+            # a = P*a*P with P = I - 2*v*v^T/(v^T*v) acting on rows/columns k+1..n-1
+            for j in range(n):
+                s = sum(v[i]*a[k+1+i][j] for i in range(len(v)))*2/norm2
+                if s != 0:
+                    for i in range(len(v)):
+                        a[k+1+i][j] -= s*v[i]
+            for i in range(n):
+                row = a[i]
+                s = sum(row[k+1+j]*v[j] for j in range(len(v)))*2/norm2
+                if s != 0:
+                    for j in range(len(v)):
+                        row[k+1+j] -= s*v[j]
+            for i in range(k+2, n):
+                a[i][k] = 0.0
+        return a
+
+    def _qr_algorithm(self, h: list[list[float]]) -> list[Union[float, complex]]:
+        """
+        shifted QR iterations on the active window of the Hessenberg matrix 'h', deflating from the bottom
+        """
+        n = len(h)
+        values = [None for _ in range(n)]
+        hi = n-1
+        its = 0
+        while hi >= 0:
+            # find the start of the unreduced block ending at hi
+            lo = hi
+            while lo > 0:
+                s = abs(h[lo-1][lo-1]) + abs(h[lo][lo])
+                if s == 0:
+                    s = self.__scale
+                if abs(h[lo][lo-1]) <= Eigen.EPSILON*s:
+                    h[lo][lo-1] = 0.0
+                    break
+                lo -= 1
+            if lo == hi:
+                values[hi] = h[hi][hi]
+                hi -= 1
+                its = 0
+                continue
+            if lo == hi-1:
+                values[hi-1], values[hi] = Eigen._eigenvalues_2x2(
+                    h[hi-1][hi-1], h[hi-1][hi], h[hi][hi-1], h[hi][hi])
+                hi -= 2
+                its = 0
+                continue
+            its += 1
+            self.max_iterations = max(self.max_iterations, its)
+            self.iterations += 1
+            if its > Eigen.MAX_ITERATIONS:
+                raise ArithmeticError(
+                    "the QR algorithm did not converge")
+            a, b, c, d = h[hi-1][hi-1], h[hi-1][hi], h[hi][hi-1], h[hi][hi]
+            trace, determinant = a+d, a*d - b*c
+            if its % 10 == 0:
+                # exceptional shifts to break out of cycles
+                self.exceptional_shifts += 1
+                s = abs(h[hi][hi-1]) + abs(h[hi-1][hi-2])
+                trace = 2*d + 1.5*s
+                determinant = (d + 0.75*s)**2 - 0.4375*s*s
+            Eigen._francis_step(h, lo, hi, trace, determinant)
+        return values
+
+    @staticmethod
+    def _francis_step(h: list[list[float]], lo: int, hi: int, trace: float, determinant: float) -> None:
+        """
+        one implicit double shift QR step on the window lo..hi, the two shifts are the roots of
+        x^2 - trace*x + determinant, so a complex pair of shifts is applied in real arithmetic
+        """
+        x = h[lo][lo]*h[lo][lo] + h[lo][lo+1]*h[lo+1][lo] - trace*h[lo][lo] + determinant
+        y = h[lo+1][lo]*(h[lo][lo] + h[lo+1][lo+1] - trace)
+        z = h[lo+1][lo]*h[lo+2][lo+1]
+        for k in range(lo, hi-1):
+            v = [x, y, z] if k < hi-1 else [x, y]
+            Eigen._reflect(h, v, k, max(lo, k-1), hi, lo, min(k+3, hi))
+            x = h[k+1][k]
+            y = h[k+2][k]
+            z = h[k+3][k] if k < hi-2 else 0.0
+        Eigen._reflect(h, [x, y], hi-1, hi-2, hi, lo, hi)
+
+    @staticmethod
+    def _reflect(h: list[list[float]], u: list[float], k: int, first_col: int, last_col: int, first_row: int, last_row: int) -> None:
+        """
+        applies the Householder reflection mapping 'u' onto the axis on rows/columns k..k+len(u)-1,
+        from the left on the columns first_col..last_col and from the right on the rows first_row..last_row
+        """
+        norm = math.sqrt(sum(t*t for t in u))
+        if norm == 0:
+            return
+        v = list(u)
+        v[0] += norm if v[0] >= 0 else -norm
+        beta = 2/sum(t*t for t in v)
+        size = len(v)
+        for j in range(first_col, last_col+1):
+            s = beta*sum(v[i]*h[k+i][j] for i in range(size))
+            if s != 0:
+                for i in range(size):
+                    h[k+i][j] -= s*v[i]
+        for i in range(first_row, last_row+1):
+            row = h[i]
+            s = beta*sum(row[k+j]*v[j] for j in range(size))
+            if s != 0:
+                for j in range(size):
+                    row[k+j] -= s*v[j]
+
+    @staticmethod
+    def _to_number(value: Union[float, Complex]) -> Union[float, complex]:
+        return complex(value.real, value.imag) if isinstance(value, Complex) else value
+
+    @staticmethod
+    def _eigenvalues_2x2(a: float, b: float, c: float, d: float) -> tuple:
+        half_trace = (a+d)/2
+        discriminant = ((a-d)/2)**2 + b*c
+        if discriminant >= 0:
+            root = math.sqrt(discriminant)
+            return half_trace + root, half_trace - root
+        root = math.sqrt(-discriminant)
+        return complex(half_trace, root), complex(half_trace, -root)
@@ -0,0 +1,167 @@
+from __future__ import annotations
+from typing import Iterable, Iterator, Union
+from Complex import Complex
+from utils import almost_equal, isoneof
+import Matrix
+import Vector
+
+
+class Factorization:
+    """
+    LU factorization with partial pivoting of a square matrix: P*A = L*U
+    L (unit lower triangular) and U are stored packed in a single table,
+    the multipliers of L below the diagonal and U on and above it
+    """
+
+    def __init__(self, mat: Matrix.Matrix) -> None:
+        if not isinstance(mat, Matrix.Matrix):
+            raise TypeError("can only factor a 'Matrix'")
+        if not mat.is_square:
+            raise ValueError("Matrix must be square")
+        n = len(mat)
+        lu = [list(mat[i]) for i in range(n)]
+        permutation = list(range(n))
+        sign = 1
+        singular = False
+        for k in range(n):
+            pivot_index = max(range(k, n), key=lambda i: abs(lu[i][k]))
+            if almost_equal(lu[pivot_index][k], 0):
+                # no usable pivot in this column, the matrix is singular
+                singular = True
+                for i in range(k+1, n):
+                    lu[i][k] = 0
+                continue
+            if pivot_index != k:
+                lu[k], lu[pivot_index] = lu[pivot_index], lu[k]
+                permutation[k], permutation[pivot_index] = permutation[pivot_index], permutation[k]
+                sign = -sign
+            pivot_row = lu[k]
+            pivot = pivot_row[k]
+            for i in range(k+1, n):
+                row = lu[i]
+                factor = row[k] / pivot
+                row[k] = factor
+                if factor == 0:
+                    continue
+                for j in range(k+1, n):
+                    row[j] -= factor * pivot_row[j]
+        self.__lu = lu
+        self.__permutation = permutation
+        self.__sign = sign
+        self.__size = n
+        self.field = mat.field
+        self.is_singular = singular
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    @property
+    def permutation(self) -> list[int]:
+        """
+        the row permutation P as a list: row i of P*A is row permutation[i] of A
+        """
+        return list(self.__permutation)
+
+    @property
+    def determinant(self) -> Union[float, Complex]:
+        if self.is_singular:
+            return 0
+        res = self.__sign
+        for i in range(self.__size):
+            res *= self.__lu[i][i]
+        return res
+
+    def lower(self) -> Matrix.Matrix:
+        n = self.__size
+        return Matrix.Matrix([[self.__lu[i][j] if j < i else (1 if i == j else 0) for j in range(n)]
+                              for i in range(n)], field=self.field)
+
+    def upper(self) -> Matrix.Matrix:
+        n = self.__size
+        return Matrix.Matrix([[self.__lu[i][j] if j >= i else 0 for j in range(n)]
+                              for i in range(n)], field=self.field)
+
+    def solve(self, vec: Union[Vector.Vector, list]) -> Vector.Vector:
+        """
+        solves A*x = vec with forward and back substitution
+        """
+        if not isoneof(vec, [Vector.Vector, list]):
+            raise TypeError("can only solve for a Vector")
+        if len(vec) != self.__size:
+            raise ValueError("Vector must have the same length as the Matrix")
+        if self.is_singular:
+            raise ValueError("Matrix is singular")
+        return Vector.Vector(self._substitute([vec[p] for p in self.__permutation]))
+
+    def solve_many(self, rhs: Union[Matrix.Matrix, Iterable[Vector.Vector]]) -> Union[Matrix.Matrix, Iterator[Vector.Vector]]:
+        """
+        solves the system for many right hand sides reusing this factorization:
+            if 'rhs' is a Matrix B, returns the Matrix X such that A*X = B
+            otherwise 'rhs' is an iterable of vectors and an iterator of the solution Vectors is returned,
+            each one is solved only when it is reached
+        """
+        if self.is_singular:
+            raise ValueError("Matrix is singular")
+        if isinstance(rhs, Matrix.Matrix):
+            if len(rhs) != self.__size:
+                raise ValueError(
+                    "the right hand side must have the same number of rows as the Matrix")
+            return Matrix.Matrix(self._substitute_rows([list(rhs[p]) for p in self.__permutation]), field=self.field)
+        return (self.solve(vec) for vec in rhs)
+
+    def inverse(self) -> Matrix.Matrix:
+        if self.is_singular:
+            raise ValueError("Matrix must be invertible")
+        n = self.__size
+        return Matrix.Matrix(self._substitute_rows([[1 if p == j else 0 for j in range(n)] for p in self.__permutation]),
+                             field=self.field)
+
+    def _substitute(self, values: list) -> list:
+        """
+        solves L*U*x = values where values is already permuted, returns x
+        """
+        lu = self.__lu
+        n = self.__size
+        y = list(values)
+        for i in range(n):
+            row = lu[i]
+            acc = y[i]
+            for j in range(i):
+                acc -= row[j] * y[j]
+            y[i] = acc
+        for i in range(n-1, -1, -1):
+            row = lu[i]
+            acc = y[i]
+            for j in range(i+1, n):
+                acc -= row[j] * y[j]
+            y[i] = acc / row[i]
+        return y
+
+    def _substitute_rows(self, rows: list[list]) -> list[list]:
+        """
+        solves L*U*X = rows where rows is already permuted, for all the columns at once, returns X as rows
+        """
+        lu = self.__lu
+        n = self.__size
+        x = rows
+        for i in range(n):
+            row = lu[i]
+            xi = x[i]
+            for j in range(i):
+                factor = row[j]
+                if factor == 0:
+                    continue
+                xi = [a - factor*b for a, b in zip(xi, x[j])]
+            x[i] = xi
+        for i in range(n-1, -1, -1):
+            row = lu[i]
+            xi = x[i]
+            for j in range(i+1, n):
+                factor = row[j]
+                if factor == 0:
+                    continue
+                xi = [a - factor*b for a, b in zip(xi, x[j])]
+            pivot = row[i]
+            x[i] = [a / pivot for a in xi]
+        return x
@@ -1,6 +1,8 @@
 from __future__ import annotations
 from enum import Enum
+import itertools
 import random
+import time
 import Complex
 import Vector
 from typing import Any, Callable, Union
@@ -15,39 +17,130 @@ class Fields(Enum):
     M = "M"
 
 
+class Verification(Enum):
+    OFF = "off"
+    SAMPLED = "sampled"
+    EXHAUSTIVE = "exhaustive"
+
+
+# canonical field instances by (name, degree, modulu), filled by Field.create
+_registry: dict = {}
+# policy used by Field.is_field, changed with Field.set_verification
+_verification = {"mode": Verification.SAMPLED, "budget": 100, "seed": None}
+# is_field verdicts by (field class, name, degree, modulu), each a list of (zero, one, verdict)
+# as the zero and one elements need not be hashable
+_verdicts: dict = {}
+_stats = {"verifications": 0, "cache_hits": 0, "seconds": 0.0}
+
+
 class Field:
+    # fields whose axioms are known to hold skip the randomized verification in __init__
+    _trusted = False
+
     @staticmethod
     def create(name: Fields, degree: int = 1, modulu: int = 1) -> Field:
+        """
+        will return the canonical instance of the field, it is created (and verified) only on first use
+        """
+        key = (name, degree, modulu)
+        if key in _registry:
+            return _registry[key]
         match name:
             case Fields.Q:
-                return RationalField(degree, modulu)
+                field = RationalField(degree, modulu)
             case Fields.R:
-                return RealField(degree, modulu)
+                field = RealField(degree, modulu)
             case Fields.C:
-                return ComplexField(degree, modulu)
+                field = ComplexField(degree, modulu)
             case Fields.M:
                 # TODO Field create function for Fields.M
-                pass
+                return None
                 # return MatrixField(name, zero, one, degree, modulu)
+        _registry[key] = field
+        return field
+
+    @staticmethod
+    def set_verification(mode: Verification, budget: int = 100, seed: int = None) -> None:
+        """
+        will set the policy Field.is_field verifies the axioms with:
+            Verification.OFF - every field is accepted without checks
+            Verification.SAMPLED - each axiom is checked on 'budget' random samples, reproducible if 'seed' is given
+            Verification.EXHAUSTIVE - each axiom is checked on all elements of a finite field,
+                infinite fields (e.g. the built-in Q, R and C) fall back to the sampled checks
+        """
+        if not isinstance(mode, Verification):
+            raise TypeError("'mode' must be from enum 'Verification'")
+        if not isinstance(budget, int) or budget < 1:
+            raise ValueError("'budget' must be a positive 'int'")
+        _verification["mode"] = mode
+        _verification["budget"] = budget
+        _verification["seed"] = seed
+        Field.clear_verification_cache()
+
+    @staticmethod
+    def clear_verification_cache() -> None:
+        _verdicts.clear()
+
+    @staticmethod
+    def verification_stats() -> dict:
+        """
+        will return the counters of is_field: how many verifications actually ran, how many were served
+        from the cache and the total time spent verifying in seconds
+        """
+        return dict(_stats)
 
     @staticmethod
     def is_field(field: Field) -> bool:
-        N = 100
+        """
+        will verify the field axioms according to the policy set with Field.set_verification
+        the verdict is cached per field class and parameters (name, zero, one, degree and modulu)
+        """
+        if _verification["mode"] == Verification.OFF:
+            return True
+        verdicts = _verdicts.setdefault((type(field), field._name, field._degree, field._modulu), [])
+        for zero, one, verdict in verdicts:
+            if type(zero) == type(field._zero) and type(one) == type(field._one) \
+                    and zero == field._zero and one == field._one:
+                _stats["cache_hits"] += 1
+                return verdict
+        start = time.perf_counter()
+        seed = _verification["seed"]
+        if seed is not None:
+            # seed without disturbing the global random sequence
+            state = random.getstate()
+            random.seed(seed)
+        try:
+            verdict = Field.__check_axioms(field)
+        finally:
+            if seed is not None:
+                random.setstate(state)
+            _stats["verifications"] += 1
+            _stats["seconds"] += time.perf_counter() - start
+        verdicts.append((field._zero, field._one, verdict))
+        return verdict
+
+    @staticmethod
+    def __check_axioms(field: Field) -> bool:
         if not are_operators_implemnted(type(field._generate_one())):
             raise NotImplementedError(
                 "One of the nescesary operators for calculation was not implemented")
+        elements = field._elements() if _verification["mode"] == Verification.EXHAUSTIVE else None
+        if elements is not None:
+            def samples(var_count: int):
+                return itertools.product(elements, repeat=var_count)
+        else:
+            def samples(var_count: int):
+                for _ in range(_verification["budget"]):
+                    yield [field._generate_one() for _ in range(var_count)]
 
         def checker(var_count: int, rule: Callable[[], bool], exclude=None) -> bool:
             if exclude is None:
                 exclude = []
-            for _ in range(N):
-                vars = [field._generate_one() for _ in range(var_count)]
+            for vars in samples(var_count):
                 for v in vars:
                     if v in exclude:
                         break
                 else:
-                    if not rule(*vars):
-                        pass
                     if not rule(*vars):
                         return False
             return True
@@ -58,7 +151,7 @@ class Field:
 
             def multiplication() -> bool:
                 return checker(3, lambda a, b, c: almost_equal((a*b)*c, a*(b*c)))
-            return all([addition(), multiplication()])
+            return addition() and multiplication()
 
         def commutativity() -> bool:
             def addition() -> bool:
@@ -66,7 +159,7 @@ class Field:
 
             def multiplication() -> bool:
                 return checker(2, lambda a, b: almost_equal(a*b, b*a))
-            return all([addition(), multiplication()])
+            return addition() and multiplication()
 
         def distributivity() -> bool:
             def addition() -> bool:
@@ -74,7 +167,7 @@ class Field:
 
             def multiplication() -> bool:
                 return checker(3, lambda a, b, c: almost_equal((a+b)*c, a * c + b * c))
-            return all([addition(), multiplication()])
+            return addition() and multiplication()
 
         def identity() -> bool:
             def addition() -> bool:
@@ -82,7 +175,7 @@ class Field:
 
             def multiplication() -> bool:
                 return checker(1, lambda a: almost_equal(a*field._one, a, field._one*a))
-            return all([addition(), multiplication()])
+            return addition() and multiplication()
 
         def inverses() -> bool:
             def addition() -> bool:
@@ -90,8 +183,8 @@ class Field:
 
             def multiplication() -> bool:
                 return checker(1, lambda a: almost_equal(a * (1/a), field._one, (1/a)*a), [0])
-            return all([addition(), multiplication()])
-        return all([associativity(), commutativity(), distributivity(), identity(), inverses()])
+            return addition() and multiplication()
+        return associativity() and commutativity() and distributivity() and identity() and inverses()
 
     def __init__(self, name: Fields,  zero, one, degree: int = 1, modulu: int = 1) -> None:
         if not isinstance(name, Fields):
@@ -105,7 +198,7 @@ class Field:
         self._degree = degree
         self._zero = zero
         self._one = one
-        if not Field.is_field(self):
+        if not self._trusted and not Field.is_field(self):
             raise ValueError(
                 "This is not a field as one or more of the axioms do not check-out")
 
@@ -118,6 +211,8 @@ class Field:
         return str(self._name)
 
     def __eq__(self, other: Field) -> bool:
+        if self is other:
+            return True
         return self._name == other._name and self._modulu == other._modulu and self._degree == other._degree and self._zero == other._zero and self._one == other._one
 
     def __contains__(self, obj: Any) -> bool:
@@ -133,6 +228,13 @@ class Field:
         """
         raise NotImplementedError("This is a virtual method")
 
+    def _elements(self) -> list:
+        """
+        This is a virtual method for finite fields to list all of their elements with degree 1
+        it is used by the exhaustive axiom verification, infinite fields return None and are sampled instead
+        """
+        return None
+
     def random(self, min: float = -10, max: float = 10) -> Vector:
         """
         will generate a random vector from this field
@@ -145,6 +247,8 @@ class Field:
 
 
 class RationalField(Field):
+    _trusted = True
+
     def __init__(self, degree=1, modulu=1):
         super().__init__(Fields.Q, 0, 1, degree, modulu)
 
@@ -171,10 +275,12 @@ class RationalField(Field):
             "Due to how numbers are stored in python all fractional numbers are rational so this function is irrelevant")
 
 
-DefaultRationalField = RationalField()
+DefaultRationalField = Field.create(Fields.Q)
 
 
 class RealField(Field):
+    _trusted = True
+
     def __init__(self, degree=1, modulu=1):
         super().__init__(Fields.R, 0, 1, degree, modulu)
 
@@ -191,10 +297,12 @@ class RealField(Field):
             return obj.field == self
 
 
-DefaultRealField = RealField()
+DefaultRealField = Field.create(Fields.R)
 
 
 class ComplexField(Field):
+    _trusted = True
+
     def __init__(self, degree=1, modulu=1):
         super().__init__(Fields.C, Complex.Complex(0, 0),
                          Complex.Complex(1, 0), degree, modulu)
@@ -212,7 +320,7 @@ class ComplexField(Field):
             return obj.field == self
 
 
-DefaultComplexField = ComplexField()
+DefaultComplexField = Field.create(Fields.C)
 
 
 class MatrixField(Field):
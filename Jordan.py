@@ -0,0 +1,393 @@
+from __future__ import annotations
+from fractions import Fraction
+from typing import Tuple, Union
+from Complex import Complex
+import math
+import numbers
+import Eigen
+import Matrix
+import RowEchelon
+import SimplePolynomial
+import Span
+import Vector
+
+
+class Jordan:
+    """
+    Jordan structure of a square matrix A built from rank sequences:
+        for every eigenvalue λ the powers N^k of N = A - λI are built one product at a time and
+        rank(N^0), rank(N^1), ... is kept until it stabilizes; rank(N^(k-1)) - rank(N^k) is the number
+        of Jordan blocks of size atleast k. The powers and ranks are cached and shared by
+        the block sizes, the Jordan form and the chain basis.
+    Exact matrices (exact=True) are handled in exact 'Fraction' arithmetic:
+    their eigenvalues are the roots of the square-free factors of the exact characteristic polynomial,
+    so the multiplicities are exact and the rational eigenvalues are recovered exactly
+    """
+    # relative size under which an entry is considered zero in floating point arithmetic
+    TOLERANCE = 1e-8
+    # numerical eigenvalues closer than this (relative) are one eigenvalue
+    CLUSTER_TOLERANCE = 1e-5
+    # relative backward error assumed for the numerical eigenvalues, an eigenvalue of multiplicity m
+    # spreads its numerical copies by about (BACKWARD_ERROR*scale)**(1/m), scale being the largest entry
+    BACKWARD_ERROR = 1e-11
+
+    def __init__(self, mat: Matrix.Matrix) -> None:
+        if not isinstance(mat, Matrix.Matrix):
+            raise TypeError("can only compute the Jordan structure of a 'Matrix'")
+        if not mat.is_square:
+            raise ValueError("Matrix must be square")
+        n = len(mat)
+        values = [v for i in range(n) for v in mat[i]]
+        self.exact = mat.exact
+        if self.exact:
+            rows = [[Fraction(v) for v in mat[i]] for i in range(n)]
+        else:
+            rows = [[complex(v.real, v.imag) if isinstance(v, Complex) else float(v) for v in mat[i]]
+                    for i in range(n)]
+        self.__matrix = mat
+        self.__rows = rows
+        self.__size = n
+        self.__scale = max([abs(v) for v in values] + [1.0])
+        self.__minimal = None
+        self.__eigenvalues = None
+        # eigenvalue -> (the powers of A - λI, their ranks)
+        self.__sequences = {}
+
+    @property
+    def eigenvalues(self) -> list[Tuple[Union[float, Fraction, complex], int]]:
+        """
+        the distinct eigenvalues with their algebraic multiplicity, by real and then imaginary part
+        """
+        if self.__eigenvalues is None:
+            values = self.__exact_eigenvalues() if self.exact else self.__numerical_eigenvalues()
+            self.__eigenvalues = sorted(values, key=lambda pair: (pair[0].real, pair[0].imag))
+        return list(self.__eigenvalues)
+
+    def __exact_eigenvalues(self) -> list[Tuple[Union[float, Fraction, complex], int]]:
+        """
+        every factor of the square-free factorization of the characteristic polynomial has simple roots,
+        which are found on its companion matrix and replaced by the exact root when they are rational
+        """
+        polynomial = self.__matrix.characteristic_polynomial
+        coefficients = [Fraction(0) for _ in range(polynomial.degree+1)]
+        for prefix, power in zip(polynomial.prefixes, polynomial.powers):
+            coefficients[polynomial.degree-power] = Fraction(prefix)
+        res = []
+        for factor, multiplicity in Jordan._square_free(coefficients):
+            res.extend([(root, multiplicity) for root in Jordan._simple_roots(factor)])
+        return res
+
+    def __numerical_eigenvalues(self) -> list[Tuple[Union[float, complex], int]]:
+        """
+        the numerical eigenvalues are grouped largest group first: m of them are one eigenvalue of multiplicity m
+        when they are all within the spread expected for that multiplicity of their mean
+        """
+        eigen = self.__matrix.eigen
+        if eigen is None:
+            raise TypeError(
+                "the Jordan form is only implemented for real matrices")
+        remaining = [complex(v.real, v.imag) if isinstance(v, Complex) else v for v in eigen.values]
+        res = []
+        while remaining:
+            cluster = self.__largest_cluster(remaining)
+            for v in cluster:
+                remaining.remove(v)
+            res.append((self.__real(sum(cluster)/len(cluster)), len(cluster)))
+        return res
+
+    def __largest_cluster(self, values: list[Union[float, complex]]) -> list[Union[float, complex]]:
+        for m in range(len(values), 1, -1):
+            for anchor in values:
+                cluster = sorted(values, key=lambda v: abs(v-anchor))[:m]
+                mean = sum(cluster)/m
+                if max(abs(v-mean) for v in cluster) <= self.__radius(m):
+                    return cluster
+        return values[:1]
+
+    def rank_sequence(self, value) -> list[int]:
+        """
+        will return rank((A - value*I)^k) for k = 0, 1, ... up to the first k where it stops decreasing
+        """
+        return list(self.__sequence(self.__eigenvalue(value))[1])
+
+    def block_sizes(self, value) -> list[int]:
+        """
+        will return the sizes of the Jordan blocks of an eigenvalue, largest first
+        """
+        ranks = self.__sequence(self.__eigenvalue(value))[1]
+        ranks = ranks + [ranks[-1]]
+        sizes = []
+        for k in range(len(ranks)-2, 0, -1):
+            exactly_k = (ranks[k-1]-ranks[k]) - (ranks[k]-ranks[k+1])
+            sizes.extend([k for _ in range(exactly_k)])
+        return sizes
+
+    @property
+    def blocks(self) -> list[Tuple[Union[float, Fraction, complex], int]]:
+        """
+        the (eigenvalue, size) pairs of the Jordan blocks, in the order they appear in the Jordan form
+        """
+        return [(value, size) for value, _ in self.eigenvalues for size in self.block_sizes(value)]
+
+    @property
+    def jordan_form(self) -> Matrix.Matrix:
+        return Matrix.Matrix.fromJordanBlocks([Matrix.Matrix.createJordanBlock(size, Jordan._output(value))
+                                               for value, size in self.blocks])
+
+    @property
+    def chain_basis(self) -> Span.Span:
+        """
+        a basis P of Jordan chains such that P^-1 * A * P is the Jordan form, in the order of its columns
+        every chain is [N^(k-1)v, ..., Nv, v] for N = A - λI, so its first vector is an eigenvector
+        """
+        columns = []
+        for value, _ in self.eigenvalues:
+            powers, _ = self.__sequence(value)
+            sizes = self.block_sizes(value)
+            tops = []
+            for k in range(len(powers)-1, 0, -1):
+                needed = sizes.count(k)
+                if needed == 0:
+                    continue
+                # vectors already accounted for on level k: ker N^(k-1) and the longer chains
+                reduced = []
+                for v in self.__kernel(powers[k-1]):
+                    self.__extend(reduced, v)
+                for top, size in tops:
+                    self.__extend(reduced, self.__apply(powers[size-k], top))
+                for v in self.__kernel(powers[k]):
+                    if needed == 0:
+                        break
+                    if self.__extend(reduced, v):
+                        tops.append((v, k))
+                        needed -= 1
+            for top, size in tops:
+                columns.extend([self.__apply(powers[size-1-j], top) for j in range(size)])
+        return Span.Span([Vector.Vector([Jordan._output(v) for v in column]) for column in columns])
+
+    @property
+    def minimal_polynomial(self) -> SimplePolynomial.SimplePolynomial:
+        """
+        the monic polynomial of least degree with p(A) = 0, found on the Krylov sequence I, A, A^2, ...:
+        each power is built from the previous one and reduced against the earlier ones (as flat vectors),
+        the first power that reduces to zero gives the polynomial
+        """
+        if self.__minimal is None:
+            n = self.__size
+            identity = [[1 if i == j else 0 for j in range(n)] for i in range(n)]
+            power = [[Fraction(v) for v in row] for row in identity] if self.exact else identity
+            # reduced flat powers with their pivot and their combination of the powers of A
+            basis = []
+            for k in range(n+1):
+                flat = [v for row in power for v in row]
+                combination = [0 for _ in range(k)] + [1]
+                tol = self.__tolerance(flat)
+                for vec, pivot, comb in basis:
+                    factor = flat[pivot]/vec[pivot]
+                    if factor != 0:
+                        flat = [a - factor*b for a, b in zip(flat, vec)]
+                        for j, c in enumerate(comb):
+                            combination[j] -= factor*c
+                pivot = max(range(len(flat)), key=lambda i: abs(flat[i]))
+                if abs(flat[pivot]) <= tol or k == n:
+                    # sum(combination[j] * A^j) = 0, by Cayley-Hamilton this happens by k = n
+                    break
+                basis.append((flat, pivot, combination))
+                power = Jordan._product(power, self.__rows)
+            coefficients = [Jordan._output(c) for c in reversed(combination)]
+            self.__minimal = SimplePolynomial.SimplePolynomial(coefficients, list(range(k, -1, -1)))
+        return self.__minimal
+
+    def __eigenvalue(self, value):
+        """
+        will return the cached eigenvalue closest to 'value'
+        """
+        value = complex(value.real, value.imag) if isinstance(value, Complex) else value
+        for eigenvalue, multiplicity in self.eigenvalues:
+            if eigenvalue == value or abs(eigenvalue-value) <= self.__radius(multiplicity):
+                return eigenvalue
+        raise ValueError(f"{value} is not an eigenvalue of the Matrix")
+
+    def __radius(self, multiplicity: int) -> float:
+        """
+        how far the numerical copies of an eigenvalue of this multiplicity may be from their mean
+        """
+        return max(Jordan.CLUSTER_TOLERANCE*self.__scale, (Jordan.BACKWARD_ERROR*self.__scale)**(1/multiplicity))
+
+    def __real(self, value: Union[float, complex]) -> Union[float, complex]:
+        if isinstance(value, complex) and abs(value.imag) <= Jordan.TOLERANCE*self.__scale:
+            return value.real
+        return value
+
+    def __sequence(self, value) -> Tuple[list[list[list]], list[int]]:
+        if value not in self.__sequences:
+            n = self.__size
+            multiplicity = dict(self.eigenvalues)[value]
+            shifted = [[self.__rows[i][j] - (value if i == j else 0) for j in range(n)]
+                       for i in range(n)]
+            identity = [[1 if i == j else 0 for j in range(n)] for i in range(n)]
+            powers, ranks = [identity], [n]
+            power = identity
+            while True:
+                power = Jordan._product(power, shifted)
+                rank = n - len(self.__kernel(power))
+                if rank == ranks[-1]:
+                    break
+                powers.append(power)
+                ranks.append(rank)
+                if n - rank >= multiplicity:
+                    break
+            self.__sequences[value] = (powers, ranks)
+        return self.__sequences[value]
+
+    def __tolerance(self, values: list) -> float:
+        """
+        exact values are compared with zero exactly, floating point ones relative to the largest of them
+        """
+        if all(isinstance(v, numbers.Rational) for v in values):
+            return 0
+        return Jordan.TOLERANCE*max([abs(v) for v in values] + [self.__scale])
+
+    def __kernel(self, a: list[list]) -> list[list]:
+        """
+        will return a basis of the kernel of 'a' found by row reduction
+        """
+        rows, pivots = RowEchelon.RowEchelon._reduce(a, self.__tolerance([v for row in a for v in row]))
+        return RowEchelon.RowEchelon._kernel_basis(rows, pivots, len(a[0]))
+
+    def __extend(self, reduced: list[Tuple[list, int]], v: list) -> bool:
+        """
+        will add 'v' to the reduced vectors if it is independent of them, returns whether it was added
+        """
+        tol = self.__tolerance(v)
+        for vec, pivot in reduced:
+            factor = v[pivot]/vec[pivot]
+            if factor != 0:
+                v = [a - factor*b for a, b in zip(v, vec)]
+        pivot = max(range(len(v)), key=lambda i: abs(v[i]))
+        if abs(v[pivot]) <= tol:
+            return False
+        reduced.append((v, pivot))
+        return True
+
+    @staticmethod
+    def __apply(a: list[list], v: list) -> list:
+        return [sum(x*y for x, y in zip(row, v)) for row in a]
+
+    @staticmethod
+    def _product(a: list[list], b: list[list]) -> list[list]:
+        columns = list(zip(*b))
+        return [[sum(x*y for x, y in zip(row, column)) for column in columns] for row in a]
+
+    @staticmethod
+    def _square_free(coefficients: list[Fraction]) -> list[Tuple[list[Fraction], int]]:
+        """
+        Yun's square-free factorization of a polynomial (coefficients from the highest power down):
+        returns (factor, multiplicity) pairs of monic factors with simple roots, non constant ones only
+        """
+        derivative = Jordan._derivative(coefficients)
+        a = Jordan._gcd(coefficients, derivative)
+        b = Jordan._divide(coefficients, a)
+        c = Jordan._divide(derivative, a)
+        d = Jordan._subtract(c, Jordan._derivative(b))
+        res = []
+        multiplicity = 1
+        while len(b) > 1:
+            a = Jordan._gcd(b, d)
+            b = Jordan._divide(b, a)
+            c = Jordan._divide(d, a)
+            d = Jordan._subtract(c, Jordan._derivative(b))
+            if len(a) > 1:
+                res.append((a, multiplicity))
+            multiplicity += 1
+        return res
+
+    @staticmethod
+    def _simple_roots(factor: list[Fraction]) -> list[Union[float, Fraction, complex]]:
+        """
+        the roots of a monic polynomial with simple roots, exact when they are rational: a rational root p/q
+        has q dividing the leading coefficient of the polynomial scaled to integers, so it is the closest
+        fraction with such a denominator to the numerical root
+        """
+        if len(factor) == 2:
+            return [-factor[1]]
+        degree = len(factor)-1
+        companion = Matrix.Matrix([[float(-c) for c in factor[1:]]] +
+                                  [[1.0 if j == i else 0.0 for j in range(degree)] for i in range(degree-1)])
+        leading = math.lcm(*[c.denominator for c in factor])
+        res = []
+        for root in Eigen.Eigen(companion).values:
+            root = complex(root.real, root.imag) if isinstance(root, Complex) else root
+            if not isinstance(root, complex) or root.imag == 0:
+                candidate = Fraction(root.real).limit_denominator(leading)
+                if Jordan._evaluate(factor, candidate) == 0:
+                    res.append(candidate)
+                    continue
+            res.append(root)
+        return res
+
+    @staticmethod
+    def _evaluate(coefficients: list, x):
+        res = 0
+        for c in coefficients:
+            res = res*x + c
+        return res
+
+    @staticmethod
+    def _derivative(coefficients: list[Fraction]) -> list[Fraction]:
+        degree = len(coefficients)-1
+        return Jordan._trim([c*(degree-i) for i, c in enumerate(coefficients[:-1])])
+
+    @staticmethod
+    def _subtract(a: list[Fraction], b: list[Fraction]) -> list[Fraction]:
+        size = max(len(a), len(b))
+        a = [Fraction(0) for _ in range(size-len(a))] + a
+        b = [Fraction(0) for _ in range(size-len(b))] + b
+        return Jordan._trim([x - y for x, y in zip(a, b)])
+
+    @staticmethod
+    def _divide(a: list[Fraction], b: list[Fraction]) -> list[Fraction]:
+        """
+        the quotient of a by b
+        """
+        return Jordan._divmod(a, b)[0]
+
+    @staticmethod
+    def _divmod(a: list[Fraction], b: list[Fraction]) -> Tuple[list[Fraction], list[Fraction]]:
+        remainder = list(a)
+        quotient = []
+        while len(remainder) >= len(b):
+            factor = remainder[0]/b[0]
+            quotient.append(factor)
+            remainder = [x - factor*y for x, y in zip(remainder, b + [0 for _ in range(len(remainder)-len(b))])][1:]
+        return Jordan._trim(quotient), Jordan._trim(remainder)
+
+    @staticmethod
+    def _gcd(a: list[Fraction], b: list[Fraction]) -> list[Fraction]:
+        """
+        the monic greatest common divisor, [1] for coprime polynomials
+        """
+        while b != [0]:
+            a, b = b, Jordan._divmod(a, b)[1]
+        return [c/a[0] for c in a]
+
+    @staticmethod
+    def _trim(coefficients: list) -> list:
+        """
+        drops the leading zero coefficients, the zero polynomial is [0]
+        """
+        for i, c in enumerate(coefficients):
+            if c != 0:
+                return coefficients[i:]
+        return [Fraction(0)]
+
+    @staticmethod
+    def _output(value):
+        """
+        converts an internal number to the type the rest of the package uses
+        """
+        if isinstance(value, complex):
+            return Complex(value.real, value.imag)
+        if isinstance(value, Fraction) and value.denominator == 1:
+            return value.numerator
+        return value
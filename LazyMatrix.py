@@ -0,0 +1,287 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from typing import Iterator, Tuple, Union
+from Complex import Complex
+from utils import isoneof
+import Backend
+from Backend import Backends
+import Matrix
+import Vector
+
+_lazy = False
+
+
+@contextmanager
+def lazy_mode() -> Iterator[None]:
+    """
+    inside this context the arithmetic operators of Matrix build LazyMatrix expressions
+    instead of computing their result:
+        with lazy_mode():
+            e = A*B*C + D - E
+        e.evaluate()
+    """
+    global _lazy
+    previous = _lazy
+    _lazy = True
+    try:
+        yield
+    finally:
+        _lazy = previous
+
+
+@contextmanager
+def eager() -> Iterator[None]:
+    """
+    inside this context the arithmetic operators of Matrix compute their result even within lazy_mode,
+    the library's own algebra (powers, evaluation, in place products, ...) runs in it
+    """
+    global _lazy
+    previous = _lazy
+    _lazy = False
+    try:
+        yield
+    finally:
+        _lazy = previous
+
+
+def is_lazy() -> bool:
+    return _lazy
+
+
+class LazyMatrix:
+    """
+    A node of a lazily evaluated matrix expression (a DAG whose leaves are matrices).
+    The shape of every node is checked when it is built, so mismatches raise right away,
+    and nothing is computed until evaluate() (or reading the entries):
+        chains of products are reassociated to the cheapest multiplication order
+        sums, differences, negations and scalings are fused into a single pass over the entries
+    """
+
+    @staticmethod
+    def leaf(mat: Matrix.Matrix) -> LazyMatrix:
+        if not isinstance(mat, Matrix.Matrix):
+            raise TypeError("a leaf must be a 'Matrix'")
+        return LazyMatrix("leaf", (), (len(mat), len(mat[0])), matrix=mat)
+
+    def __init__(self, op: str, children: Tuple[LazyMatrix, ...], shape: Tuple[int, int], scalar=1, matrix: Matrix.Matrix = None) -> None:
+        """
+        op is one of "leaf", "add", "sub", "neg", "scale" and "mul", use LazyMatrix.leaf and the operators to build nodes
+        """
+        self.op = op
+        self.children = children
+        self.shape = shape
+        self.scalar = scalar
+        self.matrix = matrix
+        self.__result = None
+        self.__versions = None
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __getitem__(self, index: int):
+        return self.evaluate()[index]
+
+    def __str__(self) -> str:
+        return str(self.evaluate())
+
+    def __eq__(self, other: Union[Matrix.Matrix, LazyMatrix]) -> bool:
+        if isinstance(other, LazyMatrix):
+            other = other.evaluate()
+        return self.evaluate() == other
+
+    def __ne__(self, other) -> bool:
+        return not self.__eq__(other)
+
+    def __add__(self, other: Union[Matrix.Matrix, LazyMatrix]) -> LazyMatrix:
+        other = LazyMatrix.__wrap(other, "added to")
+        if self.shape != other.shape:
+            raise ValueError("Matrices must have the same dimensions")
+        return LazyMatrix("add", (self, other), self.shape)
+
+    def __radd__(self, other: Matrix.Matrix) -> LazyMatrix:
+        return LazyMatrix.__wrap(other, "added to").__add__(self)
+
+    def __sub__(self, other: Union[Matrix.Matrix, LazyMatrix]) -> LazyMatrix:
+        other = LazyMatrix.__wrap(other, "subtracted from")
+        if self.shape != other.shape:
+            raise ValueError("Matrices must have the same dimensions")
+        return LazyMatrix("sub", (self, other), self.shape)
+
+    def __rsub__(self, other: Matrix.Matrix) -> LazyMatrix:
+        return LazyMatrix.__wrap(other, "subtracted from").__sub__(self)
+
+    def __neg__(self) -> LazyMatrix:
+        return LazyMatrix("neg", (self,), self.shape)
+
+    def __mul__(self, other: Union[float, Complex, Vector.Vector, Matrix.Matrix, LazyMatrix]) -> Union[LazyMatrix, Vector.Vector]:
+        """
+        self * other, a Vector is not deferred: the product is evaluated right away in the cheapest order
+        """
+        if isoneof(other, [int, float, Complex]):
+            return LazyMatrix("scale", (self,), self.shape, scalar=other)
+        if isinstance(other, Vector.Vector):
+            if self.shape[1] != other.length:
+                raise ValueError(
+                    "Matrix and Vector must have the same number of rows")
+            column = LazyMatrix.leaf(Matrix.Matrix([[v] for v in other]))
+            res = (self*column).evaluate()
+            return Vector.Vector([res[i][0] for i in range(len(res))])
+        other = LazyMatrix.__wrap(other, "multiplied by")
+        if self.shape[1] != other.shape[0]:
+            raise ValueError(
+                "Matrix and Matrix must have matching sizes: self.cols == other.rows")
+        return LazyMatrix("mul", (self, other), (self.shape[0], other.shape[1]))
+
+    def __rmul__(self, other: Union[float, Complex, Matrix.Matrix]) -> LazyMatrix:
+        if isoneof(other, [int, float, Complex]):
+            return self.__mul__(other)
+        return LazyMatrix.__wrap(other, "multiplied by").__mul__(self)
+
+    def __truediv__(self, other: Union[float, Complex]) -> LazyMatrix:
+        if not isoneof(other, [int, float, Complex]):
+            raise TypeError("a LazyMatrix can only be divided by a number")
+        return self.__mul__(1/other)
+
+    def evaluate(self) -> Matrix.Matrix:
+        """
+        will compute the value of the expression, it is cached until one of the leaf matrices
+        (or the returned matrix) changes
+        """
+        versions = self.__leaf_versions()
+        if self.__result is None or versions != self.__versions[0] or self.__result.version != self.__versions[1]:
+            with eager():
+                self.__result = self.__evaluate({})
+            self.__versions = (versions, self.__result.version)
+        return self.__result
+
+    def __leaf_versions(self) -> tuple:
+        seen, versions, stack = set(), [], [self]
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            if node.op == "leaf":
+                versions.append((id(node.matrix), node.matrix.version))
+            stack.extend(node.children)
+        return tuple(sorted(versions))
+
+    def __evaluate(self, memo: dict) -> Matrix.Matrix:
+        """
+        memo maps already evaluated nodes (by id) to their value, so a node shared in the DAG is computed once
+        """
+        if id(self) in memo:
+            return memo[id(self)]
+        if self.op == "leaf":
+            res = self.matrix
+        elif self.op == "mul":
+            scalar, factors = self.__chain()
+            res = LazyMatrix.__multiply_chain([f.__evaluate(memo) for f in factors])
+            if scalar != 1:
+                res = res*scalar
+        else:
+            terms = {}
+            for coefficient, node in self.__terms(1):
+                previous = terms.get(id(node), (0, node))[0]
+                terms[id(node)] = (previous + coefficient, node)
+            res = LazyMatrix.__combine([(c, node.__evaluate(memo)) for c, node in terms.values()],
+                                       self.shape)
+        memo[id(self)] = res
+        return res
+
+    def __terms(self, coefficient) -> list[Tuple[Union[float, Complex], LazyMatrix]]:
+        """
+        will flatten an elementwise expression into (coefficient, node) pairs whose sum is the expression,
+        the nodes are leaves and products
+        """
+        if self.op == "add":
+            return self.children[0].__terms(coefficient) + self.children[1].__terms(coefficient)
+        if self.op == "sub":
+            return self.children[0].__terms(coefficient) + self.children[1].__terms(-coefficient)
+        if self.op == "neg":
+            return self.children[0].__terms(-coefficient)
+        if self.op == "scale":
+            return self.children[0].__terms(coefficient*self.scalar)
+        return [(coefficient, self)]
+
+    def __chain(self) -> Tuple[Union[float, Complex], list[LazyMatrix]]:
+        """
+        will flatten a product into its scalar factor and the list of its matrix factors (in order)
+        """
+        if self.op == "mul":
+            left_scalar, left = self.children[0].__chain()
+            right_scalar, right = self.children[1].__chain()
+            return left_scalar*right_scalar, left+right
+        if self.op == "scale":
+            scalar, factors = self.children[0].__chain()
+            return scalar*self.scalar, factors
+        if self.op == "neg":
+            scalar, factors = self.children[0].__chain()
+            return -scalar, factors
+        return 1, [self]
+
+    @staticmethod
+    def chain_order(dims: list[int]) -> Tuple[int, list[list[int]]]:
+        """
+        matrix chain ordering: matrix i of the chain is dims[i] x dims[i+1]
+        returns the least number of scalar multiplications and the split table,
+        split[i][j] is where the product of matrices i..j is best divided
+        """
+        n = len(dims)-1
+        cost = [[0 for _ in range(n)] for _ in range(n)]
+        split = [[0 for _ in range(n)] for _ in range(n)]
+        for length in range(2, n+1):
+            for i in range(n-length+1):
+                j = i+length-1
+                cost[i][j] = None
+                for k in range(i, j):
+                    c = cost[i][k] + cost[k+1][j] + dims[i]*dims[k+1]*dims[j+1]
+                    if cost[i][j] is None or c < cost[i][j]:
+                        cost[i][j] = c
+                        split[i][j] = k
+        return cost[0][n-1], split
+
+    @staticmethod
+    def __multiply_chain(factors: list[Matrix.Matrix]) -> Matrix.Matrix:
+        if len(factors) == 1:
+            return factors[0]
+        dims = [len(factors[0])] + [len(f[0]) for f in factors]
+        _, split = LazyMatrix.chain_order(dims)
+
+        def multiply(i: int, j: int) -> Matrix.Matrix:
+            if i == j:
+                return factors[i]
+            k = split[i][j]
+            return multiply(i, k) * multiply(k+1, j)
+        return multiply(0, len(factors)-1)
+
+    @staticmethod
+    def __combine(terms: list[Tuple[Union[float, Complex], Matrix.Matrix]], shape: Tuple[int, int]) -> Matrix.Matrix:
+        """
+        sum(coefficient * matrix) computed in one pass over the entries
+        """
+        terms = [(c, m) for c, m in terms if c != 0]
+        rows, cols = shape
+        if len(terms) == 0:
+            return Matrix.Matrix([[0 for _ in range(cols)] for _ in range(rows)])
+        if all(m.backend == Backends.NUMPY for _, m in terms) and all(isoneof(c, [int, float]) for c, _ in terms):
+            numpy = Backend.numpy
+            res = numpy.zeros((rows, cols))
+            for c, m in terms:
+                res += c*numpy.asarray([m[i] for i in range(rows)], dtype=float)
+            return Matrix.Matrix(res, backend=Backends.NUMPY)
+        coefficients = [c for c, _ in terms]
+        if all(c == 1 for c in coefficients):
+            return Matrix.Matrix([[sum(values) for values in zip(*[m[i] for _, m in terms])]
+                                  for i in range(rows)])
+        return Matrix.Matrix([[sum([c*v for c, v in zip(coefficients, values)])
+                               for values in zip(*[m[i] for _, m in terms])]
+                              for i in range(rows)])
+
+    @staticmethod
+    def __wrap(other, action: str) -> LazyMatrix:
+        if isinstance(other, LazyMatrix):
+            return other
+        if isinstance(other, Matrix.Matrix):
+            return LazyMatrix.leaf(other)
+        raise TypeError(f"a LazyMatrix can only be {action} a Matrix or a LazyMatrix")
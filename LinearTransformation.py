@@ -2,7 +2,8 @@ from __future__ import annotations
 from Matrix import *
 from typing import Callable
 import Field
-from utils import composite_function, isoneof
+import LazyMatrix
+from utils import isoneof
 
 
 class LinearTransformation:
@@ -24,7 +25,14 @@ class LinearTransformation:
 
     @staticmethod
     def fromMatrix(m: Matrix) -> LinearTransformation:
-        return LinearTransformation(m.field, type(m.field)(m.field._name), lambda x: m*x)
+        """
+        will create the transformation v -> m*v, it is linear by construction so no linearity check is run
+        """
+        if not isinstance(m, Matrix):
+            raise TypeError("m must be of type 'Matrix'")
+        src_field = Field.Field.create(m.field._name, len(m[0]))
+        dst_field = Field.Field.create(m.field._name, len(m))
+        return LinearTransformation(src_field, dst_field, matrix=m)
 
     @staticmethod
     def id(field: int) -> LinearTransformation:
@@ -33,26 +41,42 @@ class LinearTransformation:
     def is_invariant_to(span: Span) -> bool:
         pass
 
-    def __init__(self, src_field: Field, dst_field: Field, func: Callable[[Any], Any]) -> None:
+    def __init__(self, src_field: Field, dst_field: Field, func: Callable[[Any], Any] = None, matrix: Matrix = None, validate: bool = True) -> None:
         """creates a new linear transformation
 
         Args:
             src_field (Field): The source field which elements form it are called with this opeartor
             dst_field (Field): The Field which is the output oif this transformation
             func (Callable[[Any], Any]): the transformation function
+            matrix (Matrix): the matrix of the transformation, when given 'func' is not needed and
+                the linearity check is skipped
+            validate (bool): if False 'func' is trusted to be linear and the linearity check is skipped
         """
-        if not LinearTransformation.isFuncLinearTransformation(func, src_field, dst_field):
+        if matrix is not None:
+            if not isinstance(matrix, Matrix):
+                raise TypeError("matrix must be of type 'Matrix'")
+            def func(v, target):
+                return Vector.Vector(list(matrix*v), target)
+        elif func is None:
+            raise ValueError("either func or matrix must be given")
+        elif validate and not LinearTransformation.isFuncLinearTransformation(func, src_field, dst_field):
             raise ValueError("func is not a linear transformation")
         self.src_field = src_field
         self.dst_field = dst_field
         self.func = func
+        self.matrix = matrix
+        # the (func, target field) steps this transformation applies in order, see compose
+        self.__steps = [(func, dst_field)]
 
     def __add__(self, other) -> LinearTransformation:
         # if isoneof(other, [int, float, complex]):
         # return LinearTransformation(self.src_field, self.dst_field, lambda x, y: self.func(x, y)+other*LinearTransformation())
         if isinstance(other, LinearTransformation):
             if self.src_field == other.src_field and self.dst_field == other.dst_field:
-                return LinearTransformation(self.src_field, self.dst_field, lambda x, y: self(x)+other(x))
+                if self.matrix is not None and other.matrix is not None:
+                    with LazyMatrix.eager():
+                        return LinearTransformation(self.src_field, self.dst_field, matrix=self.matrix+other.matrix)
+                return LinearTransformation(self.src_field, self.dst_field, lambda x, y: self(x)+other(x), validate=False)
             raise ValueError(
                 "cant add linear transformations on diffrent fields")
         raise NotImplementedError(
@@ -72,7 +96,10 @@ class LinearTransformation:
 
     def __mul__(self, other) -> LinearTransformation:
         if isoneof(other, [int, float, Complex]):
-            return LinearTransformation(self.src_field, self.dst_field, lambda x, y: self.func(x, y)*other)
+            if self.matrix is not None:
+                with LazyMatrix.eager():
+                    return LinearTransformation(self.src_field, self.dst_field, matrix=self.matrix*other)
+            return LinearTransformation(self.src_field, self.dst_field, lambda x, y: self.func(x, y)*other, validate=False)
         else:
             raise NotImplementedError(
                 "multiplication with non-numeric type not implemented")
@@ -85,20 +112,46 @@ class LinearTransformation:
             if not other == int(other) or other < 0:
                 raise NotImplementedError(
                     "only non negativ powers are implemented and you tried to raise the transformation to {}".format(other))
+            if self.src_field != self.dst_field:
+                raise ValueError(
+                    "only a transformation from a field to itself can be raised to a power")
             if other == 0:
-                return LinearTransformation(self.src_field, self.dst_field, lambda x, y: x)
+                if self.matrix is not None:
+                    return LinearTransformation(self.src_field, self.dst_field, matrix=Matrix.id_matrix(len(self.matrix)))
+                return LinearTransformation(self.src_field, self.dst_field, lambda x, y: x, validate=False)
             if other == 1:
                 return self
 
             other = int(other)
-            func = composite_function(self.func, self.func)
-            for _ in range(abs(other)-2):
-                func = composite_function(func, self.func)
-            return LinearTransformation(self.src_field, self.dst_field, lambda x, y: func(x, y))
+            if self.matrix is not None:
+                return LinearTransformation(self.src_field, self.dst_field,
+                                            matrix=self.matrix**other)
+            return LinearTransformation(self.src_field, self.dst_field,
+                                        LinearTransformation.__fuse(self.__steps, other), validate=False)
         else:
             raise NotImplementedError(
                 "multiplication with non-numeric type not implemented")
 
+    def compose(self, other: LinearTransformation) -> LinearTransformation:
+        """
+        will return the composition self∘other (other is applied first)
+        matrix backed transformations compose into a single matrix product, others into one flat
+        applier so nested compositions don't grow the call stack
+        """
+        if not isinstance(other, LinearTransformation):
+            raise TypeError("can only compose with another LinearTransformation")
+        if other.dst_field != self.src_field:
+            raise ValueError(
+                "the target field of 'other' must be the source field of self")
+        if self.matrix is not None and other.matrix is not None:
+            with LazyMatrix.eager():
+                return LinearTransformation(other.src_field, self.dst_field, matrix=self.matrix*other.matrix)
+        steps = other.__steps+self.__steps
+        res = LinearTransformation(other.src_field, self.dst_field,
+                                   LinearTransformation.__fuse(steps), validate=False)
+        res.__steps = steps
+        return res
+
     def __truediv__(self, other) -> LinearTransformation:
         # TODO
         pass
@@ -123,8 +176,34 @@ class LinearTransformation:
             raise e
 
     def toMatrix(self, base=None) -> Matrix:
-        # TODO implement calculation of operator over specific base
-        pass
+        """
+        will return the matrix of the transformation over the standard basis
+        """
+        if base is not None:
+            # TODO implement calculation of operator over specific base
+            raise NotImplementedError(
+                "only the standard basis is implemented")
+        if self.matrix is not None:
+            return self.matrix
+        n = self.src_field._degree
+        columns = []
+        for i in range(n):
+            e = Vector.Vector([self.src_field._one if j == i else self.src_field._zero for j in range(n)],
+                              self.src_field)
+            columns.append(self(e))
+        return Matrix.fromVectors(columns)
+
+    @staticmethod
+    def __fuse(steps: list, repeat: int = 1) -> Callable[[Any, Field.Field], Any]:
+        """
+        will return a single function applying the (func, target field) steps in order, 'repeat' times
+        """
+        def fused(v, target):
+            for _ in range(repeat):
+                for func, dst_field in steps:
+                    v = func(v, dst_field)
+            return v
+        return fused
 
 
 # class Hom(Field.Field):
@@ -0,0 +1,302 @@
+from __future__ import annotations
+from array import array
+from typing import Iterator, Tuple, Union
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from utils import isoneof
+import Matrix
+import Multiplication
+import Vector
+
+
+class MappedMatrix:
+    """
+    A real matrix stored in a memory mapped binary file instead of in memory:
+        a header (magic, format version, rows, cols) followed by the entries as float64 in row major order.
+    Operations stream the matrix in blocks of rows with atmost 'chunk_size' entries, so their working memory
+    is bounded by the chunk size and not by the size of the matrix.
+    Results which are matrices are written to new files, to 'path' when it is given and otherwise
+    to a temporary file which is deleted when the result is closed
+    """
+    MAGIC = b"LAMM"
+    VERSION = 1
+    HEADER = struct.Struct("<4sIQQ")
+    # entries per block of rows, 8 bytes each in the file
+    DEFAULT_CHUNK_SIZE = 1 << 20
+
+    @staticmethod
+    def create(path: str, rows: int, cols: int, chunk_size: int = None) -> MappedMatrix:
+        """
+        will create a file for a rows x cols matrix of zeros, a temporary one when path is None
+        """
+        if rows < 1 or cols < 1:
+            raise ValueError("a matrix must have atleast one row and one column")
+        temporary = path is None
+        if temporary:
+            fd, path = tempfile.mkstemp(suffix=".lamm")
+            os.close(fd)
+        with open(path, "wb") as f:
+            f.write(MappedMatrix.HEADER.pack(MappedMatrix.MAGIC, MappedMatrix.VERSION, rows, cols))
+            f.truncate(MappedMatrix.HEADER.size + rows*cols*8)
+        return MappedMatrix(path, chunk_size=chunk_size, _temporary=temporary)
+
+    @staticmethod
+    def fromMatrix(path: str, mat: Matrix.Matrix, chunk_size: int = None) -> MappedMatrix:
+        if not isinstance(mat, Matrix.Matrix):
+            raise TypeError("mat must be of type 'Matrix'")
+        res = MappedMatrix.create(path, len(mat), len(mat[0]), chunk_size)
+        for i in range(len(mat)):
+            res[i] = mat[i]
+        return res
+
+    def __init__(self, path: str, writable: bool = True, chunk_size: int = None, _temporary: bool = False) -> None:
+        """
+        will map an existing file, use MappedMatrix.create or MappedMatrix.fromMatrix to make one
+        """
+        if sys.byteorder != "little":
+            raise NotImplementedError("MappedMatrix is only supported on little endian hosts")
+        self.path = path
+        self.chunk_size = chunk_size or MappedMatrix.DEFAULT_CHUNK_SIZE
+        self.writable = writable
+        self.__temporary = _temporary
+        self.__file = open(path, "r+b" if writable else "rb")
+        self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+        magic, version, rows, cols = MappedMatrix.HEADER.unpack_from(self.__map)
+        if magic != MappedMatrix.MAGIC:
+            self.close()
+            raise ValueError(f"'{path}' is not a MappedMatrix file")
+        if version > MappedMatrix.VERSION:
+            self.close()
+            raise ValueError(f"unsupported MappedMatrix format version {version}")
+        self.__rows, self.__cols = rows, cols
+        self.__data = memoryview(self.__map)[MappedMatrix.HEADER.size:].cast("d")
+
+    def close(self) -> None:
+        """
+        will unmap the file, a temporary file is deleted
+        """
+        if getattr(self, "_MappedMatrix__map", None) is None:
+            return
+        if getattr(self, "_MappedMatrix__data", None) is not None:
+            self.__data.release()
+            self.__data = None
+        self.__map.close()
+        self.__map = None
+        self.__file.close()
+        if self.__temporary:
+            os.remove(self.path)
+
+    def __enter__(self) -> MappedMatrix:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self.close()
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.__rows, self.__cols
+
+    def __len__(self) -> int:
+        return self.__rows
+
+    def __getitem__(self, index: int) -> list[float]:
+        """
+        a copy of a row
+        """
+        if not -self.__rows <= index < self.__rows:
+            raise IndexError("Row index out of range")
+        index %= self.__rows
+        return self.__data[index*self.__cols:(index+1)*self.__cols].tolist()
+
+    def __setitem__(self, index: int, row: list[float]) -> None:
+        if not -self.__rows <= index < self.__rows:
+            raise IndexError("Row index out of range")
+        if len(row) != self.__cols:
+            raise ValueError("the row must have as many entries as the matrix has columns")
+        self.__check_writable()
+        index %= self.__rows
+        self.__data[index*self.__cols:(index+1)*self.__cols] = array("d", row)
+
+    @property
+    def block_rows(self) -> int:
+        """
+        the number of rows streamed at a time
+        """
+        return max(1, self.chunk_size // self.__cols)
+
+    def read_rows(self, start: int, stop: int) -> list[list[float]]:
+        c = self.__cols
+        flat = self.__data[start*c:stop*c].tolist()
+        return [flat[i:i+c] for i in range(0, len(flat), c)]
+
+    def write_rows(self, start: int, rows: list[list[float]]) -> None:
+        self.__check_writable()
+        c = self.__cols
+        self.__data[start*c:(start+len(rows))*c] = array("d", [v for row in rows for v in row])
+
+    def blocks(self, block_rows: int = None) -> Iterator[Tuple[int, list[list[float]]]]:
+        """
+        will iterate over (first row index, rows) blocks of the matrix
+        """
+        block_rows = block_rows or self.block_rows
+        for start in range(0, self.__rows, block_rows):
+            yield start, self.read_rows(start, min(start+block_rows, self.__rows))
+
+    def toMatrix(self) -> Matrix.Matrix:
+        """
+        will load the whole matrix into memory
+        """
+        return Matrix.Matrix(self.read_rows(0, self.__rows))
+
+    def flush(self) -> None:
+        self.__map.flush()
+
+    def __eq__(self, other: Union[Matrix.Matrix, MappedMatrix]) -> bool:
+        if not isoneof(other, [Matrix.Matrix, MappedMatrix]):
+            raise TypeError(f"cant complare 'MappedMatrix' with '{type(other)}'")
+        if (len(other), len(other[0])) != self.shape:
+            return False
+        return all(rows == MappedMatrix.__rows_of(other, start, start+len(rows)) for start, rows in self.blocks())
+
+    def __ne__(self, other) -> bool:
+        return not self.__eq__(other)
+
+    def __add__(self, other: Union[Matrix.Matrix, MappedMatrix]) -> MappedMatrix:
+        return self.add(other)
+
+    def add(self, other: Union[Matrix.Matrix, MappedMatrix], path: str = None) -> MappedMatrix:
+        if not isoneof(other, [Matrix.Matrix, MappedMatrix]):
+            raise TypeError("MappedMatrix can only be added to a Matrix or a MappedMatrix")
+        if (len(other), len(other[0])) != self.shape:
+            raise ValueError("Matrices must have the same dimensions")
+        res = MappedMatrix.create(path, self.__rows, self.__cols, self.chunk_size)
+        for start, rows in self.blocks():
+            others = MappedMatrix.__rows_of(other, start, start+len(rows))
+            res.write_rows(start, [[x + y for x, y in zip(r1, r2)] for r1, r2 in zip(rows, others)])
+        return res
+
+    def __mul__(self, other: Union[float, Vector.Vector, Matrix.Matrix, MappedMatrix]) -> Union[Vector.Vector, MappedMatrix]:
+        return self.multiply(other)
+
+    def __rmul__(self, other: Union[int, float]) -> MappedMatrix:
+        if isoneof(other, [int, float]):
+            return self.multiply(other)
+        raise TypeError("MappedMatrix can only be multiplied from the left by a number")
+
+    def multiply(self, other: Union[float, Vector.Vector, Matrix.Matrix, MappedMatrix], path: str = None) -> Union[Vector.Vector, MappedMatrix]:
+        """
+        self * other, a Vector product is returned in memory and matrix products are written to 'path'.
+        The right operand of a product with a MappedMatrix is streamed too: every block of rows of self
+        is multiplied block by block with the rows of other
+        """
+        if isoneof(other, [int, float]):
+            res = MappedMatrix.create(path, self.__rows, self.__cols, self.chunk_size)
+            for start, rows in self.blocks():
+                res.write_rows(start, [[other*v for v in row] for row in rows])
+            return res
+        if isinstance(other, Vector.Vector):
+            if self.__cols != other.length:
+                raise ValueError(
+                    "Matrix and Vector must have the same number of rows")
+            values = list(other)
+            return Vector.Vector([sum(x*y for x, y in zip(row, values)) for _, rows in self.blocks() for row in rows])
+        if not isoneof(other, [Matrix.Matrix, MappedMatrix]):
+            raise TypeError(
+                "MappedMatrix can only be multiplied by a number, Vector, Matrix or MappedMatrix")
+        if self.__cols != len(other):
+            raise ValueError(
+                "Matrix and Matrix must have matching sizes: self.cols == other.rows")
+        cols = len(other[0])
+        res = MappedMatrix.create(path, self.__rows, cols, self.chunk_size)
+        if isinstance(other, Matrix.Matrix):
+            right = [list(other[i]) for i in range(len(other))]
+            for start, rows in self.blocks(max(1, self.chunk_size // max(self.__cols, cols))):
+                res.write_rows(start, Multiplication.multiply(rows, right))
+            return res
+        inner = other.block_rows
+        for start, rows in self.blocks(max(1, self.chunk_size // max(self.__cols, cols))):
+            acc = [[0.0 for _ in range(cols)] for _ in rows]
+            for j, right in other.blocks(inner):
+                partial = Multiplication.multiply([row[j:j+len(right)] for row in rows], right)
+                acc = [[x + y for x, y in zip(r1, r2)] for r1, r2 in zip(acc, partial)]
+            res.write_rows(start, acc)
+        return res
+
+    def transpose(self, path: str = None) -> MappedMatrix:
+        """
+        the transpose, every block of rows is written as a block of columns
+        """
+        n = self.__rows
+        res = MappedMatrix.create(path, self.__cols, n, self.chunk_size)
+        data = res.__data
+        for start, rows in self.blocks():
+            stop = start+len(rows)
+            for j in range(self.__cols):
+                data[j*n+start:j*n+stop] = array("d", [row[j] for row in rows])
+        return res
+
+    def guassian_elimination(self, sol: list[float] = None, path: str = None) -> MappedMatrix:
+        """
+        the same elimination as Matrix.guassian_elimination done out of core: the rows are reordered by
+        their leading entry into the result file and for every pivot the other rows are updated block by block.
+        the transformed solution vector is kept in memory as 'solution' of the result
+        """
+        n = self.__rows
+        solution = list(sol) if sol else [0 for _ in range(n)]
+        if len(solution) != n:
+            raise ValueError("the solution vector must have an entry per row")
+
+        def first_not_zero_index(row: list[float]) -> int:
+            for i in range(len(row)):
+                if row[i] != 0:
+                    return i
+            return len(row)
+        keys = [first_not_zero_index(row) for _, rows in self.blocks() for row in rows]
+        order = sorted(range(n), key=lambda i: keys[i])
+        res = MappedMatrix.create(path, n, self.__cols, self.chunk_size)
+        for i, source in enumerate(order):
+            res[i] = self[source]
+        solution = [solution[i] for i in order]
+        for r in range(n):
+            row = res[r]
+            lead_index = min(first_not_zero_index(row), self.__cols-1)
+            lead_value = row[lead_index]
+            if lead_value == 0:
+                continue
+            if lead_value != 1:
+                row = [v/lead_value for v in row]
+                solution[r] /= lead_value
+                res[r] = row
+                lead_value = row[lead_index]
+            for start, rows in res.blocks():
+                changed = False
+                for i, other in enumerate(rows):
+                    if start+i == r:
+                        continue
+                    row_divider = other[lead_index]/lead_value
+                    if row_divider == 0:
+                        continue
+                    factor = -row_divider
+                    rows[i] = [x + factor*y for x, y in zip(other, row)]
+                    solution[start+i] -= row_divider * solution[r]
+                    changed = True
+                if changed:
+                    res.write_rows(start, rows)
+        res.solution = solution
+        return res
+
+    def __check_writable(self) -> None:
+        if not self.writable:
+            raise TypeError("the MappedMatrix was opened read only")
+
+    @staticmethod
+    def __rows_of(mat: Union[Matrix.Matrix, MappedMatrix], start: int, stop: int) -> list[list[float]]:
+        if isinstance(mat, MappedMatrix):
+            return mat.read_rows(start, stop)
+        return [list(mat[i]) for i in range(start, stop)]
@@ -1,18 +1,37 @@
 from __future__ import annotations
+from array import array
 from utils import almost_equal
-from typing import Any, Union
+from typing import Any, Iterator, Tuple, Union
 from Complex import Complex
 import Vector
 import Span
 import Field
-import copy
-import functools
+import Jordan
+import LazyMatrix
+import MatrixIO
+import MatrixStack
+import Multiplication
+import Parallel
+import RowEchelon
+import numbers
 import SimplePolynomial
+import Serialization
+import Factorization
+import Bareiss
+import Berkowitz
+import Eigen
+import SparseMatrix
+import Backend
+from Backend import Backends
 from utils import areinstances, check_foreach, isoneof
 t_matrix = list[list[Union[float, Complex]]]
 
 
 class Matrix:
+    # from this power on a diagonalizable (non integer) matrix is raised to powers through its eigendecomposition
+    EIGEN_POWER_THRESHOLD = 64
+    # the eigendecomposition is only used when its eigenvector matrix is at most this badly conditioned
+    EIGEN_POWER_MAX_CONDITION = 1e4
 
     @staticmethod
     def fromVector(vec: Vector.Vector, sol: Vector.Vector = None) -> Matrix:
@@ -48,24 +67,110 @@ class Matrix:
         return Matrix(mat, sol, field=vecs[0].field)
 
     @staticmethod
-    def fromString(matrix_string: str, sol: Vector.Vector) -> Matrix:
-        return Matrix([[int(num) for num in row.split()]
-                       for row in matrix_string.split("\n")], sol)
+    def fromString(matrix_string: str, sol: Vector.Vector, field: Field.Fields = None) -> Matrix:
+        """
+        whitespace separated rows, the entries are parsed as in MatrixIO (int, float, 1/3 or 1+2j unless 'field' is given)
+        a matrix over Fields.Q is exact
+        """
+        return Matrix([[MatrixIO._parse(num, field) for num in row.split()]
+                       for row in matrix_string.split("\n")], sol,
+                      Field.Field.create(field) if field else None, exact=field == Field.Fields.Q)
+
+    @staticmethod
+    def fromBytes(data: Union[bytes, bytearray, memoryview]) -> Matrix:
+        """
+        will read a Matrix written by toBytes (or Serialization.dumps)
+        """
+        res = Serialization.loads(data)
+        if not isinstance(res, Matrix):
+            raise ValueError("the data does not hold a Matrix")
+        return res
+
+    def toBytes(self) -> bytes:
+        return Serialization.dumps(self)
+
+    @staticmethod
+    def fromBuffer(buffer: Any, shape: tuple[int, int] = None) -> Matrix:
+        """
+        will create a Matrix of the float64 entries of a buffer or array like object, in row major order
+        with NumPy the Matrix shares the memory of the buffer when its format and layout allow it, a read only buffer
+        gives a frozen Matrix. A Matrix sharing memory caches nothing, as the buffer can change it behind its back
+        """
+        values, backend = Backend.from_buffer(buffer, shape)
+        if backend == Backends.NUMPY and values.ndim != 2:
+            raise ValueError("the shape of the matrix is required for a flat buffer")
+        if backend == Backends.LIST and (len(values) == 0 or not isinstance(values[0], list)):
+            raise ValueError("the shape of the matrix is required for a flat buffer")
+        res = Matrix(values, backend=backend)
+        if backend == Backends.NUMPY and not values.flags.writeable:
+            res.__frozen = True
+        res.__shared = Backend.shares_memory(values, buffer)
+        return res
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        NumPy storage is handed out without copying as a read only view: writes must go through the Matrix
+        so its cached values are invalidated. List storage is converted
+        """
+        if self.backend == Backends.NUMPY:
+            res = self.__matrix.view()
+            res.flags.writeable = False
+            if copy:
+                res = res.copy()
+        else:
+            res = Backend.numpy.array(self.__matrix)
+        return res if dtype is None else res.astype(dtype, copy=False)
+
+    @property
+    def __array_interface__(self) -> dict:
+        """
+        only matrices stored in NumPy expose their memory, others are converted through __array__
+        """
+        if self.backend != Backends.NUMPY:
+            raise AttributeError("only NumPy backed matrices expose '__array_interface__'")
+        return self.__array__().__array_interface__
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """
+        the buffer protocol (Python 3.12+): a read only view of NumPy storage, a float64 copy of list storage
+        """
+        if self.backend == Backends.NUMPY:
+            return memoryview(self.__array__())
+        return memoryview(array("d", [v for row in self.__matrix for v in row])).cast("B").cast("d", [self.__rows, self.__cols])
 
     @staticmethod
     def random(f: Field.Field = None, min: float = -10, max: float = 10, degree: int = 10,  def_value=None) -> Matrix:
         if f is None:
             f = Field.DefaultRealField
         # TODO how to check that defualt value is inside 'f'? what if 'f' is ratinals and has no __contains__ implemented?
-        return Matrix([[f.random(min, max) if def_value is None else def_value for _ in range(degree)]for __ in range(degree)], field=f)
+        return Matrix([[f._generate_one(min, max) if def_value is None else def_value for _ in range(degree)]for __ in range(degree)], field=f)
 
     @staticmethod
     def fromJordanBlocks(lst: list[Matrix]) -> Matrix:
-        pass
+        """
+        will create the block diagonal matrix of the given square blocks
+        """
+        if not areinstances(lst, Matrix):
+            raise TypeError("all elements must be instances of class 'Matrix'")
+        if not check_foreach(lst, lambda m: m.is_square):
+            raise ValueError("all blocks must be square")
+        size = sum([len(m) for m in lst])
+        res = [[0 for _ in range(size)] for _ in range(size)]
+        offset = 0
+        for m in lst:
+            for i in range(len(m)):
+                for j in range(len(m)):
+                    res[offset+i][offset+j] = m[i][j]
+            offset += len(m)
+        return Matrix(res)
 
     @staticmethod
     def createJordanBlock(size: int, eigenvalue) -> Matrix:
-        pass
+        """
+        will create a size x size block with 'eigenvalue' on the diagonal and 1 above it
+        """
+        return Matrix([[eigenvalue if i == j else (1 if j == i+1 else 0) for j in range(size)]
+                       for i in range(size)])
 
     @staticmethod
     def id_matrix(size: int) -> Matrix:
@@ -74,49 +179,116 @@ class Matrix:
             arr[i][i] = 1
         return Matrix(arr)
 
-    def __init__(self, mat: t_matrix, sol_vec: list[Union[float, Complex]] = None, field: Field.Field = None) -> None:
+    def __init__(self, mat: t_matrix, sol_vec: list[Union[float, Complex]] = None, field: Field.Field = None, backend: Backends = None, exact: bool = False) -> None:
+        """
+        exact: when True (for matrices over Z or Q) determinant, rank and solve use exact
+               fraction-free Bareiss elimination and return 'int' / 'Fraction' values
+        """
         if field is None:
             field = Field.DefaultRealField
-        self.__matrix = mat
+        if isinstance(mat, list):
+            mat = [list(row) if isinstance(row, MatrixRow) else row for row in mat]
+        self.__matrix, self.backend = Backend.to_storage(mat, backend, exact)
         self.__rows = len(mat)
         self.__cols = len(mat[0])
         self.__solution_vector = sol_vec if sol_vec else [
             0 for _ in range(self.__rows)]
         self.field = field
+        self.exact = exact
+        self.__frozen = False
+        # every change to the entries increments the version, derived values are cached per version
+        self.__version = 0
+        self.__cache = {}
+        self.__cache_version = 0
+        # memory shared with a buffer can change without the version changing, nothing is cached then
+        self.__shared = False
+
+    @property
+    def row_echelon(self) -> RowEchelon.RowEchelon:
+        """
+        the reduced row echelon form of the matrix with its pivots, computed once and cached,
+        rank, kernel, image and solve for singular or non square matrices are read from it
+        """
+        return self.__cached("row_echelon", lambda: RowEchelon.RowEchelon(self))
 
     @property
     def kernel(self) -> Span.Span:
-        solution = Matrix(
-            self.__matrix, [0 for _ in range(self.__rows)]).solve()
+        return self.row_echelon.kernel
 
     @property
     def image(self) -> Span.Span:
-        # TODO implement image calculation
-        pass
+        return self.row_echelon.image
 
     @property
     def rank(self) -> int:
-        self.reorgenize_rows()
-        rank = 0
-        for row in self.__matrix:
-            if all([i == 0 for i in row]):
-                continue
-            rank += 1
-        return rank
+        if self.exact:
+            return self.bareiss.rank
+        return self.row_echelon.rank
+
+    @property
+    def bareiss(self) -> Bareiss.Bareiss:
+        """
+        the exact fraction-free elimination of the matrix, computed once and cached
+        exact matrices read determinant, rank and solve from it
+        """
+        return self.__cached("bareiss", lambda: Bareiss.Bareiss(self))
+
+    @property
+    def factorization(self) -> Factorization.Factorization:
+        """
+        the LU factorization of the matrix, computed once and cached
+        """
+        return self.__cached("factorization", lambda: Factorization.Factorization(self))
+
+    @property
+    def eigen(self) -> Union[Eigen.Eigen, None]:
+        """
+        the numerical eigendecomposition of the matrix, computed once and cached
+        None when the matrix has entries that are not real numbers
+        """
+        def decompose() -> Union[Eigen.Eigen, None]:
+            try:
+                return Eigen.Eigen(self)
+            except TypeError:
+                return None
+        return self.__cached("eigen", decompose)
 
     @property
     def determinant(self) -> float:
         if self.__rows != self.__cols:
             raise ValueError("Matrix must be square")
-        if self.__rows == 1:
-            return self.__matrix[0][0]
-        if self.__rows == 2:
-            return self.__matrix[0][0] * self.__matrix[1][1] - self.__matrix[0][1] * self.__matrix[1][0]
-        return sum([self.__matrix[i][0] * ((-1)**i) * self.minor(i, 0) for i in range(self.__rows)])
+
+        def compute() -> float:
+            if self.exact:
+                return self.bareiss.determinant
+            if self.__rows == 1:
+                return self.__matrix[0][0]
+            if self.__rows == 2:
+                return self.__matrix[0][0] * self.__matrix[1][1] - self.__matrix[0][1] * self.__matrix[1][0]
+            return self.factorization.determinant
+        return self.__cached("determinant", compute)
 
     @property
     def is_invertiable(self) -> bool:
-        return self.determinant != 0
+        if not self.is_square:
+            return False
+
+        def compute() -> bool:
+            if self.exact:
+                return self.rank == self.__rows
+            return not self.factorization.is_singular
+        return self.__cached("is_invertiable", compute)
+
+    @property
+    def version(self) -> int:
+        """
+        a counter of the changes made to the entries, cached values are kept only for the current version
+        """
+        return self.__version
+
+    @property
+    def is_frozen(self) -> bool:
+        return self.__frozen
 
     @property
     def is_square(self) -> bool:
@@ -124,8 +296,12 @@ class Matrix:
 
     @property
     def is_diagonialable(self) -> bool:
-        # TODO implement diagonialability check
-        pass
+        """
+        True if the eigenvectors of the matrix span the whole space (over C for a real matrix)
+        """
+        if not self.is_square:
+            return False
+        return self.__real_eigen().is_diagonalizable
 
     @property
     def is_nilpotent(self) -> bool:
@@ -134,33 +310,83 @@ class Matrix:
 
     @property
     def eigen_values(self) -> Vector.Vector:
-        # TODO implement eigen value calculation
-        pass
+        """
+        the eigenvalues with their algebraic multiplicity, real numbers or 'Complex' conjugate pairs
+        they are computed numerically by the QR algorithm, see Matrix.eigen for the decomposition and its stats
+        """
+        values = self.__real_eigen().values
+        if all(not isinstance(v, Complex) for v in values):
+            return Vector.Vector(values)
+        return Vector.Vector([v if isinstance(v, Complex) else Complex(v, 0) for v in values],
+                             Field.Field.create(Field.Fields.C, len(values)))
+
+    @property
+    def jordan(self) -> Jordan.Jordan:
+        """
+        the Jordan structure of the matrix, computed once and cached, it keeps the rank sequences of
+        (A - λI)^k that jordan_form, chain_basis and the block sizes are derived from
+        """
+        return self.__cached("jordan", lambda: Jordan.Jordan(self))
 
     @property
     def jordan_form(self) -> Matrix:
-        # TODO implement jordan form calculation
-        pass
+        return self.jordan.jordan_form
 
     @property
     def chain_basis(self) -> Span.Span:
-        # TODO implement chain basis calculation
-        pass
+        """
+        a basis of Jordan chains, as the columns of P it gives P^-1 * A * P = jordan_form
+        """
+        return self.jordan.chain_basis
 
     @property
     def characteristic_polynomial(self) -> SimplePolynomial.SimplePolynomial:
-        # TODO implement characteristic polynomial calculation
-        pass
+        """
+        det(x*I - A), computed once and cached:
+            exact, integer and rational matrices use the division free Berkowitz algorithm (exact coefficients)
+            other real matrices use the O(n^3) Hessenberg recurrence
+            complex matrices use Berkowitz in their own arithmetic
+        """
+        if not self.is_square:
+            raise ValueError("Matrix must be square")
+        def compute() -> SimplePolynomial.SimplePolynomial:
+            values = [v for row in self.__matrix for v in row]
+            if self.exact:
+                return Berkowitz.Berkowitz(self, exact=True).polynomial
+            if all(isinstance(v, numbers.Rational) for v in values) or \
+                    not all(isinstance(v, numbers.Real) for v in values):
+                return Berkowitz.Berkowitz(self).polynomial
+            coefficients = Eigen.Eigen.characteristic_coefficients(self)
+            return SimplePolynomial.SimplePolynomial(coefficients, list(range(self.__rows, -1, -1)))
+        return self.__cached("characteristic_polynomial", compute)
 
     @property
     def minimal_polynomial(self) -> SimplePolynomial.SimplePolynomial:
-        # TODO implement minimal polynomial calculation
-        pass
+        return self.jordan.minimal_polynomial
 
-    def __getitem__(self, index: int):
+    def __getitem__(self, index: int) -> MatrixRow:
+        """
+        will return a view of the row, writing into it (m[i][j] = x) invalidates the cached values
+        """
+        if not isinstance(index, int):
+            raise TypeError("Index must be an integer")
+        return MatrixRow(self.__matrix[index], self.__row_written)
+
+    def __setitem__(self, index: int, row: list) -> None:
         if not isinstance(index, int):
             raise TypeError("Index must be an integer")
-        return self.__matrix[index]
+        if len(row) != self.__cols:
+            raise ValueError("the row must have the same number of columns as the Matrix")
+        self.__check_writable()
+        self.__matrix[index] = row if self.backend == Backends.NUMPY else list(row)
+        self.__modified()
+
+    def __hash__(self) -> int:
+        if not self.__frozen:
+            raise TypeError(
+                "unhashable type: 'Matrix', use freeze() for a hashable copy")
+        return self.__cached("hash", lambda: hash((self.__rows, self.__cols, tuple(
+            tuple(row) for row in Backend.to_list(self.__matrix)))))
 
     def __str__(self) -> str:
         result = ""
@@ -170,23 +396,35 @@ class Matrix:
         return result
 
     def __add__(self, other: Matrix) -> Matrix:
+        if LazyMatrix.is_lazy() or isinstance(other, LazyMatrix.LazyMatrix):
+            return self.lazy() + other
         if not isinstance(other, Matrix):
             raise TypeError("Matrix can only be added to another Matrix")
         if self.__rows != other.__rows or self.__cols != other.__cols:
             raise ValueError("Matrices must have the same dimensions")
+        if self.__is_numpy_with(other):
+            return Matrix(self.__matrix + other.__matrix, backend=Backends.NUMPY)
         return Matrix([[self.__matrix[i][j] + other.__matrix[i][j] for j in range(self.__cols)]
                        for i in range(self.__rows)])
 
     def __neg__(self) -> Matrix:
+        if LazyMatrix.is_lazy():
+            return -self.lazy()
+        if self.backend == Backends.NUMPY:
+            return Matrix(-self.__matrix, backend=Backends.NUMPY)
         return Matrix([[-self.__matrix[i][j] for j in range(self.__cols)]
                        for i in range(self.__rows)])
 
     def __sub__(self, other: Matrix) -> Matrix:
+        if LazyMatrix.is_lazy() or isinstance(other, LazyMatrix.LazyMatrix):
+            return self.lazy() - other
         if not isinstance(other, Matrix):
             raise TypeError(
                 "Matrix can only be subtracted from another Matrix")
         if self.__rows != other.__rows or self.__cols != other.__cols:
             raise ValueError("Matrices must have the same dimensions")
+        if self.__is_numpy_with(other):
+            return Matrix(self.__matrix - other.__matrix, backend=Backends.NUMPY)
         return Matrix([[self.__matrix[i][j] - other.__matrix[i][j] for j in range(self.__cols)]
                        for i in range(self.__rows)])
 
@@ -194,26 +432,33 @@ class Matrix:
         """
         self * other
         """
+        if isinstance(other, LazyMatrix.LazyMatrix) or \
+                (LazyMatrix.is_lazy() and (isinstance(other, Matrix) or isoneof(other, [int, float, Complex]))):
+            return self.lazy() * other
         if isoneof(other, [int, float, Complex]):
-            res = self
-            for i in range(len(self)):
-                for j in range(len(self[0])):
-                    res[i][j] *= other
-            return res
-            # return Matrix([[other * self.__matrix[i][j] for j in range(len[self[0]])]
-            #                for i in range(len(self))])
+            return self.multiply(other)
         if isinstance(other, Vector.Vector):
             if self.__cols != other.length:
                 raise ValueError(
                     "Matrix and Vector must have the same number of rows")
+            if self.backend == Backends.NUMPY and other.backend == Backends.NUMPY:
+                return Vector.Vector(self.__matrix @ Backend.numpy.fromiter(other, dtype=float, count=other.length),
+                                     backend=Backends.NUMPY)
             return Vector.Vector([sum([self.__matrix[i][j] * other[j] for j in range(self.__cols)])
                                   for i in range(self.__rows)])
         if isinstance(other, Matrix):
             if self.__cols != other.__rows:
                 raise ValueError(
                     "Matrix and Matrix must have matching sizes: self.cols == other.rows")
-            return Matrix([[sum([self.__matrix[i][j] * other.__matrix[j][k] for j in range(self.__cols)])
-                            for k in range(other.__cols)] for i in range(self.__rows)])
+            if self.__is_numpy_with(other):
+                return Matrix(self.__matrix @ other.__matrix, backend=Backends.NUMPY)
+            if Parallel.should_parallelize(self.__rows*self.__cols*other.__cols):
+                return Matrix(Parallel.multiply(self.__matrix, other.__matrix))
+            return Matrix(Multiplication.multiply(self.__matrix, other.__matrix))
+        if isinstance(other, SparseMatrix.SparseMatrix):
+            return other.__rmul__(self)
+        if isinstance(other, MatrixStack.MatrixStack):
+            return other.__rmul__(self)
         raise TypeError(
             "Matrix can only be multiplied by a number, Vector, or Matrix")
 
@@ -251,18 +496,55 @@ class Matrix:
         return self.__rows
 
     def __pow__(self, other) -> Matrix:
+        """
+        self ** other for an integer power:
+            negative powers are powers of the (cached) inverse
+            large powers of a diagonalizable real matrix use its cached eigendecomposition: V * D^k * V^-1,
+            when V is well conditioned (Eigen.condition at most EIGEN_POWER_MAX_CONDITION)
+            everything else uses repeated squaring, O(log k) matrix products
+        the power is always computed, also inside lazy_mode
+        """
+        with LazyMatrix.eager():
+            return self.__power(other)
+
+    def __power(self, other) -> Matrix:
         if isoneof(other, [int, float]):
             if other == int(other):
                 other = int(other)
-                res = self
-                for _ in range(other-1):
-                    res *= self
+                if not self.is_square:
+                    raise ValueError("Matrix must be square")
+                if other == 0:
+                    res = Matrix.id_matrix(self.__rows)
+                    res.exact = self.exact
+                    return res
+                if abs(other) >= Matrix.EIGEN_POWER_THRESHOLD and not self.exact and \
+                        not all(isinstance(v, int) for row in self.__matrix for v in row):
+                    eigen = self.eigen
+                    if eigen is not None and eigen.condition <= Matrix.EIGEN_POWER_MAX_CONDITION and \
+                            (other > 0 or eigen.is_invertible):
+                        return eigen.power(other)
+                res = Matrix.__binary_power(self if other > 0 else self.inverse(), abs(other))
+                res.exact = self.exact
                 return res
             raise NotImplementedError(
                 "Matrix**float is not implemented")
         raise NotImplementedError(
             f"Matrix power not implemented for Matrix**{type(other)}")
 
+    @staticmethod
+    def __binary_power(base: Matrix, power: int) -> Matrix:
+        """
+        base ** power for power >= 1 by repeated squaring, never modifies 'base'
+        """
+        res = None
+        while True:
+            if power & 1:
+                res = base.multiply(1) if res is None else res * base
+            power >>= 1
+            if power == 0:
+                return res
+            base = base * base
+
     def almost_equal(self, other: Matrix) -> bool:
         if not isinstance(other, Matrix):
             raise TypeError("Matrix can only be compared to another Matrix")
@@ -271,10 +553,12 @@ class Matrix:
         return all([all([almost_equal(self[i][j], other[i][j])] for j in range(len(self[0]))) for i in range(len(self))])
 
     def inverse(self) -> Matrix:
+        """
+        the inverse is cached until self changes, every call returns a modifiable copy of the cached Matrix
+        """
         if not self.is_invertiable:
             raise ValueError("Matrix must be invertible")
-        return Matrix([[self.minor(i, j) / self.determinant for j in range(self.__cols)]
-                       for i in range(self.__rows)])
+        return self.__cached_matrix("inverse", lambda: self.factorization.inverse())
 
     def cofactor(self, row_to_ignore: int, col_to_ignore: int) -> Matrix:
         if(row_to_ignore >= self.__rows or col_to_ignore >= self.__cols):
@@ -295,19 +579,57 @@ class Matrix:
         return self.cofactor(row_to_ignore, col_to_ignore).determinant
 
     def transpose(self) -> Matrix:
-        return Matrix([[self.__matrix[j][i] for j in range(self.__cols)]
-                       for i in range(self.__rows)])
+        """
+        the transpose is cached until self changes, every call returns a modifiable copy of the cached Matrix
+        """
+        def compute() -> Matrix:
+            if self.backend == Backends.NUMPY:
+                return Matrix(Backend.numpy.ascontiguousarray(self.__matrix.T), backend=Backends.NUMPY)
+            return Matrix([[self.__matrix[i][j] for i in range(self.__rows)]
+                           for j in range(self.__cols)])
+        return self.__cached_matrix("transpose", compute)
+
+    def lazy(self) -> LazyMatrix.LazyMatrix:
+        """
+        will return the matrix as the leaf of a lazily evaluated expression, see LazyMatrix
+        """
+        return LazyMatrix.LazyMatrix.leaf(self)
+
+    def freeze(self) -> Matrix:
+        """
+        will return an immutable copy of the matrix (or self if it is already frozen),
+        a frozen Matrix is hashable and can be used as a dictionary key
+        """
+        if self.__frozen:
+            return self
+        res = self.copy()
+        res.__freeze()
+        return res
+
+    def copy(self) -> Matrix:
+        """
+        will return a modifiable copy of the entries, with nothing cached
+        """
+        if self.backend == Backends.NUMPY:
+            return Matrix(self.__matrix.copy(), list(self.__solution_vector), self.field,
+                          Backends.NUMPY, self.exact)
+        return Matrix([list(row) for row in self.__matrix], list(self.__solution_vector), self.field,
+                      Backends.LIST, self.exact)
 
     def reorgenize_rows(self):
-        def comparer(a: list[float], b: list[float]) -> bool:
-            def first_not_zero_index(row: list[float]) -> int:
-                for i in range(len(row)):
-                    if row[i] != 0:
-                        break
-                return i
-            return -1 if first_not_zero_index(a) > first_not_zero_index(b) else 1
-        self.__matrix = sorted(
-            self.__matrix, key=functools.cmp_to_key(comparer), reverse=True)
+        """
+        will sort the rows by the index of their first non zero entry, zero rows last
+        """
+        def first_not_zero_index(row: list[float]) -> int:
+            for i, v in enumerate(row):
+                if v != 0:
+                    return i
+            return len(row)
+        self.__check_writable()
+        self.__matrix = sorted(self.__matrix, key=first_not_zero_index)
+        if self.backend == Backends.NUMPY:
+            self.__matrix = Backend.numpy.array(self.__matrix)
+        self.__modified()
 
     def guassian_elimination(self, sol=None) -> Matrix:
         if not sol:
@@ -318,62 +640,341 @@ class Matrix:
                 if row[i] != 0:
                     break
             return i
-        res = copy.deepcopy(self)
-        res.__solution_vector = sol
+        res = self.copy()
+        res.__solution_vector = list(sol)
         res.reorgenize_rows()
-        # gaussian elimination
+        if res.backend == Backends.NUMPY:
+            res.__numpy_elimination()
+            return res
+        # gaussian elimination, rows are updated in place through local references
+        rows = res.__matrix
+        solution = res.__solution_vector
         for r in range(res.__rows):
-            lead_index = first_not_zero_index(res[r])
-            lead_value = res[r][lead_index]
+            row = rows[r]
+            lead_index = first_not_zero_index(row)
+            lead_value = row[lead_index]
             if lead_value == 0:
                 continue
             if lead_value != 1:
                 for c in range(res.__cols):
-                    res[r][c] /= lead_value
-                res.__solution_vector[r] /= lead_value
-                lead_value = res[r][lead_index]
+                    row[c] /= lead_value
+                solution[r] /= lead_value
+                lead_value = row[lead_index]
             for r2 in range(res.__rows):
                 if r == r2:
                     continue
-                row_divider = res[r2][lead_index]/lead_value
+                row_divider = rows[r2][lead_index]/lead_value
                 if row_divider == 0:
                     continue
-                for c in range(res.__cols):
-                    res[r2][c] -= row_divider * res[r][c]
-                res.__solution_vector[r2] -= row_divider * \
-                    res.__solution_vector[r]
+                res.add_scaled_row(r2, r, -row_divider)
+                solution[r2] -= row_divider * solution[r]
         return res
 
-    def solve(self, vec=None) -> Union[Vector.Vector, Span.Span, None]:
+    def __iadd__(self, other: Matrix) -> Matrix:
+        return self.axpy(1, other)
+
+    def __isub__(self, other: Matrix) -> Matrix:
+        return self.axpy(-1, other)
+
+    def __imul__(self, other: Union[float, Complex, Matrix]) -> Matrix:
+        """
+        self *= other
+        a number scales self in place, a Matrix replaces the entries of self with the product self*other
+        """
+        if isoneof(other, [int, float, Complex]):
+            return self.multiply(other, self)
+        if isinstance(other, Matrix):
+            self.__check_writable()
+            # in lazy mode, an in place product can't be deferred
+            with LazyMatrix.eager():
+                product = self * other
+            self.__matrix, self.backend = product.__matrix, product.backend
+            self.__cols = product.__cols
+            self.__modified()
+            return self
+        raise TypeError(
+            "Matrix can only be multiplied in place by a number or a Matrix")
+
+    def axpy(self, a: Union[float, Complex], other: Matrix) -> Matrix:
+        """
+        self += a*other in place, returns self
+        """
+        self.__check_same_shape(other)
+        self.__check_writable()
+        if self.__is_numpy_with(other) and isoneof(a, [int, float]):
+            self.__matrix += a*other.__matrix
+        else:
+            for i in range(self.__rows):
+                row, other_row = self.__matrix[i], other.__matrix[i]
+                for j in range(self.__cols):
+                    row[j] += a*other_row[j]
+        self.__modified()
+        return self
+
+    def scale_row(self, index: int, factor: Union[float, Complex]) -> None:
+        """
+        row[index] *= factor in place
+        """
+        self.__check_writable()
+        row = self.__matrix[index]
+        for j in range(self.__cols):
+            row[j] *= factor
+        self.__modified()
+
+    def add_scaled_row(self, target: int, source: int, factor: Union[float, Complex]) -> None:
+        """
+        row[target] += factor*row[source] in place
+        """
+        self.__check_writable()
+        target_row, source_row = self.__matrix[target], self.__matrix[source]
+        for j in range(self.__cols):
+            target_row[j] += factor*source_row[j]
+        self.__modified()
+
+    def add(self, other: Matrix, out: Matrix = None) -> Matrix:
+        """
+        self + other, written into 'out' (which may be self or other) when it is given
+        """
+        if out is None:
+            return self + other
+        self.__check_same_shape(other)
+        self.__check_same_shape(out)
+        out.__check_writable()
+        for i in range(self.__rows):
+            row, other_row, out_row = self.__matrix[i], other.__matrix[i], out.__matrix[i]
+            for j in range(self.__cols):
+                out_row[j] = row[j] + other_row[j]
+        out.__modified()
+        return out
+
+    def subtract(self, other: Matrix, out: Matrix = None) -> Matrix:
+        """
+        self - other, written into 'out' (which may be self or other) when it is given
+        """
+        if out is None:
+            return self - other
+        self.__check_same_shape(other)
+        self.__check_same_shape(out)
+        out.__check_writable()
+        for i in range(self.__rows):
+            row, other_row, out_row = self.__matrix[i], other.__matrix[i], out.__matrix[i]
+            for j in range(self.__cols):
+                out_row[j] = row[j] - other_row[j]
+        out.__modified()
+        return out
+
+    def multiply(self, other: Union[float, Complex, Matrix], out: Matrix = None) -> Matrix:
+        """
+        self * other for a number or a Matrix, written into 'out' when it is given (always computed, also inside lazy_mode)
+        for a number 'out' may be self, for a Matrix it must not be one of the operands
+        """
+        if isoneof(other, [int, float, Complex]):
+            if out is None:
+                if self.backend == Backends.NUMPY and isoneof(other, [int, float]):
+                    return Matrix(self.__matrix*other, field=self.field, backend=Backends.NUMPY)
+                return Matrix([[other*v for v in row] for row in self.__matrix], field=self.field)
+            self.__check_same_shape(out)
+            out.__check_writable()
+            for i in range(self.__rows):
+                row, out_row = self.__matrix[i], out.__matrix[i]
+                for j in range(self.__cols):
+                    out_row[j] = row[j]*other
+            out.__modified()
+            return out
+        if not isinstance(other, Matrix):
+            raise TypeError(
+                "Matrix can only be multiplied by a number or a Matrix")
+        if out is None:
+            with LazyMatrix.eager():
+                return self * other
+        if out is self or out is other:
+            raise ValueError(
+                "'out' can't be one of the operands of a matrix product")
+        if self.__cols != other.__rows:
+            raise ValueError(
+                "Matrix and Matrix must have matching sizes: self.cols == other.rows")
+        if out.__rows != self.__rows or out.__cols != other.__cols:
+            raise ValueError("'out' must have the shape of the product")
+        out.__check_writable()
+        product = Multiplication.multiply(Backend.to_list(self.__matrix), Backend.to_list(other.__matrix))
+        for i in range(self.__rows):
+            out.__matrix[i][:] = product[i]
+        out.__modified()
+        return out
+
+    def __check_same_shape(self, other: Matrix) -> None:
+        if not isinstance(other, Matrix):
+            raise TypeError("expected a 'Matrix'")
+        if self.__rows != other.__rows or self.__cols != other.__cols:
+            raise ValueError("Matrices must have the same dimensions")
+
+    def __modified(self) -> None:
+        """
+        must be called after the entries of the matrix change, the cached derived values become stale
+        """
+        self.__version += 1
+
+    def __check_writable(self) -> None:
+        if self.__frozen:
+            raise TypeError("a frozen Matrix can not be modified")
+
+    def __row_written(self) -> None:
+        """
+        called by a MatrixRow before it writes into the matrix
+        """
+        self.__check_writable()
+        self.__version += 1
+
+    def __cached(self, key: str, compute) -> Any:
+        """
+        will return the value cached under 'key' for the current version, computing it if needed
+        """
+        if self.__shared:
+            return compute()
+        if self.__cache_version != self.__version:
+            self.__cache.clear()
+            self.__cache_version = self.__version
+        if key not in self.__cache:
+            self.__cache[key] = compute()
+        return self.__cache[key]
+
+    def __cached_matrix(self, key: str, compute) -> Matrix:
+        """
+        like __cached for a derived Matrix: the cached Matrix is frozen and the caller gets a copy of it,
+        so writing into the result can't change the cached value
+        """
+        def frozen() -> Matrix:
+            res = compute()
+            res.__freeze()
+            return res
+        return self.__cached(key, frozen).copy()
+
+    def __freeze(self) -> None:
+        if self.backend == Backends.NUMPY:
+            self.__matrix.setflags(write=False)
+        self.__frozen = True
+
+    def __is_numpy_with(self, other: Matrix) -> bool:
+        return self.backend == Backends.NUMPY and other.backend == Backends.NUMPY
+
+    def __numpy_elimination(self) -> None:
+        """
+        vectorized row reduction of an ndarray backed matrix, in place
+        each pivot eliminates its column from all other rows with a single outer product
+        """
+        numpy = Backend.numpy
+        mat = self.__matrix
+        sol = numpy.asarray(self.__solution_vector, dtype=float)
+        for r in range(self.__rows):
+            non_zeros = numpy.flatnonzero(mat[r])
+            if len(non_zeros) == 0:
+                continue
+            lead_index = non_zeros[0]
+            lead_value = mat[r, lead_index]
+            mat[r] /= lead_value
+            sol[r] /= lead_value
+            factors = mat[:, lead_index].copy()
+            factors[r] = 0
+            mat -= numpy.outer(factors, mat[r])
+            sol -= factors * sol[r]
+        self.__solution_vector = sol.tolist()
+
+    def solve(self, vec=None) -> Union[Vector.Vector, Tuple[Vector.Vector, Span.Span], None]:
         """
         Solve the system of equations
+        returns None if there is no solution, a Vector if it is unique and otherwise the affine
+        solution set as a tuple (particular, kernel): a particular solution and the kernel as a Span
         """
-        if self.__rows != self.__cols:
-            raise ValueError("Matrix must be square")
         if vec == None:
             vec = self.__solution_vector
         if not isoneof(vec, [Vector.Vector, list]):
             raise TypeError("Matrix must be solved for a vector")
-        result_matrix = self.guassian_elimination(list(vec))
-        for i, row in enumerate(result_matrix):
-            if (not Vector.Vector(row).has_no_zero) and result_matrix.__solution_vector[i] != 0:
-                return None
-        if result_matrix.rank != result_matrix.__rows:
-            # FIXME
-            # TODO implement solutions for nullity rank > 1
-            raise NotImplementedError(
-                "nullity rank was atleast 1, not yet implemented")
-        else:
-            return Vector.Vector(result_matrix.__solution_vector)
+        if self.exact:
+            return self.bareiss.solve(vec)
+        if self.is_square and not self.factorization.is_singular:
+            return self.factorization.solve(vec)
+        return self.row_echelon.solve(vec)
 
-    def get_eigen_space_of(eigenvalue) -> Span:
-        # TODO calculate the eigen space of an eigen value
-        pass
+    def solve_many(self, rhs: Union[Matrix, list[Vector.Vector]]) -> Union[Matrix, Iterator[Vector.Vector]]:
+        """
+        solves the system for many right hand sides with a single factorization of the matrix
+        'rhs' is a Matrix whose columns are the right hand sides (a Matrix of solutions is returned)
+        or an iterable of vectors (an iterator of solution Vectors is returned)
+        """
+        if self.__rows != self.__cols:
+            raise ValueError("Matrix must be square")
+        return self.factorization.solve_many(rhs)
 
-    def algebraic_multiplicity(eigenvalue) -> int:
-        # TODO calculate the algebraic multiplicity of an eigenvalue
-        pass
+    def get_eigen_space_of(self, eigenvalue: Union[float, Complex]) -> Span.Span:
+        """
+        will return a Span of unit eigenvectors of the eigenvalue
+        """
+        basis = self.__real_eigen().null_space(eigenvalue)
+        if len(basis) == 0:
+            raise ValueError(f"{eigenvalue} is not an eigenvalue of the Matrix")
+        if all(not isinstance(v, complex) for vec in basis for v in vec):
+            return Span.Span([Vector.Vector(vec) for vec in basis])
+        field = Field.Field.create(Field.Fields.C, self.__rows)
+        return Span.Span([Vector.Vector([Complex(v.real, v.imag) for v in vec], field) for vec in basis])
+
+    def algebraic_multiplicity(self, eigenvalue: Union[float, Complex]) -> int:
+        return self.__real_eigen().algebraic_multiplicity(eigenvalue)
+
+    def geometric_multiplicity(self, eigenvalue: Union[float, Complex]) -> int:
+        return self.__real_eigen().geometric_multiplicity(eigenvalue)
+
+    def __real_eigen(self) -> Eigen.Eigen:
+        if not self.is_square:
+            raise ValueError("Matrix must be square")
+        eigen = self.eigen
+        if eigen is None:
+            raise TypeError(
+                "eigenvalues are only implemented for real matrices")
+        return eigen
 
-    def geometric_multiplicity(eigenvalue) -> int:
-        # TODO calculate the geometric multiplicity of an eigenvalue
-        pass
+
+class MatrixRow:
+    """
+    A view of one row of a Matrix, reading is done directly on the row and
+    every write first notifies the matrix, so its cached values are invalidated
+    """
+    __slots__ = ("__values", "__on_write")
+
+    def __init__(self, values: list, on_write) -> None:
+        self.__values = values
+        self.__on_write = on_write
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return Backend.to_list(self.__values[index])
+        return self.__values[index]
+
+    def __setitem__(self, index: int, value) -> None:
+        self.__on_write()
+        self.__values[index] = value
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.__values)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, MatrixRow):
+            other = other.__values
+        try:
+            return Backend.to_list(self.__values) == Backend.to_list(other)
+        except TypeError:
+            return False
+
+    def __ne__(self, other) -> bool:
+        return not self.__eq__(other)
+
+    def __array__(self, dtype=None, copy=None):
+        return Backend.numpy.asarray(self.__values, dtype=dtype)
+
+    def __str__(self) -> str:
+        return str(Backend.to_list(self.__values))
+
+    def __repr__(self) -> str:
+        return self.__str__()
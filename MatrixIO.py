@@ -0,0 +1,315 @@
+"""
+streaming text readers and writers: Matrix Market (array and coordinate), CSV and whitespace separated rows.
+Files are read line by line and written row by row, a source / destination is a path or an open text file.
+Entries are parsed by the field kind: Fields.R (int when possible, otherwise float), Fields.Q ('Fraction', e.g. 1/3)
+and Fields.C ('Complex', e.g. 1+2j in CSV / whitespace files and a pair of columns in Matrix Market files).
+Without a field the kind is taken from the Matrix Market header, or found from the tokens of CSV / whitespace files
+"""
+from __future__ import annotations
+from contextlib import contextmanager
+from fractions import Fraction
+from typing import IO, Iterator, Tuple, Union
+import numbers
+from Complex import Complex
+import Field
+import Matrix
+import SparseMatrix
+
+t_source = Union[str, IO]
+
+
+def read_matrix_market(source: t_source, sparse: bool = None, field: Field.Fields = None) -> Union[Matrix.Matrix, SparseMatrix.SparseMatrix]:
+    """
+    will read a Matrix Market file, coordinate files give a SparseMatrix and array files a Matrix unless 'sparse' says otherwise
+    symmetric, skew-symmetric and hermitian files are expanded to the full matrix
+    """
+    with _open(source, "r") as f:
+        lines = _lines(f)
+        header = next(lines, "")
+        parts = header.lower().split()
+        if len(parts) != 5 or parts[0] != "%%matrixmarket" or parts[1] != "matrix":
+            raise ValueError("not a Matrix Market matrix header")
+        layout, value_type, symmetry = parts[2:]
+        if layout not in ["array", "coordinate"]:
+            raise ValueError(f"unknown Matrix Market format '{layout}'")
+        if symmetry not in ["general", "symmetric", "skew-symmetric", "hermitian"]:
+            raise ValueError(f"unknown Matrix Market symmetry '{symmetry}'")
+        if field is None:
+            field = {"integer": Field.Fields.R, "real": Field.Fields.R, "pattern": Field.Fields.R,
+                     "complex": Field.Fields.C, "rational": Field.Fields.Q}.get(value_type)
+            if field is None:
+                raise ValueError(f"unknown Matrix Market type '{value_type}'")
+        width = 2 if value_type == "complex" else 0 if value_type == "pattern" else 1
+        size = next(_data(lines), None)
+        if size is None:
+            raise ValueError("missing size line")
+        if layout == "array":
+            n, m = [int(v) for v in size.split()]
+            rows_, cols_, values = _array_entries(_data(lines), n, m, width, field, symmetry)
+        else:
+            n, m, nnz = [int(v) for v in size.split()]
+            rows_, cols_, values = _coordinate_entries(_data(lines), nnz, width, field, symmetry)
+        if sparse is None:
+            sparse = layout == "coordinate"
+        return _build((n, m), rows_, cols_, values, sparse, field)
+
+
+def write_matrix_market(mat: Union[Matrix.Matrix, SparseMatrix.SparseMatrix], destination: t_source, coordinate: bool = None, comment: str = None) -> None:
+    """
+    will write a Matrix Market file, coordinate for a SparseMatrix and array for a Matrix unless 'coordinate' says otherwise
+    """
+    if coordinate is None:
+        coordinate = isinstance(mat, SparseMatrix.SparseMatrix)
+    n, m = _shape(mat)
+    entries = _entries(mat)
+    value_type = _kind_name(v for _, _, v in _entries(mat))
+    with _open(destination, "w") as f:
+        f.write(f"%%MatrixMarket matrix {'coordinate' if coordinate else 'array'} {value_type} general\n")
+        if comment:
+            for line in comment.splitlines():
+                f.write(f"% {line}\n")
+        if coordinate:
+            nnz = sum(1 for _, _, v in _entries(mat) if v != 0)
+            f.write(f"{n} {m} {nnz}\n")
+            for i, j, v in entries:
+                if v != 0:
+                    f.write(f"{i+1} {j+1} {_mm_format(v, value_type)}\n")
+        else:
+            # array files are column major
+            f.write(f"{n} {m}\n")
+            for j in range(m):
+                for i in range(n):
+                    f.write(f"{_mm_format(_entry(mat, i, j), value_type)}\n")
+
+
+def read_rows(source: t_source, delimiter: str = None, field: Field.Fields = None) -> Iterator[list]:
+    """
+    will lazily yield the rows of a CSV (delimiter=",") or whitespace separated (delimiter=None) file,
+    only the current line is held in memory. empty lines and lines starting with '#' or '%' are skipped
+    """
+    with _open(source, "r") as f:
+        for line in _data(_lines(f)):
+            yield [_parse(token.strip(), field) for token in line.split(delimiter)]
+
+
+def read_csv(source: t_source, sparse: bool = False, field: Field.Fields = None, delimiter: str = ",") -> Union[Matrix.Matrix, SparseMatrix.SparseMatrix]:
+    return _read_delimited(source, delimiter, sparse, field)
+
+
+def read_whitespace(source: t_source, sparse: bool = False, field: Field.Fields = None) -> Union[Matrix.Matrix, SparseMatrix.SparseMatrix]:
+    return _read_delimited(source, None, sparse, field)
+
+
+def write_csv(mat: Union[Matrix.Matrix, SparseMatrix.SparseMatrix], destination: t_source, delimiter: str = ",") -> None:
+    _write_delimited(mat, destination, delimiter)
+
+
+def write_whitespace(mat: Union[Matrix.Matrix, SparseMatrix.SparseMatrix], destination: t_source) -> None:
+    _write_delimited(mat, destination, " ")
+
+
+def _read_delimited(source: t_source, delimiter: str, sparse: bool, field: Field.Fields) -> Union[Matrix.Matrix, SparseMatrix.SparseMatrix]:
+    """
+    a dense result keeps the rows as they are read, a sparse one only keeps the non zero entries of each row
+    """
+    dense, rows_, cols_, values = [], [], [], []
+    n, m = 0, None
+    for row in read_rows(source, delimiter, field):
+        if m is None:
+            m = len(row)
+        elif len(row) != m:
+            raise ValueError(f"row {n+1} has {len(row)} entries instead of {m}")
+        if sparse:
+            for j, v in enumerate(row):
+                if v != 0:
+                    rows_.append(n)
+                    cols_.append(j)
+                    values.append(v)
+        else:
+            dense.append(row)
+        n += 1
+    if m is None:
+        raise ValueError("the file has no rows")
+    kind = field or _kind(dense if not sparse else [values])
+    if sparse:
+        return SparseMatrix.SparseMatrix.fromCOO((n, m), rows_, cols_, values, Field.Field.create(kind))
+    return Matrix.Matrix(dense, field=Field.Field.create(kind))
+
+
+def _write_delimited(mat: Union[Matrix.Matrix, SparseMatrix.SparseMatrix], destination: t_source, delimiter: str) -> None:
+    n, m = _shape(mat)
+    with _open(destination, "w") as f:
+        for i in range(n):
+            f.write(delimiter.join(_format(v) for v in _row(mat, i, m)) + "\n")
+
+
+def _array_entries(lines: Iterator[str], n: int, m: int, width: int, field: Field.Fields, symmetry: str) -> Tuple[list, list, list]:
+    rows_, cols_, values = [], [], []
+    positions = ((i, j) for j in range(m) for i in range(n) if symmetry == "general" or i >= j + (symmetry == "skew-symmetric"))
+    for (i, j), line in zip(positions, lines):
+        rows_.append(i)
+        cols_.append(j)
+        values.append(_mm_value(line.split(), width, field))
+    expected = n*m if symmetry == "general" else \
+        sum(max(0, n-j-(symmetry == "skew-symmetric")) for j in range(m))
+    found = len(values) + sum(1 for _ in lines)
+    if found != expected:
+        raise ValueError(f"expected {expected} entries but found {found}")
+    return _expand(rows_, cols_, values, symmetry)
+
+
+def _coordinate_entries(lines: Iterator[str], nnz: int, width: int, field: Field.Fields, symmetry: str) -> Tuple[list, list, list]:
+    rows_, cols_, values = [], [], []
+    for line in lines:
+        tokens = line.split()
+        rows_.append(int(tokens[0])-1)
+        cols_.append(int(tokens[1])-1)
+        values.append(_mm_value(tokens[2:], width, field))
+    if len(values) != nnz:
+        raise ValueError(f"expected {nnz} entries but found {len(values)}")
+    return _expand(rows_, cols_, values, symmetry)
+
+
+def _expand(rows_: list, cols_: list, values: list, symmetry: str) -> Tuple[list, list, list]:
+    """
+    adds the mirrored entries of the upper triangle of a symmetric, skew-symmetric or hermitian file
+    """
+    if symmetry == "general":
+        return rows_, cols_, values
+    mirror = {"symmetric": lambda v: v, "skew-symmetric": lambda v: -v,
+              "hermitian": lambda v: Complex(v.real, -v.imag) if isinstance(v, Complex) else v}[symmetry]
+    count = len(values)
+    for p in range(count):
+        if rows_[p] != cols_[p]:
+            rows_.append(cols_[p])
+            cols_.append(rows_[p])
+            values.append(mirror(values[p]))
+    return rows_, cols_, values
+
+
+def _build(shape: Tuple[int, int], rows_: list, cols_: list, values: list, sparse: bool, kind: Field.Fields) -> Union[Matrix.Matrix, SparseMatrix.SparseMatrix]:
+    field = Field.Field.create(kind)
+    if sparse:
+        return SparseMatrix.SparseMatrix.fromCOO(shape, rows_, cols_, values, field)
+    mat = [[0 for _ in range(shape[1])] for _ in range(shape[0])]
+    # duplicate coordinates are summed, as SparseMatrix.fromCOO does
+    for i, j, v in zip(rows_, cols_, values):
+        mat[i][j] += v
+    return Matrix.Matrix(mat, field=field)
+
+
+def _mm_value(tokens: list[str], width: int, field: Field.Fields):
+    if width == 0:
+        return 1
+    if width == 2:
+        return Complex(_parse(tokens[0], Field.Fields.R), _parse(tokens[1], Field.Fields.R))
+    return _parse(tokens[0], field)
+
+
+def _parse(token: str, field: Field.Fields = None):
+    """
+    will parse an entry as an element of 'field', or as the simplest kind of number it can be when field is None
+    """
+    if field == Field.Fields.C or (field is None and token[-1:] in ["j", "i"]):
+        value = complex(token.replace("i", "j").replace(" ", ""))
+        return Complex(value.real, value.imag)
+    if field == Field.Fields.Q or (field is None and "/" in token):
+        return Fraction(token)
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+
+def _format(value) -> str:
+    if isinstance(value, Complex):
+        return str(complex(value.real, value.imag)).strip("()")
+    return str(value)
+
+
+def _mm_format(value, value_type: str) -> str:
+    if value_type == "complex":
+        value = value if isinstance(value, Complex) else Complex(value, 0)
+        return f"{value.real} {value.imag}"
+    return str(value)
+
+
+def _kind(rows: list[list]) -> Field.Fields:
+    values = [v for row in rows for v in row]
+    if any(isinstance(v, Complex) for v in values):
+        return Field.Fields.C
+    if any(isinstance(v, Fraction) for v in values):
+        return Field.Fields.Q
+    return Field.Fields.R
+
+
+def _kind_name(values: Iterator) -> str:
+    res = "integer"
+    for v in values:
+        if isinstance(v, Complex):
+            return "complex"
+        if isinstance(v, Fraction) and v.denominator != 1:
+            res = "rational"
+        elif not isinstance(v, numbers.Integral) and res == "integer":
+            res = "real"
+    return res
+
+
+def _shape(mat: Union[Matrix.Matrix, SparseMatrix.SparseMatrix]) -> Tuple[int, int]:
+    if isinstance(mat, SparseMatrix.SparseMatrix):
+        return mat.shape
+    if isinstance(mat, Matrix.Matrix):
+        return len(mat), len(mat[0])
+    raise TypeError("can only write a Matrix or a SparseMatrix")
+
+
+def _entry(mat: Union[Matrix.Matrix, SparseMatrix.SparseMatrix], i: int, j: int):
+    if isinstance(mat, SparseMatrix.SparseMatrix):
+        return mat[i, j]
+    return mat[i][j]
+
+
+def _row(mat: Union[Matrix.Matrix, SparseMatrix.SparseMatrix], i: int, m: int) -> list:
+    if isinstance(mat, SparseMatrix.SparseMatrix):
+        row = [0 for _ in range(m)]
+        for j, v in mat.row(i).items():
+            row[j] = v
+        return row
+    return list(mat[i])
+
+
+def _entries(mat: Union[Matrix.Matrix, SparseMatrix.SparseMatrix]) -> Iterator[Tuple[int, int, object]]:
+    """
+    the (row, col, value) entries row by row, only the stored ones of a SparseMatrix
+    """
+    if isinstance(mat, SparseMatrix.SparseMatrix):
+        for i in range(mat.shape[0]):
+            for j, v in sorted(mat.row(i).items()):
+                yield i, j, v
+        return
+    for i in range(len(mat)):
+        for j, v in enumerate(mat[i]):
+            yield i, j, v
+
+
+def _lines(f: IO) -> Iterator[str]:
+    for line in f:
+        yield line.strip()
+
+
+def _data(lines: Iterator[str]) -> Iterator[str]:
+    """
+    the lines which hold data, without comments and empty lines
+    """
+    for line in lines:
+        if line and line[0] not in "%#":
+            yield line
+
+
+@contextmanager
+def _open(target: t_source, mode: str) -> Iterator[IO]:
+    if isinstance(target, str):
+        with open(target, mode, newline="" if mode == "w" else None) as f:
+            yield f
+    else:
+        yield target
@@ -0,0 +1,304 @@
+from __future__ import annotations
+from typing import Iterator, Tuple, Union
+from Complex import Complex
+from utils import isoneof
+import Backend
+from Backend import Backends
+import Matrix
+import Vector
+
+
+class MatrixStack:
+    """
+    N matrices of the same shape held in one contiguous buffer, one matrix after the other in row major order
+    (an ndarray of shape (N, rows, cols) with the NumPy backend).
+    determinant, inverse, solve and products run over the whole stack in one call, without creating
+    a Matrix (and its checks) per element
+    """
+    # pivots not larger than this are considered zero, the same threshold as utils.almost_equal
+    # both backends eliminate with partial pivoting and apply it, so they agree on which matrices are singular
+    SINGULAR_TOLERANCE = 1e-12
+
+    @staticmethod
+    def fromMatrices(matrices: list[Matrix.Matrix], backend: Backends = None) -> MatrixStack:
+        if len(matrices) == 0:
+            raise ValueError("can't create a stack of no matrices")
+        if not all(isinstance(m, Matrix.Matrix) for m in matrices):
+            raise TypeError("all elements must be instances of class 'Matrix'")
+        return MatrixStack.fromLists([[list(m[i]) for i in range(len(m))] for m in matrices], backend)
+
+    @staticmethod
+    def fromLists(matrices: list[list[list]], backend: Backends = None) -> MatrixStack:
+        """
+        will create a stack from a list of matrices given as lists of rows
+        """
+        if len(matrices) == 0:
+            raise ValueError("can't create a stack of no matrices")
+        rows, cols = len(matrices[0]), len(matrices[0][0])
+        buffer = []
+        for m in matrices:
+            if len(m) != rows or any(len(row) != cols for row in m):
+                raise ValueError("all matrices of a stack must have the same shape")
+            for row in m:
+                buffer.extend(row)
+        return MatrixStack(buffer, (len(matrices), rows, cols), backend)
+
+    def __init__(self, buffer: list, shape: Tuple[int, int, int], backend: Backends = None) -> None:
+        """
+        buffer: the N*rows*cols entries of all the matrices, one after the other in row major order
+        shape: (N, rows, cols)
+        """
+        count, rows, cols = shape
+        if len(buffer) != count*rows*cols:
+            raise ValueError("the buffer must hold N*rows*cols entries")
+        storage, self.backend = Backend.to_storage(buffer, backend)
+        if self.backend == Backends.NUMPY:
+            storage = storage.reshape(shape)
+        self.__buffer = storage
+        self.__count, self.__rows, self.__cols = count, rows, cols
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        return self.__count, self.__rows, self.__cols
+
+    @property
+    def is_square(self) -> bool:
+        return self.__rows == self.__cols
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def __getitem__(self, index: int) -> Matrix.Matrix:
+        if not -self.__count <= index < self.__count:
+            raise IndexError("MatrixStack index out of range")
+        if self.backend == Backends.NUMPY:
+            return Matrix.Matrix(self.__buffer[index].copy(), backend=Backends.NUMPY)
+        return Matrix.Matrix(self.__matrix_rows(index % self.__count))
+
+    def __iter__(self) -> Iterator[Matrix.Matrix]:
+        for i in range(self.__count):
+            yield self[i]
+
+    def toMatrices(self) -> list[Matrix.Matrix]:
+        return list(self)
+
+    def toLists(self) -> list[list[list]]:
+        if self.backend == Backends.NUMPY:
+            return self.__buffer.tolist()
+        return [self.__matrix_rows(i) for i in range(self.__count)]
+
+    @property
+    def determinant(self) -> list[Union[float, Complex]]:
+        """
+        the determinants of all the matrices, by elimination with partial pivoting
+        """
+        self.__check_square()
+        if self.backend == Backends.NUMPY:
+            return MatrixStack.__numpy_eliminate(self.__buffer.copy(), self.__rows, False).tolist()
+        return [MatrixStack.__eliminate(self.__matrix_rows(i), self.__rows, False)
+                for i in range(self.__count)]
+
+    def inverse(self) -> MatrixStack:
+        """
+        the inverses of all the matrices, raises ValueError if one of them is singular
+        """
+        self.__check_square()
+        n = self.__rows
+        if self.backend == Backends.NUMPY:
+            numpy = Backend.numpy
+            identity = numpy.broadcast_to(numpy.eye(n), self.__buffer.shape)
+            rows = numpy.concatenate([self.__buffer, identity], axis=2)
+            singular = numpy.flatnonzero(MatrixStack.__numpy_eliminate(rows, n, True) == 0)
+            if len(singular):
+                raise ValueError(f"matrix {singular[0]} of the stack is not invertible")
+            return MatrixStack.__fromArray(numpy.ascontiguousarray(rows[:, :, n:]))
+        buffer = []
+        for i in range(self.__count):
+            rows = [row + [1 if r == c else 0 for c in range(n)] for r, row in enumerate(self.__matrix_rows(i))]
+            if MatrixStack.__eliminate(rows, n, True) == 0:
+                raise ValueError(f"matrix {i} of the stack is not invertible")
+            for row in rows:
+                buffer.extend(row[n:])
+        return MatrixStack(buffer, self.shape)
+
+    def solve(self, vectors: Union[Vector.Vector, list]) -> list[Union[Vector.Vector, None]]:
+        """
+        will solve A_i*x = b_i for every matrix A_i of the stack, 'vectors' is either one right hand side
+        for all the matrices or a list of one per matrix. The solution of a singular matrix is None
+        """
+        self.__check_square()
+        n = self.__rows
+        if isinstance(vectors, Vector.Vector) or (isinstance(vectors, list) and not isoneof(vectors[0], [Vector.Vector, list])):
+            vectors = [vectors for _ in range(self.__count)]
+        if len(vectors) != self.__count:
+            raise ValueError("there must be one right hand side per matrix")
+        if any(len(b) != n for b in vectors):
+            raise ValueError(
+                "Vector must have the same length as the number of rows of the Matrix")
+        if self.backend == Backends.NUMPY:
+            numpy = Backend.numpy
+            rhs = numpy.asarray([list(b) for b in vectors], dtype=float).reshape(self.__count, n, 1)
+            rows = numpy.concatenate([self.__buffer, rhs], axis=2)
+            det = MatrixStack.__numpy_eliminate(rows, n, True)
+            return [None if d == 0 else Vector.Vector(x.tolist()) for d, x in zip(det, rows[:, :, n])]
+        res = []
+        for i, b in enumerate(vectors):
+            rows = [row + [v] for row, v in zip(self.__matrix_rows(i), b)]
+            if MatrixStack.__eliminate(rows, n, True) == 0:
+                res.append(None)
+            else:
+                res.append(Vector.Vector([row[n] for row in rows]))
+        return res
+
+    def __mul__(self, other: Union[float, Complex, Matrix.Matrix, MatrixStack]) -> MatrixStack:
+        """
+        a number scales every matrix, a Matrix multiplies every matrix from the right
+        and another stack of the same length is multiplied matrix by matrix
+        """
+        if isoneof(other, [int, float, Complex]):
+            if self.backend == Backends.NUMPY and isoneof(other, [int, float]):
+                return MatrixStack.__fromArray(self.__buffer*other)
+            return MatrixStack([v*other for v in self.__flat()], self.shape)
+        if isinstance(other, Matrix.Matrix):
+            right = [list(other[i]) for i in range(len(other))]
+            return self.__product(lambda i: right, len(other), len(other[0]))
+        if isinstance(other, MatrixStack):
+            if other.__count != self.__count:
+                raise ValueError("stacks must have the same number of matrices")
+            if self.backend == Backends.NUMPY and other.backend == Backends.NUMPY:
+                if self.__cols != other.__rows:
+                    raise ValueError(
+                        "Matrix and Matrix must have matching sizes: self.cols == other.rows")
+                return MatrixStack.__fromArray(self.__buffer @ other.__buffer)
+            return self.__product(other.__matrix_rows, other.__rows, other.__cols)
+        raise TypeError(
+            "MatrixStack can only be multiplied by a number, a Matrix or a MatrixStack")
+
+    def __rmul__(self, other: Union[float, Complex, Matrix.Matrix]) -> MatrixStack:
+        if isoneof(other, [int, float, Complex]):
+            return self.__mul__(other)
+        if isinstance(other, Matrix.Matrix):
+            if len(other[0]) != self.__rows:
+                raise ValueError(
+                    "Matrix and Matrix must have matching sizes: self.cols == other.rows")
+            left = [list(other[i]) for i in range(len(other))]
+            buffer = []
+            for i in range(self.__count):
+                columns = list(zip(*self.__matrix_rows(i)))
+                for row in left:
+                    buffer.extend([sum(x*y for x, y in zip(row, column)) for column in columns])
+            return MatrixStack(buffer, (self.__count, len(left), self.__cols))
+        raise TypeError(
+            "MatrixStack can only be multiplied by a number, a Matrix or a MatrixStack")
+
+    def __eq__(self, other: MatrixStack) -> bool:
+        if not isinstance(other, MatrixStack):
+            raise TypeError(f"cant complare 'MatrixStack' with '{type(other)}'")
+        return self.shape == other.shape and self.__flat() == other.__flat()
+
+    def __ne__(self, other) -> bool:
+        return not self.__eq__(other)
+
+    def __str__(self) -> str:
+        return "\n\n".join(str(m) for m in self)
+
+    def __product(self, right_rows, rows: int, cols: int) -> MatrixStack:
+        """
+        self[i] * right_rows(i) for every i, right_rows returns the rows of the right operand of matrix i
+        """
+        if self.__cols != rows:
+            raise ValueError(
+                "Matrix and Matrix must have matching sizes: self.cols == other.rows")
+        buffer = []
+        for i in range(self.__count):
+            columns = list(zip(*right_rows(i)))
+            for row in self.__matrix_rows(i):
+                buffer.extend([sum(x*y for x, y in zip(row, column)) for column in columns])
+        return MatrixStack(buffer, (self.__count, self.__rows, cols))
+
+    def __matrix_rows(self, index: int) -> list[list]:
+        """
+        a copy of the rows of matrix 'index'
+        """
+        if self.backend == Backends.NUMPY:
+            return self.__buffer[index].tolist()
+        r, c = self.__rows, self.__cols
+        start = index*r*c
+        return [self.__buffer[start+i*c:start+(i+1)*c] for i in range(r)]
+
+    def __flat(self) -> list:
+        if self.backend == Backends.NUMPY:
+            return self.__buffer.ravel().tolist()
+        return list(self.__buffer)
+
+    def __check_square(self) -> None:
+        if not self.is_square:
+            raise ValueError("Matrix must be square")
+
+    @staticmethod
+    def __fromArray(array) -> MatrixStack:
+        return MatrixStack(array.ravel(), array.shape, Backends.NUMPY)
+
+    @staticmethod
+    def __eliminate(rows: list[list], n: int, reduce: bool) -> Union[float, Complex]:
+        """
+        will eliminate the first n columns of 'rows' in place with partial pivoting and return the determinant
+        of the n x n block, when 'reduce' (and the block is not singular) the block is also reduced to the identity,
+        so the columns after it are transformed to the solution
+        """
+        det = 1
+        for k in range(n):
+            p = max(range(k, n), key=lambda i: abs(rows[i][k]))
+            pivot = rows[p][k]
+            if abs(pivot) <= MatrixStack.SINGULAR_TOLERANCE:
+                return 0
+            if p != k:
+                rows[k], rows[p] = rows[p], rows[k]
+                det = -det
+            det *= pivot
+            pivot_row = rows[k]
+            for i in range(k+1, n):
+                factor = rows[i][k]/pivot
+                if factor != 0:
+                    rows[i] = [x - factor*y for x, y in zip(rows[i], pivot_row)]
+        if reduce:
+            for k in range(n-1, -1, -1):
+                pivot = rows[k][k]
+                rows[k] = pivot_row = [v/pivot for v in rows[k]]
+                for i in range(k):
+                    factor = rows[i][k]
+                    if factor != 0:
+                        rows[i] = [x - factor*y for x, y in zip(rows[i], pivot_row)]
+        return det
+
+    @staticmethod
+    def __numpy_eliminate(rows, n: int, reduce: bool):
+        """
+        __eliminate for all the matrices of an (N, n, m) ndarray at once, in place: one pivot column of every
+        matrix per step, with the same pivoting and tolerance. returns the ndarray of the determinants
+        (0 for the singular matrices, whose rows are left partly eliminated)
+        """
+        numpy = Backend.numpy
+        index = numpy.arange(len(rows))
+        det = numpy.ones(len(rows))
+        singular = numpy.zeros(len(rows), dtype=bool)
+        for k in range(n):
+            p = k + numpy.argmax(numpy.abs(rows[:, k:n, k]), axis=1)
+            pivot_rows = rows[index, p].copy()
+            rows[index, p] = rows[:, k]
+            rows[:, k] = pivot_rows
+            pivot = pivot_rows[:, k]
+            small = numpy.abs(pivot) <= MatrixStack.SINGULAR_TOLERANCE
+            singular |= small
+            det *= numpy.where(p != k, -pivot, pivot)
+            # a negligible pivot is replaced by 1, its matrix is singular and the values only have to stay finite
+            pivot = numpy.where(small, 1.0, pivot)
+            factors = rows[:, k+1:n, k] / pivot[:, None]
+            rows[:, k+1:n] -= factors[:, :, None] * pivot_rows[:, None, :]
+        if reduce:
+            for k in range(n-1, -1, -1):
+                pivot = numpy.where(singular, 1.0, rows[:, k, k])
+                rows[:, k] /= pivot[:, None]
+                rows[:, :k] -= rows[:, :k, k, None] * rows[:, k, None, :]
+        det[singular] = 0
+        return det
@@ -0,0 +1,139 @@
+from __future__ import annotations
+from operator import mul
+from typing import Tuple
+import random
+import time
+
+# rows and columns per tile of the blocked kernel
+TILE = 32
+# products whose dimensions are all atleast this use Strassen-Winograd, None turns it off
+_strassen_threshold = 512
+
+
+def get_strassen_threshold() -> int:
+    return _strassen_threshold
+
+
+def set_strassen_threshold(threshold: int = None) -> None:
+    """
+    will set the smallest dimension from which products use Strassen-Winograd, None turns it off
+    """
+    global _strassen_threshold
+    if threshold is not None:
+        if not isinstance(threshold, int):
+            raise TypeError("'threshold' must be an int")
+        if threshold < 2:
+            raise ValueError("'threshold' must be atleast 2")
+    _strassen_threshold = threshold
+
+
+def multiply(a: list[list], b: list[list]) -> list[list]:
+    """
+    a * b for matrices stored as lists of rows, Strassen-Winograd above the threshold and the blocked kernel below it
+    """
+    if _strassen_threshold is not None and min(len(a), len(b), len(b[0])) >= _strassen_threshold:
+        return strassen(a, b, _strassen_threshold)
+    return blocked(a, b)
+
+
+def blocked(a: list[list], b: list[list], tile: int = TILE) -> list[list]:
+    """
+    a * b with b transposed once, so every entry is the dot product of two contiguous lists,
+    computed tile by tile (rows of a times columns of b) so the columns of a tile are reused by all its rows
+    """
+    columns = [list(column) for column in zip(*b)]
+    res = [[0 for _ in range(len(columns))] for _ in range(len(a))]
+    for r0 in range(0, len(a), tile):
+        rows = a[r0:r0+tile]
+        for c0 in range(0, len(columns), tile):
+            block = columns[c0:c0+tile]
+            for row, out in zip(rows, res[r0:r0+tile]):
+                out[c0:c0+tile] = [sum(map(mul, row, column)) for column in block]
+    return res
+
+
+def strassen(a: list[list], b: list[list], threshold: int = None) -> list[list]:
+    """
+    a * b with the Winograd variant of Strassen's algorithm: 7 products of half size and 15 additions per level,
+    odd dimensions are padded with a zero row / column. Recursion stops below 'threshold' (default: the module threshold)
+    where the blocked kernel is used. Floating point results may differ from the classic product in the last bits
+    """
+    if threshold is None:
+        threshold = _strassen_threshold or 2
+    m, k, n = len(a), len(b), len(b[0])
+    if min(m, k, n) < max(threshold, 2):
+        return blocked(a, b)
+    a = _pad(a, m + m % 2, k + k % 2)
+    b = _pad(b, k + k % 2, n + n % 2)
+    a11, a12, a21, a22 = _split(a)
+    b11, b12, b21, b22 = _split(b)
+    s1 = _add(a21, a22)
+    s2 = _sub(s1, a11)
+    s3 = _sub(a11, a21)
+    s4 = _sub(a12, s2)
+    t1 = _sub(b12, b11)
+    t2 = _sub(b22, t1)
+    t3 = _sub(b22, b12)
+    t4 = _sub(t2, b21)
+    m1 = strassen(a11, b11, threshold)
+    m2 = strassen(a12, b21, threshold)
+    m3 = strassen(s4, b22, threshold)
+    m4 = strassen(a22, t4, threshold)
+    m5 = strassen(s1, t1, threshold)
+    m6 = strassen(s2, t2, threshold)
+    m7 = strassen(s3, t3, threshold)
+    u2 = _add(m1, m6)
+    u3 = _add(u2, m7)
+    u4 = _add(u2, m5)
+    c11 = _add(m1, m2)
+    c12 = _add(u4, m3)
+    c21 = _sub(u3, m4)
+    c22 = _add(u3, m5)
+    res = [r1 + r2 for r1, r2 in zip(c11, c12)] + [r1 + r2 for r1, r2 in zip(c21, c22)]
+    return [row[:n] for row in res[:m]]
+
+
+def autotune(sizes: Tuple[int, ...] = (32, 64, 128, 256, 512), repetitions: int = 1) -> int:
+    """
+    will time one level of Strassen-Winograd against the blocked kernel for growing sizes on this host and
+    set the threshold to the first size where Strassen-Winograd is faster (None when it never is), returns it
+    """
+    threshold = None
+    for n in sizes:
+        a = [[random.random() for _ in range(n)] for _ in range(n)]
+        b = [[random.random() for _ in range(n)] for _ in range(n)]
+        classic, fast = 0, 0
+        for _ in range(repetitions):
+            start = time.perf_counter()
+            blocked(a, b)
+            classic += time.perf_counter()-start
+            start = time.perf_counter()
+            # the halves are below the threshold, so this is exactly one level
+            strassen(a, b, n)
+            fast += time.perf_counter()-start
+        if fast < classic:
+            threshold = n
+            break
+    set_strassen_threshold(threshold)
+    return threshold
+
+
+def _pad(a: list[list], rows: int, cols: int) -> list[list]:
+    if len(a) == rows and len(a[0]) == cols:
+        return a
+    res = [list(row) + [0 for _ in range(cols-len(row))] for row in a]
+    return res + [[0 for _ in range(cols)] for _ in range(rows-len(a))]
+
+
+def _split(a: list[list]) -> Tuple[list[list], list[list], list[list], list[list]]:
+    h, w = len(a)//2, len(a[0])//2
+    return [row[:w] for row in a[:h]], [row[w:] for row in a[:h]], \
+        [row[:w] for row in a[h:]], [row[w:] for row in a[h:]]
+
+
+def _add(a: list[list], b: list[list]) -> list[list]:
+    return [[x + y for x, y in zip(r1, r2)] for r1, r2 in zip(a, b)]
+
+
+def _sub(a: list[list], b: list[list]) -> list[list]:
+    return [[x - y for x, y in zip(r1, r2)] for r1, r2 in zip(a, b)]
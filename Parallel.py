@@ -0,0 +1,128 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from operator import mul
+from typing import Tuple
+import atexit
+import os
+
+_enabled = False
+_workers = os.cpu_count() or 1
+# work (scalar multiplications) under which a product stays serial, the cost of
+# sending the operands to the worker processes is only recovered by large products
+_threshold = 1_000_000
+_pool = None
+_pool_workers = 0
+
+
+def enable(workers: int = None, threshold: int = None) -> None:
+    """
+    will make large list backed products of Matrix run on a process pool.
+    guassian_elimination stays serial: every pivot depends on the previous one, so the rows would have
+    to be sent to the workers and back once per pivot, which costs more than the updates themselves
+    """
+    global _enabled
+    if workers is not None:
+        set_workers(workers)
+    if threshold is not None:
+        set_threshold(threshold)
+    _enabled = True
+
+
+def disable() -> None:
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def get_workers() -> int:
+    return _workers
+
+
+def set_workers(workers: int) -> None:
+    global _workers
+    if not isinstance(workers, int):
+        raise TypeError("'workers' must be an int")
+    if workers < 1:
+        raise ValueError("'workers' must be positive")
+    _workers = workers
+
+
+def get_threshold() -> int:
+    return _threshold
+
+
+def set_threshold(threshold: int) -> None:
+    """
+    will set the amount of work (scalar multiplications) from which an operation runs in parallel
+    """
+    global _threshold
+    if not isinstance(threshold, int):
+        raise TypeError("'threshold' must be an int")
+    if threshold < 0:
+        raise ValueError("'threshold' can't be negative")
+    _threshold = threshold
+
+
+def should_parallelize(work: int) -> bool:
+    return _enabled and work >= _threshold
+
+
+def shutdown() -> None:
+    """
+    will stop the worker processes, they are started again by the next parallel operation
+    """
+    global _pool, _pool_workers
+    if _pool is not None:
+        _pool.shutdown()
+    _pool, _pool_workers = None, 0
+
+
+atexit.register(shutdown)
+
+
+def multiply(a: list[list], b: list[list]) -> list[list]:
+    """
+    a * b for matrices stored as lists of rows, the product is split into tiles
+    (row blocks of a times column blocks of b) which are computed by the worker processes
+    """
+    columns = [list(column) for column in zip(*b)]
+    row_parts = min(len(a), _workers)
+    column_parts = min(len(columns), -(-_workers // row_parts))
+    row_blocks, column_blocks = _blocks(len(a), row_parts), _blocks(len(columns), column_parts)
+    pool = _executor()
+    futures = [[pool.submit(_multiply_tile, a[r0:r1], columns[c0:c1]) for c0, c1 in column_blocks]
+               for r0, r1 in row_blocks]
+    res = []
+    for tiles in futures:
+        tiles = [future.result() for future in tiles]
+        res.extend([value for tile in tiles for value in tile[i]] for i in range(len(tiles[0])))
+    return res
+
+
+def _executor() -> ProcessPoolExecutor:
+    global _pool, _pool_workers
+    if _pool is None or _pool_workers != _workers:
+        shutdown()
+        _pool, _pool_workers = ProcessPoolExecutor(max_workers=_workers), _workers
+    return _pool
+
+
+def _blocks(n: int, parts: int) -> list[Tuple[int, int]]:
+    """
+    will split range(n) into at most 'parts' contiguous (start, stop) blocks of nearly equal size
+    """
+    parts = max(1, min(n, parts))
+    size, extra = divmod(n, parts)
+    res, start = [], 0
+    for i in range(parts):
+        stop = start + size + (1 if i < extra else 0)
+        res.append((start, stop))
+        start = stop
+    return res
+
+
+def _multiply_tile(rows: list[list], columns: list[list]) -> list[list]:
+    return [[sum(map(mul, row, column)) for column in columns] for row in rows]
@@ -0,0 +1,155 @@
+from __future__ import annotations
+from fractions import Fraction
+from typing import Tuple, Union
+from Complex import Complex
+from utils import isoneof
+import Matrix
+import Span
+import Vector
+
+
+class RowEchelon:
+    """
+    Reduced row echelon form R of a matrix A and its pivot columns, rank, kernel and image are read from it.
+    The row operations E (E*A = R) are recorded by reducing [A | I] once, the first time a system is solved,
+    after which A*x = b is solved for any b by a product with E.
+    Exact matrices are reduced exactly with 'Fraction', all others (integer ones included) in floating point
+    """
+    # relative size under which a floating point entry is considered zero
+    TOLERANCE = 1e-10
+
+    def __init__(self, mat: Matrix.Matrix) -> None:
+        if not isinstance(mat, Matrix.Matrix):
+            raise TypeError("can only reduce a 'Matrix'")
+        n, m = len(mat), len(mat[0])
+        values = [v for i in range(n) for v in mat[i]]
+        self.exact = mat.exact
+        self.__rows = [[RowEchelon._internal(v, self.exact) for v in mat[i]] for i in range(n)]
+        tol = 0 if self.exact else RowEchelon.TOLERANCE*max([abs(v) for v in values] + [1.0])
+        self.__reduced, self.__pivots = RowEchelon._reduce(self.__rows, tol, m)
+        self.__transform = None
+        self.__matrix = mat
+        self.__cols = m
+        self.__tolerance = tol
+
+    @property
+    def rank(self) -> int:
+        return len(self.__pivots)
+
+    @property
+    def nullity(self) -> int:
+        return self.__cols - self.rank
+
+    @property
+    def pivots(self) -> list[int]:
+        return list(self.__pivots)
+
+    @property
+    def reduced(self) -> Matrix.Matrix:
+        return Matrix.Matrix([[RowEchelon._output(v) for v in row] for row in self.__reduced])
+
+    @property
+    def kernel(self) -> Span.Span:
+        """
+        a basis of {x : A*x = 0}, one vector per free column
+        """
+        basis = RowEchelon._kernel_basis(self.__reduced, self.__pivots, self.__cols)
+        return Span.Span([Vector.Vector([RowEchelon._output(v) for v in vec]) for vec in basis])
+
+    @property
+    def image(self) -> Span.Span:
+        """
+        a basis of the column space: the columns of A in which R has its pivots
+        """
+        return Span.Span([Vector.Vector([self.__matrix[i][c] for i in range(len(self.__matrix))])
+                          for c in self.__pivots])
+
+    def solve(self, vec: Union[Vector.Vector, list]) -> Union[Vector.Vector, Tuple[Vector.Vector, Span.Span], None]:
+        """
+        will solve A*x = vec:
+            None if there is no solution
+            a Vector if the solution is unique
+            otherwise the affine solution set (particular, kernel): a particular solution and a Span of the kernel,
+            every solution is particular + t1*k1 + ... + tn*kn
+        """
+        if not isoneof(vec, [Vector.Vector, list]):
+            raise TypeError("Matrix must be solved for a vector")
+        if len(vec) != len(self.__rows):
+            raise ValueError(
+                "Vector must have the same length as the number of rows of the Matrix")
+        if self.__transform is None:
+            n = len(self.__rows)
+            augmented = [row + [1 if i == j else 0 for j in range(n)] for i, row in enumerate(self.__rows)]
+            reduced, _ = RowEchelon._reduce(augmented, self.__tolerance, self.__cols)
+            self.__transform = [row[self.__cols:] for row in reduced]
+        b = [RowEchelon._internal(v, self.exact) for v in vec]
+        c = [sum(e*v for e, v in zip(row, b)) for row in self.__transform]
+        tol = 0 if self.exact else max(self.__tolerance, RowEchelon.TOLERANCE*max([abs(v) for v in b] + [1.0]))
+        if any(abs(v) > tol for v in c[self.rank:]):
+            return None
+        x = [0 for _ in range(self.__cols)]
+        for i, p in enumerate(self.__pivots):
+            x[p] = c[i]
+        particular = Vector.Vector([RowEchelon._output(v) for v in x])
+        if self.nullity == 0:
+            return particular
+        return particular, self.kernel
+
+    @staticmethod
+    def _reduce(rows: list[list], tol: float, pivot_cols: int = None) -> Tuple[list[list], list[int]]:
+        """
+        reduces 'rows' to reduced row echelon form with partial pivoting, pivoting only on the first
+        'pivot_cols' columns, entries not larger than 'tol' count as zero. returns the rows and pivot columns
+        """
+        if pivot_cols is None:
+            pivot_cols = len(rows[0]) if rows else 0
+        rows = [list(row) for row in rows]
+        pivots = []
+        r = 0
+        for c in range(pivot_cols):
+            if r == len(rows):
+                break
+            p = max(range(r, len(rows)), key=lambda i: abs(rows[i][c]))
+            if abs(rows[p][c]) <= tol:
+                continue
+            rows[r], rows[p] = rows[p], rows[r]
+            pivot = rows[r][c]
+            rows[r] = pivot_row = [v/pivot for v in rows[r]]
+            for i in range(len(rows)):
+                if i != r and rows[i][c] != 0:
+                    factor = rows[i][c]
+                    rows[i] = [x - factor*y for x, y in zip(rows[i], pivot_row)]
+                    rows[i][c] = 0
+            pivots.append(c)
+            r += 1
+        return rows, pivots
+
+    @staticmethod
+    def _kernel_basis(rows: list[list], pivots: list[int], cols: int) -> list[list]:
+        """
+        the kernel of a matrix in reduced row echelon form, a vector for each free column
+        """
+        basis = []
+        for free in [c for c in range(cols) if c not in pivots]:
+            v = [0 for _ in range(cols)]
+            v[free] = 1
+            for i, c in enumerate(pivots):
+                v[c] = -rows[i][free]
+            basis.append(v)
+        return basis
+
+    @staticmethod
+    def _internal(value, exact: bool):
+        if exact:
+            return Fraction(value)
+        if isinstance(value, Complex):
+            return complex(value.real, value.imag)
+        return value
+
+    @staticmethod
+    def _output(value):
+        if isinstance(value, complex):
+            return Complex(value.real, value.imag)
+        if isinstance(value, Fraction) and value.denominator == 1:
+            return value.numerator
+        return value
@@ -0,0 +1,208 @@
+"""
+versioned binary format (all little endian):
+    header of HEADER.size (48) bytes:
+        magic b"LABF", format version (uint16), kind (uint8), dtype (uint8), field name (1 byte, b"-" for none),
+        flags (uint8, bit 0: exact Matrix), field degree, field modulu, rows, cols (uint64 each)
+    payload right after the header, aligned to 8 bytes:
+        Matrix           - rows*cols entries in row major order
+        Vector           - rows entries (cols is 1)
+        Span             - the rows vectors of length cols, one after the other
+        SimplePolynomial - rows int64 powers followed by the rows prefixes
+    dtypes: 'q' int64, 'd' float64, 'D' complex128 (real, imag float64 pairs), 'r' rational (numerator, denominator int64 pairs)
+"""
+from __future__ import annotations
+from array import array
+from fractions import Fraction
+from typing import Any, Union
+import numbers
+import struct
+import sys
+from Complex import Complex
+import Backend
+from Backend import Backends
+import Field
+import Matrix
+import SimplePolynomial
+import Span
+import Vector
+
+MAGIC = b"LABF"
+VERSION = 1
+HEADER = struct.Struct("<4sHBBcB2xQQQQ4x")
+MATRIX, VECTOR, SPAN, POLYNOMIAL = 1, 2, 3, 4
+FLAG_EXACT = 1
+# bytes per entry of every dtype
+_sizes = {"q": 8, "d": 8, "D": 16, "r": 16}
+_int64 = (-2**63, 2**63-1)
+
+
+def dumps(obj: Union[Matrix.Matrix, Vector.Vector, Span.Span, SimplePolynomial.SimplePolynomial]) -> bytes:
+    """
+    will serialize 'obj' to bytes, the entries are packed by one array conversion (NumPy storage is copied as is)
+    """
+    flags = 0
+    if isinstance(obj, Matrix.Matrix):
+        kind, field, rows, cols = MATRIX, obj.field, len(obj), len(obj[0])
+        flags = FLAG_EXACT if obj.exact else 0
+        if obj.backend == Backends.NUMPY:
+            return _header(kind, "d", field, flags, rows, cols) + _numpy_bytes(obj)
+        values = [v for i in range(rows) for v in obj[i]]
+    elif isinstance(obj, Vector.Vector):
+        kind, field, rows, cols = VECTOR, obj.field, obj.length, 1
+        if obj.backend == Backends.NUMPY:
+            return _header(kind, "d", field, flags, rows, cols) + _numpy_bytes(obj)
+        values = list(obj)
+    elif isinstance(obj, Span.Span):
+        vectors = obj.vectors
+        kind, field = SPAN, obj.field if vectors else None
+        rows, cols = len(vectors), vectors[0].length if vectors else 0
+        values = [v for vec in vectors for v in vec]
+    elif isinstance(obj, SimplePolynomial.SimplePolynomial):
+        kind, field, rows, cols = POLYNOMIAL, None, len(obj.powers), 1
+        dtype = _dtype(obj.prefixes)
+        return _header(kind, dtype, field, flags, rows, cols) + _pack(_powers(obj.powers), "q") + _pack(obj.prefixes, dtype)
+    else:
+        raise TypeError(
+            "can only serialize a Matrix, Vector, Span or SimplePolynomial")
+    dtype = _dtype(values)
+    return _header(kind, dtype, field, flags, rows, cols) + _pack(values, dtype)
+
+
+def loads(data: Union[bytes, bytearray, memoryview]) -> Union[Matrix.Matrix, Vector.Vector, Span.Span, SimplePolynomial.SimplePolynomial]:
+    """
+    will read an object written by dumps, the payload is read in place through a memoryview
+    (with the NumPy backend a float matrix or vector is a copy of the payload made by one memcpy,
+    so it never changes with the buffer it was read from)
+    """
+    view = memoryview(data).cast("B")
+    if len(view) < HEADER.size:
+        raise ValueError("not enough bytes for a header")
+    magic, version, kind, dtype, field_name, flags, degree, modulu, rows, cols = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError("not a serialized linear algebra object")
+    if version > VERSION:
+        raise ValueError(f"unsupported format version {version}")
+    dtype = chr(dtype)
+    if dtype not in _sizes:
+        raise ValueError(f"unknown dtype '{dtype}'")
+    field = None if field_name == b"-" else Field.Field.create(Field.Fields(field_name.decode()), degree, modulu)
+    count = rows*cols
+    offset = HEADER.size
+    if len(view) < offset + count*_sizes[dtype] + (8*rows if kind == POLYNOMIAL else 0):
+        raise ValueError("the payload is shorter than the header says")
+    if kind == POLYNOMIAL:
+        powers = _unpack(view, offset, "q", rows)
+        prefixes = _unpack(view, offset+8*rows, dtype, rows)
+        return SimplePolynomial.SimplePolynomial(prefixes, powers) if rows else SimplePolynomial.SimplePolynomial([0], [])
+    if kind == MATRIX:
+        exact = bool(flags & FLAG_EXACT)
+        if dtype == "d" and Backend.resolve() == Backends.NUMPY:
+            return Matrix.Matrix(_numpy_array(view, offset, count).reshape(rows, cols), field=field,
+                                 backend=Backends.NUMPY, exact=exact)
+        values = _unpack(view, offset, dtype, count)
+        return Matrix.Matrix([values[i*cols:(i+1)*cols] for i in range(rows)], field=field, exact=exact)
+    if kind == VECTOR:
+        if dtype == "d" and Backend.resolve() == Backends.NUMPY:
+            return Vector.Vector(_numpy_array(view, offset, count), field, backend=Backends.NUMPY)
+        return Vector.Vector(_unpack(view, offset, dtype, count), field)
+    if kind == SPAN:
+        values = _unpack(view, offset, dtype, count)
+        return Span.Span([Vector.Vector(values[i*cols:(i+1)*cols], field) for i in range(rows)])
+    raise ValueError(f"unknown kind {kind}")
+
+
+def save(obj: Union[Matrix.Matrix, Vector.Vector, Span.Span, SimplePolynomial.SimplePolynomial], path: str) -> None:
+    with open(path, "wb") as f:
+        f.write(dumps(obj))
+
+
+def load(path: str) -> Union[Matrix.Matrix, Vector.Vector, Span.Span, SimplePolynomial.SimplePolynomial]:
+    """
+    will read the file into one buffer and load from it
+    """
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def _header(kind: int, dtype: str, field: Field.Field, flags: int, rows: int, cols: int) -> bytes:
+    if field is None:
+        return HEADER.pack(MAGIC, VERSION, kind, ord(dtype), b"-", flags, 0, 0, rows, cols)
+    if field._name not in [Field.Fields.Q, Field.Fields.R, Field.Fields.C]:
+        raise TypeError("only objects over Q, R or C can be serialized")
+    return HEADER.pack(MAGIC, VERSION, kind, ord(dtype), field._name.value.encode(), flags,
+                       field._degree, field._modulu, rows, cols)
+
+
+def _dtype(values: list) -> str:
+    """
+    the narrowest dtype which holds all the values exactly
+    """
+    if all(isinstance(v, numbers.Integral) and _int64[0] <= v <= _int64[1] for v in values):
+        return "q"
+    if all(isinstance(v, numbers.Rational) for v in values):
+        if all(_int64[0] <= v.numerator <= _int64[1] and v.denominator <= _int64[1] for v in values):
+            return "r"
+        raise ValueError("rational entries must fit in 64 bit integers")
+    if all(isinstance(v, numbers.Real) for v in values):
+        return "d"
+    if all(isinstance(v, (numbers.Real, numbers.Complex, Complex)) for v in values):
+        return "D"
+    raise TypeError("only integer, rational, real and complex entries can be serialized")
+
+
+def _powers(powers: list) -> list[int]:
+    """
+    the powers of a polynomial as int, parsed polynomials hold integral floats (e.g. 2.0)
+    """
+    res = []
+    for p in powers:
+        if not isinstance(p, numbers.Integral):
+            if not isinstance(p, numbers.Real) or not float(p).is_integer():
+                raise ValueError(f"only polynomials with integer powers can be serialized, got {p}")
+            p = int(p)
+        res.append(p)
+    return res
+
+
+def _pack(values: list, dtype: str) -> bytes:
+    if dtype == "D":
+        values = [part for v in values for part in (v.real, v.imag)]
+        dtype = "d"
+    elif dtype == "r":
+        values = [part for v in values for part in (v.numerator, v.denominator)]
+        dtype = "q"
+    elif dtype == "d":
+        values = [float(v) for v in values]
+    packed = array(dtype, values)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpack(view: memoryview, offset: int, dtype: str, count: int) -> list:
+    code = "d" if dtype == "D" else "q" if dtype == "r" else dtype
+    length = count*_sizes[dtype]
+    payload = view[offset:offset+length]
+    if sys.byteorder == "little":
+        values = payload.cast(code).tolist()
+    else:
+        values = array(code)
+        values.frombytes(payload)
+        values.byteswap()
+        values = values.tolist()
+    if dtype == "D":
+        return [Complex(values[i], values[i+1]) for i in range(0, len(values), 2)]
+    if dtype == "r":
+        return [Fraction(values[i], values[i+1]) for i in range(0, len(values), 2)]
+    return values
+
+
+def _numpy_array(view: memoryview, offset: int, count: int) -> Any:
+    """
+    a writable float64 copy of the payload, a view of a writable buffer would go stale in the cached results
+    """
+    return Backend.numpy.frombuffer(view, dtype="<f8", count=count, offset=offset).copy()
+
+
+def _numpy_bytes(values: Any) -> bytes:
+    return Backend.numpy.ascontiguousarray(values, dtype="<f8").tobytes()
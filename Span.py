@@ -42,7 +42,7 @@ class Span:
                     raise ValueError(
                         "Span can only be created from vectors of the same field")
         self.vectors = base
-        if not are_operators_implemnted(type(self.vectors[0])):
+        if base != [] and not are_operators_implemnted(type(self.vectors[0])):
             raise AttributeError(
                 "Not all required operators are implemented for the class of the objects")
 
@@ -114,9 +114,10 @@ class Span:
         if not isinstance(vector, Vector.Vector):
             raise TypeError(
                 "can only check containment of objects of type 'Vector'")
+        if len(self.vectors) == 0:
+            return not vector.has_no_zero
         from Matrix import Matrix
-        Matrix.fromSpan(self, vector)
-        return False
+        return Matrix.fromVectors(self.vectors).row_echelon.solve(vector) is not None
 
     def append(self, vec: Vector.Vector) -> None:
         self.vectors.append(vec)
@@ -125,12 +126,11 @@ class Span:
         result = [self[0].toOrthonormal()]
         from InnerProduct import StandardInnerProduct as sip
         for i in range(1, len(self.vectors)):
-            current = self[i]
-            curr_tag = Vector.Vector([0 for _ in range(self[0].length)])
+            current = self[i].copy()
             for prev in result:
-                curr_tag = curr_tag+sip(prev, current) * prev
-            current = current-curr_tag
-            result.append(current.toOrthonormal())
+                current.axpy(-sip(prev, self[i]), prev)
+            current *= 1/current.norm()
+            result.append(current)
         return Span(result)
 
     def projection_of(self, v: Vector.Vector) -> Vector.Vector:
@@ -0,0 +1,315 @@
+from __future__ import annotations
+from typing import Tuple, Union
+from Complex import Complex
+from utils import almost_equal, areinstances, check_foreach, isoneof
+import Field
+import Matrix
+import Vector
+
+
+class SparseMatrix:
+    """
+    A matrix that only stores its non zero entries.
+    The entries are kept in CSR (compressed sparse row) form:
+        data[indptr[i]:indptr[i+1]] are the values of row i and indices[indptr[i]:indptr[i+1]] their columns
+    COO (coordinate) triplets can be used to build and export the matrix with fromCOO / toCOO
+    """
+
+    @staticmethod
+    def fromCOO(shape: Tuple[int, int], rows: list[int], cols: list[int], values: list, field: Field.Field = None) -> SparseMatrix:
+        """
+        will create a sparse matrix from (row, col, value) triplets given as three lists
+        the triplets may come in any order, duplicates are summed
+        """
+        if not len(rows) == len(cols) == len(values):
+            raise ValueError("rows, cols and values must have the same length")
+        n, m = shape
+        by_row: list[dict] = [{} for _ in range(n)]
+        for r, c, v in zip(rows, cols, values):
+            if not (0 <= r < n and 0 <= c < m):
+                raise ValueError("Row or column index out of range")
+            row = by_row[r]
+            row[c] = row.get(c, 0) + v
+        return SparseMatrix._fromRowDicts(shape, by_row, field)
+
+    @staticmethod
+    def fromMatrix(m: Matrix.Matrix) -> SparseMatrix:
+        if not isinstance(m, Matrix.Matrix):
+            raise TypeError("m must be of type 'Matrix'")
+        indptr, indices, data = [0], [], []
+        for i in range(len(m)):
+            for j, v in enumerate(m[i]):
+                if v != 0:
+                    indices.append(j)
+                    data.append(v)
+            indptr.append(len(data))
+        return SparseMatrix((len(m), len(m[0])), indptr, indices, data, m.field)
+
+    @staticmethod
+    def fromVectors(vecs: list[Vector.Vector]) -> SparseMatrix:
+        """
+        will create a sparse matrix from the vectors in the order they appear and as columns
+        """
+        if not areinstances(vecs, Vector.Vector):
+            raise TypeError("all elements must be instances of class 'Vector'")
+        if not check_foreach(vecs, lambda v: v.field == vecs[0].field):
+            raise ValueError("vectors are not over the same field")
+        rows, cols, values = [], [], []
+        for j, vec in enumerate(vecs):
+            for i, v in enumerate(vec):
+                if v != 0:
+                    rows.append(i)
+                    cols.append(j)
+                    values.append(v)
+        return SparseMatrix.fromCOO((vecs[0].length, len(vecs)), rows, cols, values)
+
+    @staticmethod
+    def id_matrix(size: int) -> SparseMatrix:
+        return SparseMatrix((size, size), list(range(size+1)), list(range(size)), [1 for _ in range(size)])
+
+    @staticmethod
+    def _fromRowDicts(shape: Tuple[int, int], rows: list[dict], field: Field.Field = None) -> SparseMatrix:
+        indptr, indices, data = [0], [], []
+        for row in rows:
+            for c in sorted(row):
+                if row[c] != 0:
+                    indices.append(c)
+                    data.append(row[c])
+            indptr.append(len(data))
+        return SparseMatrix(shape, indptr, indices, data, field)
+
+    def __init__(self, shape: Tuple[int, int], indptr: list[int], indices: list[int], data: list, field: Field.Field = None) -> None:
+        """
+        creates a sparse matrix directly from its CSR arrays
+        """
+        if field is None:
+            field = Field.DefaultRealField
+        if len(indptr) != shape[0]+1:
+            raise ValueError("indptr must have one more entry than rows")
+        if len(indices) != len(data) or indptr[-1] != len(data):
+            raise ValueError("indices and data must match indptr")
+        self.__rows, self.__cols = shape
+        self.__indptr = indptr
+        self.__indices = indices
+        self.__data = data
+        self.field = field
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.__rows, self.__cols
+
+    @property
+    def nnz(self) -> int:
+        """
+        the number of stored (non zero) entries
+        """
+        return len(self.__data)
+
+    @property
+    def is_square(self) -> bool:
+        return self.__rows == self.__cols
+
+    def __str__(self) -> str:
+        return str(self.toMatrix())
+
+    def __len__(self) -> int:
+        return self.__rows
+
+    def __getitem__(self, index: Tuple[int, int]) -> Union[float, Complex]:
+        if not isinstance(index, tuple) or len(index) != 2:
+            raise TypeError("Index must be a (row, col) tuple")
+        i, j = index
+        if not (0 <= i < self.__rows and 0 <= j < self.__cols):
+            raise IndexError("Row or column index out of range")
+        for p in range(self.__indptr[i], self.__indptr[i+1]):
+            if self.__indices[p] == j:
+                return self.__data[p]
+        return 0
+
+    def __eq__(self, other: SparseMatrix) -> bool:
+        if not isinstance(other, SparseMatrix):
+            raise TypeError(
+                f"cant complare 'SparseMatrix' with '{type(other)}'")
+        return self.shape == other.shape and self.__indptr == other.__indptr and \
+            self.__indices == other.__indices and self.__data == other.__data
+
+    def __ne__(self, other) -> bool:
+        return not self.__eq__(other)
+
+    def row(self, index: int) -> dict:
+        """
+        will return the non zero entries of a row as {col: value}
+        """
+        start, end = self.__indptr[index], self.__indptr[index+1]
+        return dict(zip(self.__indices[start:end], self.__data[start:end]))
+
+    def toCOO(self) -> Tuple[list[int], list[int], list]:
+        """
+        will return the (rows, cols, values) triplet lists of the non zero entries, ordered by row
+        """
+        rows = []
+        for i in range(self.__rows):
+            rows.extend([i]*(self.__indptr[i+1]-self.__indptr[i]))
+        return rows, list(self.__indices), list(self.__data)
+
+    def toMatrix(self) -> Matrix.Matrix:
+        mat = [[0 for _ in range(self.__cols)] for _ in range(self.__rows)]
+        for i in range(self.__rows):
+            row = mat[i]
+            for p in range(self.__indptr[i], self.__indptr[i+1]):
+                row[self.__indices[p]] = self.__data[p]
+        return Matrix.Matrix(mat, field=self.field)
+
+    def transpose(self) -> SparseMatrix:
+        counts = [0 for _ in range(self.__cols+1)]
+        for c in self.__indices:
+            counts[c+1] += 1
+        for c in range(self.__cols):
+            counts[c+1] += counts[c]
+        indptr = list(counts)
+        indices = [0 for _ in range(self.nnz)]
+        data = [0 for _ in range(self.nnz)]
+        for i in range(self.__rows):
+            for p in range(self.__indptr[i], self.__indptr[i+1]):
+                c = self.__indices[p]
+                dst = counts[c]
+                indices[dst] = i
+                data[dst] = self.__data[p]
+                counts[c] += 1
+        return SparseMatrix((self.__cols, self.__rows), indptr, indices, data, self.field)
+
+    def __neg__(self) -> SparseMatrix:
+        return self.__mul__(-1)
+
+    def __mul__(self, other: Union[float, Complex, Vector.Vector, Matrix.Matrix, SparseMatrix]) -> Union[Vector.Vector, Matrix.Matrix, SparseMatrix]:
+        """
+        self * other
+        """
+        if isoneof(other, [int, float, Complex]):
+            if other == 0:
+                return SparseMatrix(self.shape, [0 for _ in range(self.__rows+1)], [], [], self.field)
+            return SparseMatrix(self.shape, list(self.__indptr), list(self.__indices),
+                                [other*v for v in self.__data], self.field)
+        if isinstance(other, Vector.Vector):
+            if self.__cols != other.length:
+                raise ValueError(
+                    "SparseMatrix and Vector must have matching sizes")
+            res = []
+            for i in range(self.__rows):
+                acc = 0
+                for p in range(self.__indptr[i], self.__indptr[i+1]):
+                    acc += self.__data[p] * other[self.__indices[p]]
+                res.append(acc)
+            return Vector.Vector(res)
+        if isinstance(other, Matrix.Matrix):
+            if self.__cols != len(other):
+                raise ValueError(
+                    "SparseMatrix and Matrix must have matching sizes: self.cols == other.rows")
+            k = len(other[0])
+            res = []
+            for i in range(self.__rows):
+                acc = [0 for _ in range(k)]
+                for p in range(self.__indptr[i], self.__indptr[i+1]):
+                    v = self.__data[p]
+                    acc = [a + v*b for a, b in zip(acc, other[self.__indices[p]])]
+                res.append(acc)
+            return Matrix.Matrix(res, field=self.field)
+        if isinstance(other, SparseMatrix):
+            if self.__cols != other.__rows:
+                raise ValueError(
+                    "SparseMatrix and SparseMatrix must have matching sizes: self.cols == other.rows")
+            rows = []
+            for i in range(self.__rows):
+                acc = {}
+                for p in range(self.__indptr[i], self.__indptr[i+1]):
+                    v = self.__data[p]
+                    j = self.__indices[p]
+                    for q in range(other.__indptr[j], other.__indptr[j+1]):
+                        c = other.__indices[q]
+                        acc[c] = acc.get(c, 0) + v*other.__data[q]
+                rows.append(acc)
+            return SparseMatrix._fromRowDicts((self.__rows, other.__cols), rows, self.field)
+        raise TypeError(
+            "SparseMatrix can only be multiplied by a number, Vector, Matrix or SparseMatrix")
+
+    def __rmul__(self, other: Union[float, Complex, Matrix.Matrix]) -> Union[Matrix.Matrix, SparseMatrix]:
+        """
+        other * self
+        """
+        if isoneof(other, [int, float, Complex]):
+            return self.__mul__(other)
+        if isinstance(other, Matrix.Matrix):
+            if len(other[0]) != self.__rows:
+                raise ValueError(
+                    "Matrix and SparseMatrix must have matching sizes: other.cols == self.rows")
+            res = []
+            for i in range(len(other)):
+                acc = [0 for _ in range(self.__cols)]
+                for j, a in enumerate(other[i]):
+                    if a == 0:
+                        continue
+                    for p in range(self.__indptr[j], self.__indptr[j+1]):
+                        acc[self.__indices[p]] += a*self.__data[p]
+                res.append(acc)
+            return Matrix.Matrix(res, field=self.field)
+        raise TypeError(
+            f"cant perform {type(other)}*SparseMatrix")
+
+    def solve(self, vec: Union[Vector.Vector, list]) -> Vector.Vector:
+        """
+        Solve the system of equations self*x = vec with sparse gaussian elimination
+        rows are kept as {col: value} and each pivot only touches the rows that have an entry in its column,
+        so the work follows the non zeros (and their fill-in) rather than the size of the matrix
+        """
+        if not self.is_square:
+            raise ValueError("Matrix must be square")
+        if not isoneof(vec, [Vector.Vector, list]):
+            raise TypeError("Matrix must be solved for a vector")
+        if len(vec) != self.__rows:
+            raise ValueError("Vector must have the same length as the Matrix")
+        n = self.__rows
+        rows = [self.row(i) for i in range(n)]
+        rhs = list(vec)
+        # the rows that have an entry in each column
+        cols = [set() for _ in range(n)]
+        for i, row in enumerate(rows):
+            for c in row:
+                cols[c].add(i)
+        eliminated = [False for _ in range(n)]
+        pivot_rows = []
+        for k in range(n):
+            candidates = [r for r in cols[k] if not eliminated[r]]
+            if len(candidates) == 0:
+                raise ValueError("Matrix is singular")
+            p = max(candidates, key=lambda r: abs(rows[r][k]))
+            if almost_equal(rows[p][k], 0):
+                raise ValueError("Matrix is singular")
+            eliminated[p] = True
+            pivot_rows.append(p)
+            pivot_row = rows[p]
+            pivot = pivot_row[k]
+            for r in candidates:
+                if r == p:
+                    continue
+                row = rows[r]
+                factor = row[k] / pivot
+                for c, v in pivot_row.items():
+                    value = row.get(c, 0) - factor*v
+                    if c == k or value == 0:
+                        if c in row:
+                            del row[c]
+                            cols[c].discard(r)
+                    else:
+                        if c not in row:
+                            cols[c].add(r)
+                        row[c] = value
+                rhs[r] -= factor*rhs[p]
+        x = [0 for _ in range(n)]
+        for k in range(n-1, -1, -1):
+            p = pivot_rows[k]
+            acc = rhs[p]
+            for c, v in rows[p].items():
+                if c != k:
+                    acc -= v*x[c]
+            x[k] = acc / rows[p][k]
+        return Vector.Vector(x)
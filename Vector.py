@@ -1,25 +1,100 @@
 from __future__ import annotations
+from array import array
 import utils
 from utils import almost_equal
 from typing import Union, Any
 import Field
 import Complex
+import Backend
+import CompactVector
+import Serialization
+from Backend import Backends
 t_vector = list[Union[float, Complex.Complex]]
 
 
 class Vector:
 
     @staticmethod
-    def random(min: float = -10, max: float = 10, degree: int = 10,  def_value=None, f: Field.Field = Field.DefaultRealField) -> Vector:
+    def random(min: float = -10, max: float = 10, degree: int = 10,  def_value=None, f: Field.Field = None) -> Vector:
+        if f is None:
+            f = Field.DefaultRealField
         return Vector([f.random(min, max) if def_value is None else def_value for _ in range(degree)])
 
+    @staticmethod
+    def fromBytes(data: Union[bytes, bytearray, memoryview]) -> Vector:
+        """
+        will read a Vector written by toBytes (or Serialization.dumps)
+        """
+        res = Serialization.loads(data)
+        if not isinstance(res, Vector):
+            raise ValueError("the data does not hold a Vector")
+        return res
+
+    def toBytes(self) -> bytes:
+        return Serialization.dumps(self)
+
+    @staticmethod
+    def fromBuffer(buffer: Any) -> Vector:
+        """
+        will create a Vector of the float64 entries of a buffer or array like object
+        with NumPy the Vector shares the memory of the buffer when its format and layout allow it, a read only buffer
+        gives a frozen Vector. A Vector sharing memory caches nothing, as the buffer can change it behind its back
+        """
+        values, backend = Backend.from_buffer(buffer)
+        if backend == Backends.NUMPY:
+            values = values.reshape(-1)
+        res = Vector(values, backend=backend)
+        if backend == Backends.NUMPY and not values.flags.writeable:
+            res.__frozen = True
+        res.__shared = Backend.shares_memory(values, buffer)
+        return res
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        NumPy storage is handed out without copying as a read only view: writes must go through the Vector
+        so its cached values are invalidated. List storage is converted
+        """
+        if self.backend == Backends.NUMPY:
+            res = self.__values.view()
+            res.flags.writeable = False
+            if copy:
+                res = res.copy()
+        else:
+            res = Backend.numpy.array(self.__values)
+        return res if dtype is None else res.astype(dtype, copy=False)
+
+    @property
+    def __array_interface__(self) -> dict:
+        """
+        only vectors stored in NumPy expose their memory, others are converted through __array__
+        """
+        if self.backend != Backends.NUMPY:
+            raise AttributeError("only NumPy backed vectors expose '__array_interface__'")
+        return self.__array__().__array_interface__
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """
+        the buffer protocol (Python 3.12+): a read only view of NumPy storage, a float64 copy of list storage
+        """
+        if self.backend == Backends.NUMPY:
+            return memoryview(self.__array__())
+        return memoryview(array("d", self.__values))
+
     @staticmethod
     def fromSize(size: int, default_value: Any = 0) -> Vector:
         return Vector([default_value for _ in range(size)])
 
-    def __init__(self, values: t_vector, field: Field.Field = None) -> None:
-        self.__values = values
-        self.field = Field.RealField(len(values)) if not field else field
+    def __init__(self, values: t_vector, field: Field.Field = None, backend: Backends = None) -> None:
+        self.__values, self.backend = Backend.to_storage(values, backend)
+        self.field = Field.Field.create(
+            Field.Fields.R, len(values)) if not field else field
+        self.__frozen = False
+        # every change to the values increments the version, derived values are cached per version
+        self.__version = 0
+        self.__cache = {}
+        self.__cache_version = 0
+        # memory shared with a buffer can change without the version changing, nothing is cached then
+        self.__shared = False
 
     @property
     def length(self):
@@ -32,13 +107,26 @@ class Vector:
 
     @property
     def has_no_zero(self) -> bool:
-        for v in self:
-            if v != 0:
-                return True
-        return False
+        def compute() -> bool:
+            for v in self:
+                if v != 0:
+                    return True
+            return False
+        return self.__cached("has_no_zero", compute)
+
+    @property
+    def version(self) -> int:
+        """
+        a counter of the changes made to the values, cached values are kept only for the current version
+        """
+        return self.__version
+
+    @property
+    def is_frozen(self) -> bool:
+        return self.__frozen
 
     def __str__(self) -> str:
-        return str(self.__values)
+        return str(Backend.to_list(self.__values))
 
     def __add__(self, other: Vector) -> Vector:
         if not isinstance(other, Vector):
@@ -74,6 +162,94 @@ class Vector:
     def __rmul__(self, num: float) -> Vector:
         return self.__mul__(num)
 
+    def __iadd__(self, other: Vector) -> Vector:
+        return self.axpy(1, other)
+
+    def __isub__(self, other: Vector) -> Vector:
+        return self.axpy(-1, other)
+
+    def __imul__(self, num: float) -> Vector:
+        """
+        self *= num in place
+        """
+        self.__modifying()
+        if self.backend == Backends.NUMPY and utils.isoneof(num, [int, float]):
+            self.__values *= num
+            return self
+        values = self.__values
+        for i in range(len(values)):
+            values[i] *= num
+        return self
+
+    def axpy(self, a: float, other: Vector) -> Vector:
+        """
+        self += a*other in place, returns self
+        """
+        if not isinstance(other, Vector):
+            raise TypeError("Vector can only be added to another Vector")
+        if self.field != other.field:
+            raise ValueError("Vectors must have the same field")
+        if len(self.__values) != len(other.__values):
+            raise ValueError("Vectors must have the same length")
+        self.__modifying()
+        if self.backend == Backends.NUMPY and other.backend == Backends.NUMPY and utils.isoneof(a, [int, float]):
+            self.__values += a*other.__values
+            return self
+        values, other_values = self.__values, other.__values
+        for i in range(len(values)):
+            values[i] += a*other_values[i]
+        return self
+
+    def add(self, other: Vector, out: Vector = None) -> Vector:
+        """
+        self + other, written into 'out' (which may be self or other) when it is given
+        """
+        if out is None:
+            return self + other
+        self.__check_same_shape(other)
+        self.__check_same_shape(out)
+        out.__modifying()
+        if self.__is_numpy_with(other, out):
+            Backend.numpy.add(self.__values, other.__values, out=out.__values)
+            return out
+        values, other_values, out_values = self.__values, other.__values, out.__values
+        for i in range(len(values)):
+            out_values[i] = values[i] + other_values[i]
+        return out
+
+    def subtract(self, other: Vector, out: Vector = None) -> Vector:
+        """
+        self - other, written into 'out' (which may be self or other) when it is given
+        """
+        if out is None:
+            return self - other
+        self.__check_same_shape(other)
+        self.__check_same_shape(out)
+        out.__modifying()
+        if self.__is_numpy_with(other, out):
+            Backend.numpy.subtract(self.__values, other.__values, out=out.__values)
+            return out
+        values, other_values, out_values = self.__values, other.__values, out.__values
+        for i in range(len(values)):
+            out_values[i] = values[i] - other_values[i]
+        return out
+
+    def multiply(self, num: Union[float, Complex.Complex], out: Vector = None) -> Vector:
+        """
+        num * self, written into 'out' (which may be self) when it is given
+        """
+        if out is None:
+            return self * num
+        self.__check_same_shape(out)
+        out.__modifying()
+        if self.__is_numpy_with(out) and utils.isoneof(num, [int, float]):
+            Backend.numpy.multiply(self.__values, num, out=out.__values)
+            return out
+        values, out_values = self.__values, out.__values
+        for i in range(len(values)):
+            out_values[i] = num*values[i]
+        return out
+
     def __truediv__(self, other) -> Vector:
         if utils.isoneof(other, [int, float, Complex]):
             return self.__mul__(1/other)
@@ -85,6 +261,15 @@ class Vector:
     def __getitem__(self, index: int) -> Union[float, Complex.Complex]:
         return self.__values[index]
 
+    def __setitem__(self, index: int, value: Union[float, Complex.Complex]) -> None:
+        self.set(index, value)
+
+    def __hash__(self) -> int:
+        if not self.__frozen:
+            raise TypeError(
+                "unhashable type: 'Vector', use freeze() for a hashable copy")
+        return self.__cached("hash", lambda: hash(tuple(Backend.to_list(self.__values))))
+
     def __iter__(self):
         return iter(self.__values)
 
@@ -95,7 +280,9 @@ class Vector:
             other = other.__values
         if len(self) != len(other):
             return False
-        return self.__values == other
+        if self.backend == Backends.NUMPY:
+            return self.__values.tolist() == Backend.to_list(other)
+        return self.__values == Backend.to_list(other)
 
     def __ne__(self, other: Vector) -> bool:
         return not (self == other)
@@ -111,10 +298,60 @@ class Vector:
         return all([almost_equal(self[i], other[i]) for i in range(len(self))])
 
     def set(self, index, value) -> None:
+        self.__modifying()
         self.__values[index] = value
 
     def norm(self) -> float:
-        return sum([x ** 2 for x in self]) ** 0.5
+        def compute() -> float:
+            if self.backend == Backends.NUMPY:
+                return float(Backend.numpy.linalg.norm(self.__values))
+            return sum([x ** 2 for x in self]) ** 0.5
+        return self.__cached("norm", compute)
+
+    def freeze(self) -> Vector:
+        """
+        will return an immutable copy of the vector (or self if it is already frozen),
+        a frozen Vector is hashable and can be used as a dictionary key
+        """
+        if self.__frozen:
+            return self
+        res = self.copy()
+        if res.backend == Backends.NUMPY:
+            res.__values.setflags(write=False)
+        res.__frozen = True
+        return res
+
+    def __check_same_shape(self, other: Vector) -> None:
+        if not isinstance(other, Vector):
+            raise TypeError("expected a 'Vector'")
+        if self.field != other.field:
+            raise ValueError("Vectors must have the same field")
+        if len(self.__values) != len(other.__values):
+            raise ValueError("Vectors must have the same length")
+
+    def __is_numpy_with(self, *others: Vector) -> bool:
+        return self.backend == Backends.NUMPY and all(other.backend == Backends.NUMPY for other in others)
+
+    def __modifying(self) -> None:
+        """
+        must be called before the values change, the cached derived values become stale
+        """
+        if self.__frozen:
+            raise TypeError("a frozen Vector can not be modified")
+        self.__version += 1
+
+    def __cached(self, key: str, compute) -> Any:
+        """
+        will return the value cached under 'key' for the current version, computing it if needed
+        """
+        if self.__shared:
+            return compute()
+        if self.__cache_version != self.__version:
+            self.__cache.clear()
+            self.__cache_version = self.__version
+        if key not in self.__cache:
+            self.__cache[key] = compute()
+        return self.__cache[key]
 
     def dot(self, other: Vector) -> Vector:
         if not isinstance(other, Vector):
@@ -123,6 +360,8 @@ class Vector:
             raise ValueError("Vectors must have the same field")
         if len(self.__values) != len(other.__values):
             raise ValueError("Vectors must have the same length")
+        if self.backend == Backends.NUMPY and other.backend == Backends.NUMPY:
+            return Vector(self.__values * other.__values, backend=Backends.NUMPY)
         return Vector([self.__values[i] * other.__values[i] for i in range(len(self.__values))])
 
     def toOrthonormal(self) -> Vector:
@@ -148,5 +387,13 @@ class Vector:
         else:
             return value.projection_of(self)
 
+    def compact(self) -> CompactVector.CompactVector:
+        """
+        will return a copy stored in array('d') (8 bytes per real entry, 16 per complex one)
+        """
+        return CompactVector.CompactVector.fromVector(self)
+
     def copy(self) -> Vector:
-        return Vector(self.__values, self.field)
+        if self.backend == Backends.NUMPY:
+            return Vector(self.__values.copy(), self.field, self.backend)
+        return Vector(list(self.__values), self.field, self.backend)
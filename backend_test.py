@@ -0,0 +1,63 @@
+import pytest
+import Backend
+from Backend import Backends
+from Matrix import Matrix
+from Vector import Vector
+from utils import almost_equal
+
+A = [[2, 0, 1], [1, 3, 2], [1, 1, 2]]
+B = [[1, 2, 0], [0, 1, 4], [5, 0, 1]]
+
+
+def test_default_is_list():
+    assert Backend.get_default() == Backends.LIST
+    assert Matrix(A).backend == Backends.LIST
+    assert Vector([1, 2]).backend == Backends.LIST
+
+
+def test_resolve():
+    assert Backend.resolve(Backends.LIST) == Backends.LIST
+    expected = Backends.NUMPY if Backend.is_available(
+        Backends.NUMPY) else Backends.LIST
+    assert Backend.resolve(Backends.NUMPY) == expected
+    with pytest.raises(TypeError):
+        Backend.resolve("numpy")
+
+
+def test_numpy_matches_list():
+    pytest.importorskip("numpy")
+    a, b = Matrix(A, backend=Backends.NUMPY), Matrix(
+        B, backend=Backends.NUMPY)
+    assert a.backend == Backends.NUMPY
+    assert a + b == Matrix(A) + Matrix(B)
+    assert a - b == Matrix(A) - Matrix(B)
+    assert a * b == Matrix(A) * Matrix(B)
+    assert a.transpose() == Matrix(A).transpose()
+    assert a.guassian_elimination() == Matrix(A).guassian_elimination()
+    v = Vector([1, 2, 3], backend=Backends.NUMPY)
+    assert a * v == Matrix(A) * Vector([1, 2, 3])
+    assert v.dot(v) == Vector([1, 4, 9])
+    assert almost_equal(v.norm(), Vector([1, 2, 3]).norm())
+
+
+def test_numpy_global_default():
+    pytest.importorskip("numpy")
+    Backend.set_default(Backends.NUMPY)
+    try:
+        assert Matrix(A).backend == Backends.NUMPY
+        assert Matrix(A, backend=Backends.LIST).backend == Backends.LIST
+    finally:
+        Backend.set_default(Backends.LIST)
+
+
+def test_numpy_keeps_exact_values():
+    pytest.importorskip("numpy")
+    from fractions import Fraction
+    assert Matrix(A, backend=Backends.NUMPY, exact=True).backend == Backends.LIST
+    assert Matrix([[Fraction(1, 3), 1], [0, 1]], backend=Backends.NUMPY).backend == Backends.LIST
+    big = 2**53 + 1
+    m = Matrix([[big, 0], [0, 1]], backend=Backends.NUMPY)
+    assert m.backend == Backends.LIST
+    assert m[0][0] == big
+    assert Vector([Fraction(1, 3), 1], backend=Backends.NUMPY).backend == Backends.LIST
+    assert Matrix(A, backend=Backends.NUMPY).backend == Backends.NUMPY
@@ -0,0 +1,35 @@
+"""
+compares the exact Bareiss path of Matrix with the floating point (LU) path
+run with: python bareiss_benchmark.py
+"""
+from fractions import Fraction
+import random
+import time
+from Matrix import Matrix
+
+
+def timed(func):
+    start = time.perf_counter()
+    res = func()
+    return res, time.perf_counter()-start
+
+
+def benchmark(sizes=(10, 20, 40, 80), repetitions=3):
+    print(f"{'n':>4} {'float det [s]':>14} {'exact det [s]':>14} {'relative error of float':>24}")
+    for n in sizes:
+        float_time, exact_time, error = 0, 0, 0
+        for _ in range(repetitions):
+            values = [[random.randint(-10, 10) for _ in range(n)]
+                      for _ in range(n)]
+            approx, t = timed(lambda: Matrix(values).determinant)
+            float_time += t
+            exact, t = timed(lambda: Matrix(values, exact=True).determinant)
+            exact_time += t
+            if exact != 0:
+                error = max(error, abs(Fraction(approx)-exact)/abs(exact))
+        print(
+            f"{n:>4} {float_time/repetitions:>14.5f} {exact_time/repetitions:>14.5f} {float(error):>24.3e}")
+
+
+if __name__ == '__main__':
+    benchmark()
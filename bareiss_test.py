@@ -0,0 +1,59 @@
+from fractions import Fraction
+from Bareiss import Bareiss
+from Matrix import Matrix
+from Vector import Vector
+
+
+def test_determinant():
+    assert Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]], exact=True).determinant == 0
+    assert Matrix([[2, 0, 1], [1, 3, 2], [1, 1, 2]], exact=True).determinant == 6
+    assert Matrix([[0, 1], [1, 0]], exact=True).determinant == -1
+    half = Fraction(1, 2)
+    assert Matrix([[half, 0], [0, Fraction(1, 3)]],
+                  exact=True).determinant == Fraction(1, 6)
+    # a Hilbert matrix, badly conditioned for floating point
+    n = 8
+    hilbert = Matrix([[Fraction(1, i+j+1) for j in range(n)]
+                     for i in range(n)], exact=True)
+    assert hilbert.determinant == Fraction(
+        1, 365356847125734485878112256000000)
+
+
+def test_rank():
+    assert Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]], exact=True).rank == 2
+    assert Matrix([[0, 0, 1], [0, 0, 2]], exact=True).rank == 1
+    assert Bareiss(Matrix([[0, 1, 2], [0, 2, 5]])).pivots == [1, 2]
+
+
+def test_solve():
+    m = Matrix([[2, 0, 1], [1, 3, 2], [1, 1, 2]], exact=True)
+    assert m.solve(Vector([3, 6, 4])) == Vector([1, 1, 1])
+    assert m.solve(Vector([1, 0, 0])) == Vector(
+        [Fraction(2, 3), Fraction(0), Fraction(-1, 3)])
+    assert Matrix([[1, 1], [1, 1]], exact=True).solve(Vector([1, 2])) == None
+
+
+def test_solve_singular():
+    m = Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+    particular, kernel = Bareiss(m).solve(Vector([6, 15, 24]))
+    kernel = kernel.vectors
+    assert len(kernel) == 1
+    assert m*particular == Vector([6, 15, 24])
+    assert m*kernel[0] == Vector([0, 0, 0])
+    assert Bareiss(m).solve(Vector([1, 0, 0])) == None
+    wide = Matrix([[2, 4, 1], [1, 2, 1]])
+    particular, kernel = Bareiss(wide).solve(Vector([Fraction(1, 2), 1]))
+    assert wide*particular == Vector([Fraction(1, 2), 1])
+    assert all(wide*k == Vector([0, 0]) for k in kernel.vectors)
+
+
+def test_matrix_uses_bareiss():
+    m = Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]], exact=True)
+    assert m.bareiss is m.bareiss
+    assert m.rank == 2 and not m.is_invertiable
+    particular, kernel = m.solve(Vector([6, 15, 24]))
+    assert m*particular == Vector([6, 15, 24])
+    assert m*kernel.vectors[0] == Vector([0, 0, 0])
+    wide = Matrix([[1, 2, 3], [2, 4, 7]], exact=True)
+    assert wide.rank == 2
+    assert wide*wide.solve(Vector([1, 2]))[0] == Vector([1, 2])
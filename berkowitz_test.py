@@ -0,0 +1,22 @@
+from fractions import Fraction
+from Berkowitz import Berkowitz
+from Matrix import Matrix
+
+
+def test_coefficients():
+    # det(xI - A) = x^3 - 6x^2 + 11x - 6 for eigenvalues 1, 2, 3
+    m = Matrix([[2, 1, 1], [0, 1, 0], [0, 2, 3]])
+    assert Berkowitz(m).coefficients == [1, -6, 11, -6]
+
+
+def test_exact():
+    m = Matrix([[0.5, Fraction(1, 3)], [1, 2]])
+    coefficients = Berkowitz(m, exact=True).coefficients
+    assert coefficients == [1, Fraction(-5, 2), Fraction(2, 3)]
+    assert all(type(c) in (int, Fraction) for c in coefficients)
+
+
+def test_polynomial():
+    p = Berkowitz(Matrix([[0, 1], [-2, -3]])).polynomial
+    assert p.prefixes == [1, 3, 2]
+    assert p.powers == [2, 1, 0]
@@ -0,0 +1,45 @@
+import sys
+from CompactVector import CompactVector
+from Complex import Complex
+from Field import Field, Fields
+from Vector import Vector
+
+
+def test_api():
+    v = CompactVector([3.0, 4.0])
+    assert v[0] == 3.0 and len(v) == 2 and list(v) == [3.0, 4.0]
+    assert v.norm() == 5
+    assert v.dot(CompactVector([2, 0.5])) == CompactVector([6, 2])
+    w = v.copy()
+    w[0] = 1
+    assert v[0] == 3 and w == [1, 4]
+    assert v + w == CompactVector([4, 8]) and v - w == [2, 0] and 2*v == [6, 8]
+    assert v.field == Field.create(Fields.R, 2)
+    assert not hasattr(v, "__dict__")
+
+
+def test_complex():
+    v = Vector([1.0, 2.0]).compact()
+    v.set(1, Complex(0, 2))
+    assert v.is_complex and v[1] == Complex(0, 2) and v[0] == Complex(1, 0)
+    assert v.field == Field.create(Fields.C, 2)
+    assert abs(v.norm() - 5 ** 0.5) < 1e-12
+    assert (v*Complex(0, 1))[1] == Complex(-2, 0)
+    assert v.toVector()[1] == Complex(0, 2)
+
+
+def test_footprint():
+    real = CompactVector([float(i) for i in range(1000)])
+    assert real.nbytes == CompactVector.footprint(1000)
+    complex_ = CompactVector([Complex(i, 1) for i in range(1000)])
+    assert complex_.nbytes == CompactVector.footprint(1000, is_complex=True)
+    promoted = CompactVector([1.0 for _ in range(1001)])
+    promoted[0] = Complex(0, 1)
+    for v in [real + real, real.dot(real), 2*real, real.copy()]:
+        assert v.nbytes == CompactVector.footprint(1000)
+    for v in [complex_ + complex_, complex_.dot(complex_), -complex_, complex_.copy()]:
+        assert v.nbytes == CompactVector.footprint(1000, is_complex=True)
+    assert promoted.nbytes == CompactVector.footprint(1001, is_complex=True)
+    values = [float(i) + 0.5 for i in range(1000)]
+    boxed = sys.getsizeof(values) + sum(sys.getsizeof(v) for v in values)
+    assert real.nbytes < boxed / 3
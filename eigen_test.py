@@ -0,0 +1,49 @@
+from Complex import Complex
+from Eigen import Eigen
+from Matrix import Matrix
+from utils import almost_equal
+
+
+def test_symmetric():
+    e = Eigen(Matrix([[2, 1, 0], [1, 2, 1], [0, 1, 2]]))
+    values = sorted(e.values)
+    expected = [2 - 2**0.5, 2, 2 + 2**0.5]
+    assert e.is_real
+    for v, w in zip(values, expected):
+        assert almost_equal(round(v, 10), round(w, 10))
+
+
+def test_complex_pair():
+    # rotation by 90 degrees
+    e = Eigen(Matrix([[0, -1], [1, 0]]))
+    assert not e.is_real
+    assert all(isinstance(v, Complex) for v in e.values)
+    assert sorted(v.imag for v in e.values) == [-1, 1]
+    assert e.is_diagonalizable
+
+
+def test_defective():
+    e = Eigen(Matrix([[1, 1], [0, 1]]))
+    assert e.values == [1, 1]
+    assert not e.is_diagonalizable
+
+
+def test_power():
+    m = Matrix([[0.5, 0.5, 0], [0.25, 0.5, 0.25], [0, 0.5, 0.5]])
+    expected = m*m*m*m*m
+    p = Eigen(m).power(5)
+    for i in range(3):
+        for j in range(3):
+            assert abs(p[i][j] - expected[i][j]) < 1e-12
+
+
+def test_stats():
+    Eigen.reset_engine_stats()
+    m = Matrix([[4, 1, 2, 3], [1, 3, 0, 1], [2, 0, 5, 1], [3, 1, 1, 6]])
+    e = Eigen(m)
+    assert e.stats["iterations"] == e.iterations > 0
+    assert 0 < e.stats["max_iterations"] <= Eigen.MAX_ITERATIONS
+    totals = Eigen.engine_stats()
+    assert totals["decompositions"] == 1
+    assert totals["iterations"] == e.iterations
+    assert totals["failures"] == 0
@@ -0,0 +1,35 @@
+from Factorization import Factorization
+from Matrix import Matrix
+from Vector import Vector
+from utils import almost_equal
+
+A = Matrix([[2, 0, 1], [1, 3, 2], [1, 1, 2]])
+
+
+def test_lu():
+    lu = Factorization(A)
+    product = lu.lower() * lu.upper()
+    p = lu.permutation
+    for i in range(3):
+        for j in range(3):
+            assert almost_equal(product[i][j], A[p[i]][j])
+    assert almost_equal(lu.determinant, 6)
+
+
+def test_singular():
+    lu = Factorization(Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]]))
+    assert lu.is_singular
+    assert lu.determinant == 0
+
+
+def test_solve_many():
+    lu = A.factorization
+    b = Matrix([[3, 2], [6, 1], [4, 1]])
+    x = lu.solve_many(b)
+    expected = Matrix([[1, 1], [1, 0], [1, 0]])
+    for i in range(3):
+        for j in range(2):
+            assert almost_equal(x[i][j], expected[i][j])
+    solutions = list(A.solve_many([Vector([3, 6, 4]), Vector([2, 1, 1])]))
+    assert solutions[0].almost_equal(Vector([1, 1, 1]))
+    assert solutions[1].almost_equal(Vector([1, 0, 0]))
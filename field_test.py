@@ -1,3 +1,5 @@
+import pytest
+import random
 from Field import *
 c = Complex.Complex
 
@@ -23,3 +25,88 @@ def test_clone():
     r21 = r3.classOfInstance(2)
     r23 = r3.classOfInstance.create(r3._name, 2)
     assert r21 == r23
+
+
+def test_registry():
+    assert Field.create(Fields.R, 3) is Field.create(Fields.R, 3)
+    assert Field.create(Fields.R) is DefaultRealField
+    assert Field.create(Fields.C) is DefaultComplexField
+    assert Field.create(Fields.Q, 2) is not Field.create(Fields.R, 2)
+    assert Vector.Vector([1, 2]).field is Field.create(Fields.R, 2)
+
+
+class Mod5:
+    def __init__(self, v) -> None:
+        self.v = (v.v if isinstance(v, Mod5) else int(v)) % 5
+        self.real, self.imag = self.v, 0
+
+    def __add__(self, other):
+        return Mod5(self.v + Mod5(other).v)
+
+    def __radd__(self, other):
+        return self + other
+
+    def __sub__(self, other):
+        return Mod5(self.v - Mod5(other).v)
+
+    def __rsub__(self, other):
+        return Mod5(other) - self
+
+    def __neg__(self):
+        return Mod5(-self.v)
+
+    def __mul__(self, other):
+        return Mod5(self.v * Mod5(other).v)
+
+    def __rmul__(self, other):
+        return self * other
+
+    def __truediv__(self, other):
+        return self * pow(Mod5(other).v, 3, 5)
+
+    def __rtruediv__(self, other):
+        return Mod5(other) / self
+
+    def __eq__(self, other):
+        return self.v == Mod5(other).v
+
+    def __ne__(self, other):
+        return not self == other
+
+
+class GF5(Field):
+    def __init__(self, zero=0):
+        super().__init__(Fields.Q, Mod5(zero), Mod5(1), 1, 5)
+
+    def _generate_one(self, min: int = -10, max: int = 10) -> Mod5:
+        return Mod5(random.randint(0, 4))
+
+    def _elements(self) -> list:
+        return [Mod5(i) for i in range(5)]
+
+
+def test_verification_policy():
+    from Field import Verification
+    try:
+        Field.set_verification(Verification.EXHAUSTIVE)
+        assert Field.is_field(GF5())
+        # infinite fields can't be enumerated, they are sampled
+        before = Field.verification_stats()
+        assert Field.is_field(RealField(5))
+        assert Field.verification_stats()["verifications"] == before["verifications"]+1
+        Field.set_verification(Verification.SAMPLED, 10, seed=1)
+        before = Field.verification_stats()
+        with pytest.raises(ValueError):
+            GF5(zero=1)
+        with pytest.raises(ValueError):
+            GF5(zero=1)
+        # other parameters of the same class get their own verdict
+        assert GF5()._zero == 0
+        assert GF5()._zero == 0
+        after = Field.verification_stats()
+        assert after["verifications"] == before["verifications"]+2
+        assert after["cache_hits"] == before["cache_hits"]+2
+        Field.set_verification(Verification.OFF)
+        assert GF5(zero=1)._zero == 1
+    finally:
+        Field.set_verification(Verification.SAMPLED)
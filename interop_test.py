@@ -0,0 +1,59 @@
+from array import array
+import numpy
+import pytest
+from Backend import Backends
+from Matrix import Matrix
+from Vector import Vector
+
+
+def test_array_export():
+    m = Matrix([[1.0, 2.0], [3.0, 4.0]], backend=Backends.NUMPY)
+    exported = numpy.asarray(m)
+    assert exported.tolist() == [[1.0, 2.0], [3.0, 4.0]]
+    assert numpy.shares_memory(exported, numpy.asarray(m))
+    with pytest.raises(ValueError):
+        exported[0, 0] = 5
+    m[0][0] = 5
+    assert exported[0, 0] == 5
+    assert numpy.asarray(Matrix([[1, 2], [3, 4]])).tolist() == [[1, 2], [3, 4]]
+    v = Vector([1.0, 2.0, 3.0], backend=Backends.NUMPY)
+    assert numpy.asarray(v).sum() == 6
+    assert not hasattr(Vector([1, 2]), "__array_interface__")
+
+
+def test_from_buffer():
+    data = array("d", [1, 2, 3, 4, 5, 6])
+    m = Matrix.fromBuffer(data, (2, 3))
+    assert m == Matrix([[1, 2, 3], [4, 5, 6]])
+    data[0] = 7
+    assert m[0][0] == 7
+    m[1][2] = 0
+    assert data[5] == 0
+    frozen = Matrix.fromBuffer(bytes(data), (3, 2))
+    assert frozen.is_frozen and frozen[2] == [5, 0]
+    with pytest.raises(ValueError):
+        Matrix.fromBuffer(data)
+    source = numpy.arange(4.0)
+    v = Vector.fromBuffer(source)
+    source[1] = 10
+    assert v[1] == 10 and not v.is_frozen
+    assert Vector.fromBuffer(numpy.asarray(Matrix([[1.0, 2.0]], backend=Backends.NUMPY)).ravel()).is_frozen
+
+
+def test_shared_memory_is_not_cached():
+    data = array("d", [1, 2, 3, 4])
+    m = Matrix.fromBuffer(data, (2, 2))
+    assert m.determinant == -2
+    data[0] = 2
+    assert m.determinant == 2
+    source = numpy.array([3.0, 4.0])
+    v = Vector.fromBuffer(source)
+    assert v.norm() == 5
+    source[0] = 0
+    assert v.norm() == 4
+
+
+def test_typed_buffers():
+    assert Matrix.fromBuffer(array("q", [1, 2, 3, 4]), (2, 2)) == Matrix([[1, 2], [3, 4]])
+    assert Vector.fromBuffer(array("i", [5, -1])) == Vector([5, -1])
+    assert Vector.fromBuffer(array("d", [1.5]).tobytes()) == Vector([1.5])
@@ -0,0 +1,52 @@
+from fractions import Fraction
+from Jordan import Jordan
+from Matrix import Matrix
+
+J = Matrix.fromJordanBlocks([Matrix.createJordanBlock(2, 5), Matrix.createJordanBlock(3, 2),
+                             Matrix.createJordanBlock(1, 2)])
+P = Matrix([[1, 0, 0, 0, 0, 0], [1, 1, 0, 0, 0, 0], [2, 1, 1, 0, 0, 0],
+            [0, -1, 1, 1, 0, 0], [1, 0, 0, 1, 1, 0], [0, 3, 0, 0, 1, 1]])
+# P has determinant 1, so A = P*J*P^-1 has integer entries
+A = Matrix([[Fraction(v).limit_denominator(100) for v in row] for row in P*J*P.inverse()], exact=True)
+
+
+def test_rank_sequence():
+    jordan = Jordan(A)
+    assert jordan.rank_sequence(2) == [6, 4, 3, 2]
+    assert jordan.rank_sequence(5) == [6, 5, 4]
+    assert jordan.block_sizes(2) == [3, 1]
+    assert sorted(jordan.blocks) == [(2, 1), (2, 3), (5, 2)]
+
+
+def test_jordan_form():
+    jordan = Jordan(A)
+    form = jordan.jordan_form
+    basis = Matrix.fromVectors(jordan.chain_basis.vectors)
+    # P^-1 * A * P = J, checked without the floating point inverse
+    assert A * basis == basis * form
+    assert sorted(form[i][i] for i in range(6)) == [2, 2, 2, 2, 5, 5]
+
+
+def test_minimal_polynomial():
+    # (x-5)^2 * (x-2)^3
+    p = Jordan(A).minimal_polynomial
+    assert p.prefixes == [1, -16, 97, -278, 380, -200]
+    assert Jordan(Matrix([[0, 1, 0], [0, 0, 1], [0, 0, 0]])).minimal_polynomial.powers == [3]
+    assert Jordan(Matrix.id_matrix(3)).minimal_polynomial.prefixes == [1, -1]
+
+
+def test_large_block():
+    # one block of size 5 under a dense P with determinant 1, its numerical eigenvalues spread by about 4e-3
+    L = Matrix([[1, 0, 0, 0, 0, 0], [1, 1, 0, 0, 0, 0], [-1, 2, 1, 0, 0, 0], [0, 1, -1, 1, 0, 0],
+                [2, 0, 1, -1, 1, 0], [1, -1, 0, 2, 1, 1]])
+    P = L*L.transpose()
+    J = Matrix.fromJordanBlocks([Matrix.createJordanBlock(5, 2), Matrix.createJordanBlock(1, 5)])
+    A = Matrix([[Fraction(v).limit_denominator(100) for v in row] for row in P*J*P.inverse()], exact=True)
+    jordan = Jordan(A)
+    assert sorted(jordan.eigenvalues) == [(2, 5), (5, 1)]
+    assert jordan.block_sizes(2) == [5]
+    basis = Matrix.fromVectors(jordan.chain_basis.vectors)
+    assert A * basis == basis * jordan.jordan_form
+    numerical = Jordan(Matrix([[float(v) for v in A[i]] for i in range(6)]))
+    assert sorted(m for _, m in numerical.eigenvalues) == [1, 5]
+    assert numerical.block_sizes(2) == [5]
@@ -0,0 +1,63 @@
+import pytest
+from LazyMatrix import LazyMatrix, lazy_mode
+from Matrix import Matrix
+from Vector import Vector
+
+A = Matrix([[1, 2], [3, 4], [5, 6]])
+B = Matrix([[1, 0, 2], [0, 1, 1]])
+C = Matrix([[2, 1], [1, 1], [0, 1]])
+
+
+def test_lazy_mode():
+    with lazy_mode():
+        e = A*B*C + C - 2*C
+    assert isinstance(e, LazyMatrix)
+    assert e.shape == (3, 2)
+    assert e.evaluate() == A*B*C - C
+    assert A*B == Matrix([[1, 2, 4], [3, 4, 10], [5, 6, 16]])
+
+
+def test_in_place_product_in_lazy_mode():
+    m = Matrix([[1, 2], [3, 4], [5, 6]])
+    with lazy_mode():
+        m *= B
+        m *= 2
+    assert isinstance(m, Matrix)
+    assert m == 2*(A*B)
+
+
+def test_power_in_lazy_mode():
+    m = Matrix([[1, 1], [1, 0]])
+    with lazy_mode():
+        p = m**6
+        assert isinstance(p, Matrix) and isinstance(m**3, Matrix)
+        assert isinstance(m.multiply(m), Matrix)
+    assert p == Matrix([[13, 8], [8, 5]])
+
+
+def test_shape_errors_are_early():
+    with pytest.raises(ValueError):
+        A.lazy() * A
+    with pytest.raises(ValueError):
+        A.lazy() + B
+
+
+def test_chain_order():
+    cost, split = LazyMatrix.chain_order([10, 100, 5, 50])
+    # (A1*A2)*A3 costs 10*100*5 + 10*5*50
+    assert cost == 7500
+    assert split[0][2] == 1
+
+
+def test_cache():
+    m = Matrix([[1, 2], [3, 4]])
+    e = m.lazy()*m - m
+    first = e.evaluate()
+    assert e.evaluate() is first
+    m[0][0] = 0
+    assert e.evaluate() == Matrix([[6, 6], [9, 18]])
+
+
+def test_vector():
+    v = Vector([1, 2])
+    assert (A.lazy()*B*C)*v == A*(B*(C*v))
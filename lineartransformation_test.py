@@ -26,3 +26,65 @@ def test_with_plynomial():
     assert SimplePolynomial.fromString("x^2+1")(lt)(v) == v
     assert SimplePolynomial.fromString(
         "x+1")(lt)(v) == Vector([v[0], sum(v)], field)
+
+
+def test_from_matrix():
+    from Vector import Vector
+    m = Matrix([[1, 1, 0], [0, 1, 1]])
+    lt = LinearTransformation.fromMatrix(m)
+    assert lt.src_field == RealField(3) and lt.dst_field == R2
+    assert lt(Vector([1, 2, 3])) == Vector([3, 5])
+    assert lt.toMatrix() is m
+
+
+def test_matrix_algebra():
+    from Vector import Vector
+    lt = LinearTransformation.fromMatrix(Matrix([[1, 1], [0, 1]]))
+    v = Vector([1, 2])
+    assert (lt+lt)(v) == Vector([6, 4])
+    assert (3*lt)(v) == Vector([9, 6])
+    assert (lt-lt)(v) == Vector([0, 0])
+    assert (lt**10)(v) == Vector([21, 2])
+    assert (lt**10).matrix == Matrix([[1, 10], [0, 1]])
+
+
+def test_deep_power():
+    from Vector import Vector
+
+    def func(v, target_field):
+        return Vector([v[1], v[0]], target_field)
+    lt = LinearTransformation(R2, R2, func)
+    v = Vector([1, 2])
+    assert (lt**5001)(v) == Vector([2, 1])
+    assert (lt**5000)(v) == v
+    m = LinearTransformation.fromMatrix(Matrix([[0, 1], [1, 0]]))
+    assert (m**5001).matrix == Matrix([[0, 1], [1, 0]])
+
+
+def test_compose():
+    from Vector import Vector
+
+    def func(v, target_field):
+        return Vector([v[1], v[0]], target_field)
+    swap = LinearTransformation(R2, R2, func)
+    shear = LinearTransformation.fromMatrix(Matrix([[1, 1], [0, 1]]))
+    v = Vector([1, 2])
+    assert shear.compose(swap)(v) == Vector([3, 1])
+    assert swap.compose(shear)(v) == Vector([2, 3])
+    assert shear.compose(shear).matrix == Matrix([[1, 2], [0, 1]])
+    chain = swap
+    for _ in range(3000):
+        chain = chain.compose(swap)
+    assert chain(v) == Vector([2, 1])
+
+
+def test_matrix_algebra_in_lazy_mode():
+    from Vector import Vector
+    from LazyMatrix import lazy_mode
+    lt = LinearTransformation.fromMatrix(Matrix([[1, 1], [0, 1]]))
+    v = Vector([1, 2])
+    with lazy_mode():
+        assert (lt+lt)(v) == Vector([6, 4])
+        assert (3*lt)(v) == Vector([9, 6])
+        assert (lt**10).matrix == Matrix([[1, 10], [0, 1]])
+        assert lt.compose(lt).matrix == Matrix([[1, 2], [0, 1]])
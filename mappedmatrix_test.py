@@ -0,0 +1,47 @@
+import os
+import random
+import pytest
+from MappedMatrix import MappedMatrix
+from Matrix import Matrix
+from Vector import Vector
+
+
+def random_matrix(n, m):
+    return Matrix([[float(random.randint(-9, 9)) for _ in range(m)] for _ in range(n)])
+
+
+def test_roundtrip(tmp_path):
+    m = random_matrix(7, 5)
+    path = str(tmp_path / "m.lamm")
+    with MappedMatrix.fromMatrix(path, m) as mapped:
+        assert mapped.shape == (7, 5)
+        assert mapped == m
+    with MappedMatrix(path, writable=False) as mapped:
+        assert mapped.toMatrix() == m
+        with pytest.raises(TypeError):
+            mapped[0] = [0, 0, 0, 0, 0]
+
+
+def test_chunked_operations():
+    a, b = random_matrix(9, 6), random_matrix(6, 4)
+    # blocks of two rows
+    mapped = MappedMatrix.fromMatrix(None, a, chunk_size=12)
+    right = MappedMatrix.fromMatrix(None, b, chunk_size=8)
+    assert mapped*b == a*b
+    assert mapped*right == a*b
+    v = Vector([1, 2, 3, 4, 5, 6])
+    assert mapped*v == a*v
+    assert mapped.transpose() == a.transpose()
+    assert mapped + a == a + a
+    assert 2*mapped == a*2
+    path = right.path
+    right.close()
+    assert not os.path.exists(path)
+
+
+def test_guassian_elimination():
+    a = Matrix([[0, 2, 1], [1, 1, 1], [2, 2, 2], [0, 0, 3]])
+    sol = [1, 2, 3, 4]
+    expected = a.guassian_elimination(sol)
+    res = MappedMatrix.fromMatrix(None, a, chunk_size=3).guassian_elimination(sol)
+    assert res == expected
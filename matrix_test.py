@@ -1,5 +1,10 @@
+import pytest
+from fractions import Fraction
 from Matrix import Matrix
-from Field import RealField, Fields
+from Complex import Complex
+from Field import Field, RealField, Fields
+from utils import almost_equal
+from Vector import Vector
 
 COUNT = 100
 N = 50
@@ -25,6 +30,18 @@ def test_from_vectors():
 
 def test_determinant():
     assert Matrix([[1, 1], [1, 1]]).determinant == 0
+    assert Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]]).determinant == 0
+    assert almost_equal(Matrix([[2, 0, 1], [1, 3, 2], [1, 1, 2]]).determinant, 6)
+    assert almost_equal(Matrix.id_matrix(N).determinant, 1)
+
+
+def test_inverse():
+    m = Matrix([[2, 0, 1], [1, 3, 2], [1, 1, 2]])
+    product = m * m.inverse()
+    for i in range(3):
+        for j in range(3):
+            assert almost_equal(product[i][j], 1 if i == j else 0)
+    assert not Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]]).is_invertiable
 
 
 def test_id():
@@ -43,6 +60,8 @@ def test_solve():
     from Vector import Vector
     assert Matrix([[1, 1], [1, 1]]).solve(Vector([1, 2])) == None
     assert Matrix.id_matrix(2).solve() == Vector([0, 0])
+    assert Matrix([[2, 0, 1], [1, 3, 2], [1, 1, 2]]).solve(
+        Vector([3, 6, 4])).almost_equal(Vector([1, 1, 1]))
     # FIXME
     # assert Matrix([[1, 1], [1, 1]]).solve() == Span([Vector([0, 1])])
 
@@ -60,3 +79,157 @@ def test_with_polynomial():
     from SimplePolynomial import SimplePolynomial
     assert SimplePolynomial.fromString("x^2")(
         Matrix([[1, 0], [0, 1]])) == Matrix([[1, 0], [0, 1]])
+
+
+def test_in_place():
+    m = Matrix([[1, 2], [3, 4]])
+    rows = m[0]
+    m += Matrix([[1, 1], [1, 1]])
+    assert m == Matrix([[2, 3], [4, 5]]) and rows == [2, 3]
+    m -= Matrix([[1, 1], [1, 1]])
+    m *= 2
+    assert m == Matrix([[2, 4], [6, 8]]) and rows == [2, 4]
+    m.axpy(-1, Matrix([[2, 4], [6, 8]]))
+    assert m == Matrix([[0, 0], [0, 0]])
+    m = Matrix([[1, 2], [3, 4]])
+    m.scale_row(0, 3)
+    m.add_scaled_row(1, 0, -1)
+    assert m == Matrix([[3, 6], [0, -2]])
+    m *= Matrix([[0, 1], [1, 0]])
+    assert m == Matrix([[6, 3], [-2, 0]])
+
+
+def test_copying_semantics():
+    m = Matrix([[1, 2], [3, 4]])
+    assert 2*m == Matrix([[2, 4], [6, 8]])
+    assert m == Matrix([[1, 2], [3, 4]])
+    out = Matrix([[0, 0], [0, 0]])
+    assert m.add(m, out) is out and out == Matrix([[2, 4], [6, 8]])
+    assert m.subtract(m, out) is out and out == Matrix([[0, 0], [0, 0]])
+    assert m.multiply(m, out) is out and out == m * m
+    assert m.multiply(3, m) is m and m == Matrix([[3, 6], [9, 12]])
+
+
+def test_power():
+    m = Matrix([[1, 1], [1, 0]])
+    assert m**10 == Matrix([[89, 55], [55, 34]])
+    assert m == Matrix([[1, 1], [1, 0]])
+    assert m**0 == Matrix.id_matrix(2)
+    inverse = Matrix([[2, 1], [1, 1]])**-3
+    expected = Matrix([[5, -8], [-8, 13]])
+    for i in range(2):
+        for j in range(2):
+            assert almost_equal(round(inverse[i][j], 9), expected[i][j])
+
+
+def test_large_power():
+    # a transition matrix converges to its stationary distribution
+    m = Matrix([[0.9, 0.1], [0.5, 0.5]])
+    p = m**20000
+    for row in p:
+        assert abs(row[0] - 5/6) < 1e-9 and abs(row[1] - 1/6) < 1e-9
+    rotation = Matrix([[0.6, -0.8], [0.8, 0.6]])
+    product = rotation**-100 * rotation**100
+    for i in range(2):
+        for j in range(2):
+            assert abs(product[i][j] - (1 if i == j else 0)) < 1e-6
+    # nearly defective: the eigenvector matrix is badly conditioned so repeated squaring is used
+    d = 1+1.1e-8
+    p = Matrix([[1, 1], [0, d]])**100
+    assert abs(p[0][1] - sum(d**i for i in range(100))) < 1e-10
+    assert (Matrix([[1, 1], [0, 1]], exact=True)**3).exact
+
+
+def test_eigen_values():
+    m = Matrix([[2, 0, 0], [1, 2, 0], [0, 0, 3]])
+    assert sorted(m.eigen_values) == [2, 2, 3]
+    assert m.eigen is m.eigen
+    assert m.algebraic_multiplicity(2) == 2
+    assert m.geometric_multiplicity(2) == 1
+    assert m.get_eigen_space_of(3).dim == 1
+    assert not m.is_diagonialable
+    rotation = Matrix([[0, -1], [1, 0]])
+    assert rotation.eigen_values.field == Field.create(Fields.C, 2)
+    assert rotation.algebraic_multiplicity(Complex(0, 1)) == 1
+    assert rotation.is_diagonialable
+
+
+def test_characteristic_polynomial():
+    m = Matrix([[4, 1, 0], [1, 3, 1], [0, 1, 2]])
+    p = m.characteristic_polynomial
+    assert p.prefixes == [1, -9, 24, -18]
+    assert m.characteristic_polynomial is p
+    real = Matrix([[4.5, 1, 0], [1, 3, 1], [0, 1, 2]]).characteristic_polynomial
+    for c, expected in zip(real.prefixes, [1, -9.5, 26.5, -20.5]):
+        assert abs(c - expected) < 1e-9
+    exact = Matrix([[4.5, 1, 0], [1, 3, 1], [0, 1, 2]], exact=True)
+    assert exact.characteristic_polynomial.prefixes == [1, Fraction(-19, 2), Fraction(53, 2), Fraction(-41, 2)]
+
+
+def test_jordan():
+    block = Matrix.createJordanBlock(2, 3)
+    assert block == Matrix([[3, 1], [0, 3]])
+    m = Matrix.fromJordanBlocks([block, Matrix([[7]])])
+    assert m == Matrix([[3, 1, 0], [0, 3, 0], [0, 0, 7]])
+    assert m.jordan is m.jordan
+    assert m.jordan_form == m
+    assert m.minimal_polynomial.prefixes == [1, -13, 51, -63]
+    assert len(m.chain_basis.vectors) == 3
+
+
+def test_rank_kernel_image():
+    m = Matrix([[1, 2, 3], [2, 4, 6], [1, 0, 1]])
+    assert m.rank == 2
+    assert m == Matrix([[1, 2, 3], [2, 4, 6], [1, 0, 1]])
+    assert m.row_echelon is m.row_echelon
+    assert len(m.kernel) == 1
+    assert m*m.kernel[0] == Vector([0, 0, 0])
+    assert len(m.image) == 2
+    solutions = m.solve([3, 6, 1])
+    assert len(solutions) == 2
+    assert m*solutions[0] == Vector([3, 6, 1])
+    assert m.solve([1, 1, 1]) is None
+    assert Matrix([[1, 1, 1]]).solve([3]) is not None
+
+
+def test_cache_invalidation():
+    m = Matrix([[2, 1], [1, 3]])
+    assert m.determinant == 5
+    transpose = m.transpose()
+    assert m.transpose() is not transpose and m.transpose() == transpose
+    version = m.version
+    m[0][0] = 4
+    assert m.version > version
+    assert m.determinant == 11
+    assert m.transpose() is not transpose and m.transpose()[0][0] == 4
+    m[1] = [0, 1]
+    assert m.determinant == 4
+    m.scale_row(1, 2)
+    assert m.determinant == 8
+    # the cached matrices stay frozen, callers get copies they can write into
+    assert not m.transpose().is_frozen and not m.inverse().is_frozen
+    inverse = m.inverse()
+    inverse[0][0] = 1
+    assert m.inverse()[0][0] == Fraction(1, 4)
+    copy = m.transpose()
+    copy[0][0] = 7
+    assert m.transpose()[0][0] == 4
+    # the result of the elimination starts with an empty cache
+    reduced = m.guassian_elimination()
+    assert reduced.determinant == 1 and m.determinant == 8
+
+
+def test_frozen():
+    m = Matrix([[1, 2], [3, 4]])
+    frozen = m.freeze()
+    assert frozen.is_frozen and not m.is_frozen
+    assert frozen.freeze() is frozen
+    assert {frozen: "value"}[Matrix([[1, 2], [3, 4]]).freeze()] == "value"
+    for mutate in [lambda: frozen[0].__setitem__(0, 5), lambda: frozen.axpy(1, m),
+                   lambda: frozen.scale_row(0, 2), lambda: frozen.multiply(2, frozen)]:
+        with pytest.raises(TypeError):
+            mutate()
+    with pytest.raises(TypeError):
+        hash(m)
+    assert frozen.guassian_elimination() is not None
+    assert frozen == m
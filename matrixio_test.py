@@ -0,0 +1,79 @@
+import io
+from fractions import Fraction
+import pytest
+import MatrixIO
+from Complex import Complex
+from Field import Field, Fields
+from Matrix import Matrix
+from SparseMatrix import SparseMatrix
+
+
+def test_matrix_market_coordinate():
+    text = """%%MatrixMarket matrix coordinate real symmetric
+% a comment
+3 3 3
+1 1 2.5
+3 1 -1
+2 2 4
+"""
+    sparse = MatrixIO.read_matrix_market(io.StringIO(text))
+    assert isinstance(sparse, SparseMatrix) and sparse.nnz == 4
+    assert sparse.toMatrix() == Matrix([[2.5, 0, -1], [0, 4, 0], [-1, 0, 0]])
+    out = io.StringIO()
+    MatrixIO.write_matrix_market(sparse, out)
+    out.seek(0)
+    assert MatrixIO.read_matrix_market(out) == sparse
+
+
+def test_matrix_market_array():
+    m = Matrix([[1, 2], [3, 4], [5, 6]])
+    out = io.StringIO()
+    MatrixIO.write_matrix_market(m, out)
+    assert out.getvalue().splitlines()[:3] == ["%%MatrixMarket matrix array integer general", "3 2", "1"]
+    out.seek(0)
+    assert MatrixIO.read_matrix_market(out) == m
+    c = Matrix([[Complex(1, 2), 0], [0, Complex(0, -1)]])
+    out = io.StringIO()
+    MatrixIO.write_matrix_market(c, out, coordinate=True)
+    out.seek(0)
+    res = MatrixIO.read_matrix_market(out, sparse=False)
+    assert res == c and res.field == Field.create(Fields.C)
+    for count in ["1\n2\n", "1\n2\n3\n4\n"]:
+        with pytest.raises(ValueError):
+            MatrixIO.read_matrix_market(io.StringIO("%%MatrixMarket matrix array real symmetric\n2 2\n" + count))
+
+
+def test_duplicate_entries():
+    text = """%%MatrixMarket matrix coordinate real general
+2 2 3
+1 1 1.5
+1 1 2
+2 2 1
+"""
+    dense = MatrixIO.read_matrix_market(io.StringIO(text), sparse=False)
+    assert dense == Matrix([[3.5, 0], [0, 1]])
+    assert MatrixIO.read_matrix_market(io.StringIO(text)).toMatrix() == dense
+
+
+def test_from_string_field():
+    m = Matrix.fromString("1 2\n3 4", None, Fields.Q)
+    assert m.field == Field.create(Fields.Q) and m.exact
+    assert m.determinant == -2 and isinstance(m[0][0], Fraction)
+    assert not Matrix.fromString("1 2\n3 4", None).exact
+
+
+def test_delimited(tmp_path):
+    path = str(tmp_path / "m.csv")
+    m = Matrix([[Fraction(1, 3), 2], [0, Fraction(-5, 2)]])
+    MatrixIO.write_csv(m, path)
+    res = MatrixIO.read_csv(path)
+    assert res == m and res.field == Field.create(Fields.Q)
+    assert MatrixIO.read_csv(path, sparse=True).nnz == 3
+    assert list(MatrixIO.read_rows(path, ",", Fields.Q)) == [[Fraction(1, 3), 2], [0, Fraction(-5, 2)]]
+    text = "# rows\n1 2.5 3\n\n4 5 1+2j\n"
+    res = MatrixIO.read_whitespace(io.StringIO(text))
+    assert res[0] == [1, 2.5, 3] and res[1][2] == Complex(1, 2)
+    out = io.StringIO()
+    MatrixIO.write_whitespace(res, out)
+    out.seek(0)
+    assert MatrixIO.read_whitespace(out) == res
@@ -0,0 +1,77 @@
+import random
+import pytest
+from Backend import Backends
+from Matrix import Matrix
+from MatrixStack import MatrixStack
+from Vector import Vector
+from utils import almost_equal
+
+
+def random_matrices(count, n):
+    return [Matrix([[random.randint(-9, 9) for _ in range(n)] for _ in range(n)]) for _ in range(count)]
+
+
+def test_conversion():
+    matrices = random_matrices(5, 3)
+    stack = MatrixStack.fromMatrices(matrices)
+    assert stack.shape == (5, 3, 3) and len(stack) == 5
+    assert stack.toMatrices() == matrices
+    assert stack[-1] == matrices[-1]
+    assert MatrixStack.fromLists(stack.toLists()) == stack
+    with pytest.raises(ValueError):
+        MatrixStack.fromLists([[[1, 2]], [[1], [2]]])
+
+
+def test_batched_operations():
+    singular = Matrix([[1, 2, 3, 4], [2, 4, 6, 8], [0, 1, 0, 0], [0, 0, 1, 0]])
+    matrices = random_matrices(20, 4) + [singular]
+    stack = MatrixStack.fromMatrices(matrices)
+    for det, m in zip(stack.determinant, matrices):
+        assert abs(det - m.determinant) < 1e-6
+    b = Vector([1, 2, 3, 4])
+    for x, m in zip(stack.solve(b), matrices):
+        if m.is_invertiable:
+            assert (m*x).almost_equal(b)
+        else:
+            assert x is None
+    with pytest.raises(ValueError):
+        stack.inverse()
+    invertible = MatrixStack.fromMatrices([m for m in matrices if m.is_invertiable])
+    for product in invertible * invertible.inverse():
+        for i in range(4):
+            for j in range(4):
+                assert abs(product[i][j] - (1 if i == j else 0)) < 1e-9
+    swap = Matrix([[0, 1, 0, 0], [1, 0, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]])
+    assert (stack*swap)[3] == matrices[3]*swap
+    assert (swap*stack)[3] == swap*matrices[3]
+    assert (2*stack)[0] == 2*matrices[0]
+
+
+def test_numpy_backend():
+    matrices = random_matrices(6, 3)
+    stack = MatrixStack.fromMatrices(matrices, backend=Backends.NUMPY)
+    for det, m in zip(stack.determinant, matrices):
+        assert abs(det - m.determinant) < 1e-6
+    assert (stack*stack)[2] == matrices[2]*matrices[2]
+    assert almost_equal((stack*0.5)[1][0][0], matrices[1][0][0]*0.5)
+
+
+def test_backends_agree_on_singularity():
+    nearly_singular = Matrix([[1, 2], [2, 4 + 1e-13]])
+    matrices = [Matrix([[2, 1], [1, 3]]), nearly_singular, Matrix([[0, 1], [1, 0]])]
+    lists = MatrixStack.fromMatrices(matrices, backend=Backends.LIST)
+    arrays = MatrixStack.fromMatrices(matrices, backend=Backends.NUMPY)
+    assert lists.determinant[1] == arrays.determinant[1] == 0
+    for x, y in zip(lists.determinant, arrays.determinant):
+        assert almost_equal(x, y)
+    b = Vector([1, 2])
+    for x, y in zip(lists.solve(b), arrays.solve(b)):
+        assert (x is None and y is None) or x.almost_equal(y)
+    assert lists.solve(b)[1] is None
+    for stack in [lists, arrays]:
+        with pytest.raises(ValueError):
+            stack.inverse()
+    invertible = [matrices[0], matrices[2]]
+    assert all(x.almost_equal(y) for x, y in zip(
+        MatrixStack.fromMatrices(invertible, backend=Backends.LIST).inverse().toMatrices(),
+        MatrixStack.fromMatrices(invertible, backend=Backends.NUMPY).inverse().toMatrices()))
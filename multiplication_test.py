@@ -0,0 +1,33 @@
+import random
+import pytest
+import Multiplication
+from Matrix import Matrix
+
+
+def classic(a, b):
+    return [[sum(a[i][j]*b[j][k] for j in range(len(b))) for k in range(len(b[0]))] for i in range(len(a))]
+
+
+def test_kernels():
+    a = [[random.randint(-5, 5) for _ in range(37)] for _ in range(29)]
+    b = [[random.randint(-5, 5) for _ in range(41)] for _ in range(37)]
+    expected = classic(a, b)
+    assert Multiplication.blocked(a, b, tile=8) == expected
+    assert Multiplication.strassen(a, b, threshold=4) == expected
+    x = [[random.random() for _ in range(20)] for _ in range(20)]
+    for row, expected_row in zip(Multiplication.strassen(x, x, threshold=3), classic(x, x)):
+        for v, e in zip(row, expected_row):
+            assert abs(v - e) < 1e-9
+
+
+def test_threshold():
+    threshold = Multiplication.get_strassen_threshold()
+    try:
+        Multiplication.set_strassen_threshold(4)
+        m = Matrix([[random.randint(-9, 9) for _ in range(9)] for _ in range(9)])
+        assert m*m == Matrix(classic([list(row) for row in m], [list(row) for row in m]))
+        with pytest.raises(ValueError):
+            Multiplication.set_strassen_threshold(1)
+        assert Multiplication.autotune(sizes=(8, 16)) in [8, 16, None]
+    finally:
+        Multiplication.set_strassen_threshold(threshold)
@@ -0,0 +1,43 @@
+"""
+measures how the process pool parallel mode of Matrix products scales with the number of worker processes
+run with: python parallel_benchmark.py [max workers]
+"""
+import os
+import random
+import sys
+import time
+import Parallel
+from Matrix import Matrix
+
+
+def timed(func):
+    start = time.perf_counter()
+    res = func()
+    return res, time.perf_counter()-start
+
+
+def benchmark(sizes=(100, 200, 300), max_workers=None, repetitions=2):
+    max_workers = max_workers or os.cpu_count() or 1
+    print(f"{'n':>4} {'workers':>8} {'product [s]':>12} {'speedup':>8}")
+    for n in sizes:
+        a = Matrix([[random.random() for _ in range(n)] for _ in range(n)])
+        b = Matrix([[random.random() for _ in range(n)] for _ in range(n)])
+        serial = None
+        # 0 workers is the serial baseline
+        for workers in range(max_workers+1):
+            if workers == 0:
+                Parallel.disable()
+            else:
+                Parallel.enable(workers=workers, threshold=0)
+                # start the pool outside of the measurement
+                Parallel.multiply([[1]], [[1]])
+            product = sum(timed(lambda: a*b)[1] for _ in range(repetitions))/repetitions
+            if serial is None:
+                serial = product
+            print(f"{n:>4} {workers if workers else 'serial':>8} {product:>12.4f} {serial/product:>8.2f}")
+    Parallel.disable()
+    Parallel.shutdown()
+
+
+if __name__ == '__main__':
+    benchmark(max_workers=int(sys.argv[1]) if len(sys.argv) > 1 else None)
@@ -0,0 +1,37 @@
+import random
+import pytest
+import Parallel
+from Matrix import Matrix
+
+
+def test_blocks():
+    assert Parallel._blocks(10, 3) == [(0, 4), (4, 7), (7, 10)]
+    assert Parallel._blocks(2, 5) == [(0, 1), (1, 2)]
+
+
+def test_settings():
+    with pytest.raises(ValueError):
+        Parallel.set_workers(0)
+    with pytest.raises(TypeError):
+        Parallel.set_threshold(1.5)
+    assert not Parallel.is_enabled()
+    assert not Parallel.should_parallelize(10**9)
+
+
+def test_parallel_matches_serial():
+    a = Matrix([[random.randint(-9, 9) for _ in range(7)] for _ in range(5)])
+    b = Matrix([[random.random() for _ in range(3)] for _ in range(7)])
+    square = Matrix([[random.random() for _ in range(6)] for _ in range(6)])
+    serial = (a*b, square.guassian_elimination())
+    workers, threshold = Parallel.get_workers(), Parallel.get_threshold()
+    try:
+        Parallel.enable(workers=4, threshold=0)
+        assert a*b == serial[0]
+        assert Matrix([[1, 2]])*Matrix([[3], [4]]) == Matrix([[11]])
+        # elimination stays serial
+        assert square.guassian_elimination() == serial[1]
+    finally:
+        Parallel.disable()
+        Parallel.set_workers(workers)
+        Parallel.set_threshold(threshold)
+        Parallel.shutdown()
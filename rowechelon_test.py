@@ -0,0 +1,42 @@
+from fractions import Fraction
+from Matrix import Matrix
+from RowEchelon import RowEchelon
+from Vector import Vector
+
+A = Matrix([[1, 2, 1, 0], [2, 4, 0, 2], [3, 6, 1, 2]], exact=True)
+
+
+def test_reduced():
+    echelon = RowEchelon(A)
+    assert echelon.exact
+    assert echelon.rank == 2
+    assert echelon.nullity == 2
+    assert echelon.pivots == [0, 2]
+    assert echelon.reduced == Matrix([[1, 2, 0, 1], [0, 0, 1, -1], [0, 0, 0, 0]])
+
+
+def test_kernel_and_image():
+    echelon = RowEchelon(A)
+    for v in echelon.kernel:
+        assert A*v == Vector([0, 0, 0])
+    assert len(echelon.kernel) == 2
+    assert [list(v) for v in echelon.image] == [[1, 2, 3], [1, 0, 1]]
+
+
+def test_solve():
+    echelon = RowEchelon(A)
+    assert echelon.solve([1, 0, 0]) is None
+    particular, kernel = echelon.solve([2, 2, 4])
+    assert A*particular == Vector([2, 2, 4])
+    assert A*(particular + 3*kernel[0] - kernel[1]) == Vector([2, 2, 4])
+    assert RowEchelon(Matrix([[2, 1], [1, 1]])).solve([3, 2]) == Vector([1, 1])
+    assert RowEchelon(Matrix([[Fraction(1, 3)]], exact=True)).solve([1]) == Vector([3])
+
+
+def test_floating_point():
+    echelon = RowEchelon(Matrix([[0.1, 0.2], [0.3, 0.6]]))
+    assert not echelon.exact
+    assert echelon.rank == 1
+    # integer matrices are reduced in floating point unless they are exact
+    echelon = RowEchelon(Matrix([[1, 2, 1, 0], [2, 4, 0, 2], [3, 6, 1, 2]]))
+    assert not echelon.exact and echelon.rank == 2
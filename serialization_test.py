@@ -0,0 +1,74 @@
+from fractions import Fraction
+import pytest
+import Backend
+import Serialization
+from Backend import Backends
+from Complex import Complex
+from Field import Field, Fields
+from Matrix import Matrix
+from SimplePolynomial import SimplePolynomial
+from Span import Span
+from Vector import Vector
+
+
+def test_matrix():
+    for m in [Matrix([[1, -2], [3, 2**40]]), Matrix([[0.5, 1.25, -3.0]]),
+              Matrix([[Fraction(1, 3), 2], [3, Fraction(-7, 2)]], exact=True)]:
+        data = m.toBytes()
+        res = Matrix.fromBytes(data)
+        assert res == m and res.exact == m.exact
+        assert Matrix.fromBytes(memoryview(bytearray(data))) == m
+    assert len(Matrix([[1.0, 2.0], [3.0, 4.0]]).toBytes()) == Serialization.HEADER.size + 4*8
+
+
+def test_vector_span_polynomial(tmp_path):
+    field = Field.create(Fields.C, 2)
+    v = Vector([Complex(1, 2), Complex(0, -1)], field)
+    res = Vector.fromBytes(v.toBytes())
+    assert res.field == field and res[0].real == 1 and res[0].imag == 2 and res[1].imag == -1
+    span = Span([Vector([1, 2, 3]), Vector([0, 1, 0])])
+    path = str(tmp_path / "span.labf")
+    Serialization.save(span, path)
+    loaded = Serialization.load(path)
+    assert [list(vec) for vec in loaded.vectors] == [[1, 2, 3], [0, 1, 0]]
+    p = SimplePolynomial([1, -3.5, 2], [2, 1, 0])
+    loaded = Serialization.loads(Serialization.dumps(p))
+    assert loaded.prefixes == p.prefixes and loaded.powers == p.powers
+    p = SimplePolynomial.fromString("x^2+1")
+    loaded = Serialization.loads(Serialization.dumps(p))
+    assert loaded == p and loaded.powers == [2, 0]
+    with pytest.raises(ValueError):
+        Serialization.dumps(SimplePolynomial([1], [0.5]))
+
+
+def test_numpy_backend():
+    default = Backend.get_default()
+    try:
+        Backend.set_default(Backends.NUMPY)
+        m = Matrix([[1.5, 2.0], [3.0, 4.0]])
+        res = Matrix.fromBytes(m.toBytes())
+        assert res.backend == Backend.resolve() and res == m
+        res[0][0] = 7
+        assert res[0][0] == 7
+        data = bytearray(Matrix([[1.5, 2.0], [3.0, 5.0]]).toBytes())
+        res = Matrix.fromBytes(data)
+        assert res.determinant == 1.5
+        data[Serialization.HEADER.size:Serialization.HEADER.size+8] = bytes(8)
+        assert res[0][0] == 1.5 and res.determinant == 1.5
+        v = Vector([1.5, 2.0, -3.0])
+        assert v.backend == Backends.NUMPY
+        data = v.toBytes()
+        assert data == Serialization.dumps(Vector([1.5, 2.0, -3.0], backend=Backends.LIST))
+        assert list(Vector.fromBytes(data)) == [1.5, 2.0, -3.0]
+    finally:
+        Backend.set_default(default)
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        Serialization.loads(b"not a matrix at all, just some bytes long enough!!")
+    data = Matrix([[1, 2]]).toBytes()
+    with pytest.raises(ValueError):
+        Serialization.loads(data[:-1])
+    with pytest.raises(ValueError):
+        Vector.fromBytes(data)
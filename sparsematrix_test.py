@@ -0,0 +1,46 @@
+from SparseMatrix import SparseMatrix
+from Matrix import Matrix
+from Vector import Vector
+from utils import almost_equal
+
+A = Matrix([[2, 0, 1], [0, 3, 0], [1, 0, 2]])
+B = Matrix([[0, 1], [4, 0], [0, 5]])
+
+
+def test_conversions():
+    s = SparseMatrix.fromMatrix(A)
+    assert s.nnz == 5
+    assert s.toMatrix() == A
+    assert s[0, 2] == 1 and s[1, 0] == 0
+    rows, cols, values = s.toCOO()
+    assert SparseMatrix.fromCOO(s.shape, rows[::-1], cols[::-1], values[::-1]) == s
+    assert SparseMatrix.fromCOO((2, 2), [0, 0], [1, 1], [1, 2])[0, 1] == 3
+    vecs = [Vector([1, 0, 0]), Vector([0, 0, 2])]
+    assert SparseMatrix.fromVectors(vecs).toMatrix() == Matrix.fromVectors(vecs)
+
+
+def test_transpose():
+    s = SparseMatrix.fromMatrix(B)
+    assert s.transpose().toMatrix() == B.transpose()
+    assert s.transpose().transpose() == s
+
+
+def test_products():
+    sa, sb = SparseMatrix.fromMatrix(A), SparseMatrix.fromMatrix(B)
+    assert sa * Vector([1, 2, 3]) == A * Vector([1, 2, 3])
+    assert sa * B == A * B
+    assert A * sb == A * B
+    assert (sa * sb).toMatrix() == A * B
+    assert (2*sa).toMatrix() == Matrix([[4, 0, 2], [0, 6, 0], [2, 0, 4]])
+    assert (SparseMatrix.id_matrix(3) * sa) == sa
+
+
+def test_solve():
+    s = SparseMatrix.fromMatrix(Matrix([[0, 2, 0], [1, 0, 1], [0, 1, 3]]))
+    assert s.solve(Vector([2, 2, 4])).almost_equal(Vector([1, 1, 1]))
+    n = 200
+    rows = list(range(n)) + list(range(1, n))
+    cols = list(range(n)) + list(range(n-1))
+    lower = SparseMatrix.fromCOO((n, n), rows, cols, [2]*n + [1]*(n-1))
+    x = lower.solve(lower * Vector([1]*n))
+    assert all(almost_equal(v, 1) for v in x)
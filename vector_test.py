@@ -1,3 +1,4 @@
+import pytest
 from Vector import *
 
 
@@ -8,3 +9,61 @@ def test_sum():
 
 def test_equality():
     assert Vector([0, 0]) == [0, 0]
+
+
+def test_in_place():
+    v = Vector([1, 2])
+    v += Vector([1, 1])
+    assert v == [2, 3]
+    v -= Vector([2, 2])
+    v *= 3
+    assert v == [0, 3]
+    v.axpy(2, Vector([1, 1]))
+    assert v == [2, 5]
+    c = v.copy()
+    c.set(0, 7)
+    assert v == [2, 5]
+
+
+def test_out():
+    v, w = Vector([1, 2]), Vector([3, 5])
+    out = Vector.fromSize(2)
+    assert v.add(w, out) is out and out == [4, 7]
+    assert v.subtract(w, out) is out and out == [-2, -3]
+    assert v.multiply(3, out) is out and out == [3, 6]
+    assert v.add(w) == [4, 7] and v == [1, 2]
+    norm = w.norm()
+    w.subtract(v, w)
+    assert w == [2, 3] and w.norm() != norm
+    v.multiply(2, v)
+    assert v == [2, 4]
+    with pytest.raises(ValueError):
+        v.add(w, Vector([0, 0, 0]))
+    with pytest.raises(TypeError):
+        v.add(w, v.freeze())
+
+
+def test_cache_invalidation():
+    v = Vector([3, 4])
+    assert v.norm() == 5
+    v[1] = 0
+    assert v.norm() == 3
+    v.set(0, 0)
+    assert not v.has_no_zero
+    v += Vector([0, 2])
+    assert v.norm() == 2
+
+
+def test_frozen():
+    v = Vector([1, 2])
+    frozen = v.freeze()
+    assert {frozen: 1}[Vector([1, 2]).freeze()] == 1
+    with pytest.raises(TypeError):
+        frozen.set(0, 3)
+    with pytest.raises(TypeError):
+        frozen *= 2
+    with pytest.raises(TypeError):
+        hash(v)
+    thawed = frozen.copy()
+    thawed[0] = 3
+    assert thawed == Vector([3, 2]) and frozen == Vector([1, 2])